@@ -15,3 +15,8 @@ class GreetingAppRequest(BaseModel):
     def from_dict(cls, data: dict):
         # The typed decorator will call this to parse incoming JSON
         return cls.model_validate(data)
+
+    @classmethod
+    def from_json(cls, data: bytes):
+        # The typed decorator will call this to parse the raw request body without an intermediate dict
+        return cls.model_validate_json(data)
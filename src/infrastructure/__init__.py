@@ -1,7 +1,9 @@
 from .config_loaders import *
 from .decorators import *
 from .dependency_injection_configurations import *
+from .health import *
 from .logger import *
+from .metrics import *
 from .middlewares import *
 from .models import *
 from .repositories import *
@@ -11,8 +13,10 @@ __all__ = []
 __all__.extend(dependency_injection_configurations.__all__)
 __all__.extend(config_loaders.__all__)
 __all__.extend(decorators.__all__)
+__all__.extend(health.__all__)
 __all__.extend(models.__all__)
 __all__.extend(logger.__all__)
+__all__.extend(metrics.__all__)
 __all__.extend(middlewares.__all__)
 __all__.extend(web_apps.__all__)
 __all__.extend(repositories.__all__)
@@ -1,3 +1,4 @@
+from .cached_settings_loader import CachedSettingsLoader
 from .config_loader import ConfigLoader
 from .config_loader_args import *
 from .config_loader_factory import ConfigLoaderFactory
@@ -10,6 +11,7 @@ from .json_config_loader import JsonConfigLoader
 from .yaml_config_loader import YamlConfigLoader
 
 __all__ = [
+    "CachedSettingsLoader",
     "ConfigLoader",
     "ConfigLoaderFactory",
     "ConfigLoaderFactoryRegistry",
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+from typing import Generic, Optional, Type
+
+from .config_loader import ConfigLoader
+from .config_loader_args import ConfigLoaderArgs
+from .config_loader_factory import ConfigLoaderFactory
+from .decorators.base_inject_settings import TSettings
+
+# Seconds between two version checks of a remote source, unless the settings choose otherwise
+DEFAULT_REFRESH_INTERVAL = 30.0
+
+
+class CachedSettingsLoader(Generic[TSettings]):
+    """
+    Loads settings once and serves the same snapshot until the configuration source reports a new version.
+
+    The source is polled for its version from a background thread, so `get` never waits on file or network I/O
+    once the first snapshot is loaded. By default only remote sources are polled, every `config_refresh_interval`
+    seconds of the loaded settings; a local file is read once.
+    """
+
+    def __init__(
+        self, *, config_loader_args: ConfigLoaderArgs, SettingsClass: Type[TSettings], refresh_interval: Optional[float] = None
+    ):
+        """
+        Initialize the cache; nothing is loaded until the first call to `get`.
+        :param config_loader_args: Arguments selecting the configuration loader and its source.
+        :param SettingsClass: Settings model to validate the loaded configuration with.
+        :param refresh_interval: Seconds between two version checks of the source, whether remote or not; 0 disables the
+            background checks. None resolves it on the first load: the settings' `config_refresh_interval` for a
+            remote source, 0 for a local one.
+        """
+        self.config_loader_args = config_loader_args
+        self.SettingsClass = SettingsClass
+        self.refresh_interval = refresh_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.last_refresh_error: Optional[Exception] = None
+        self.last_refreshed_at: Optional[float] = None
+        self._config_loader: Optional[ConfigLoader] = None
+        self._settings: Optional[TSettings] = None
+        self._version: Optional[str] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def refresh_age(self) -> Optional[float]:
+        """Seconds since the source was last checked successfully, or None before the first load"""
+        return None if self.last_refreshed_at is None else time.monotonic() - self.last_refreshed_at
+
+    def get(self) -> TSettings:
+        """
+        Return the current settings snapshot; only the first call loads it.
+
+        :return: Settings instance shared by all callers until the next reload.
+        :raises Exception: If the initial load fails; failed reloads keep serving the previous snapshot.
+        """
+        settings = self._settings
+        refresher = self._refresher
+        # The refresher does not survive a fork, so a forked worker starts its own on first use
+        if settings is not None and ((refresher is not None and refresher.is_alive()) or self.refresh_interval == 0.0):
+            return settings
+
+        with self._lock:
+            if self._settings is None:
+                self._load()
+            if self.refresh_interval is None:
+                self.refresh_interval = self._resolve_refresh_interval()
+            if self.refresh_interval > 0 and (self._refresher is None or not self._refresher.is_alive()):
+                self._stop.clear()
+                self._refresher = threading.Thread(target=self._run, name="settings-refresher", daemon=True)
+                self._refresher.start()
+            return self._settings
+
+    def refresh(self) -> bool:
+        """
+        Check the version of the source and reload the settings if it changed.
+
+        :return: Whether a new snapshot was loaded.
+        """
+        try:
+            version = self._get_config_loader().get_version()
+            if version is None and self._version is not None:
+                # Providers report a version they cannot read as None, as sources that have no versions do
+                raise RuntimeError("The configuration source did not report its version")
+            if version is None or version == self._version:
+                changed = False
+            else:
+                self._settings = self.SettingsClass(**self._get_config_loader().load())
+                self._version = version
+                self.logger.info(f"Reloaded settings, configuration version changed to {version}")
+                changed = True
+        except Exception as e:
+            self.last_refresh_error = e
+            self.logger.exception("Failed to reload changed configuration, keeping the previous settings")
+            return False
+
+        self.last_refresh_error = None
+        self.last_refreshed_at = time.monotonic()
+        return changed
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+    def _get_config_loader(self) -> ConfigLoader:
+        if self._config_loader is None:
+            self._config_loader = ConfigLoaderFactory.get_loader(config_loader_args=self.config_loader_args)
+        return self._config_loader
+
+    def _load(self) -> None:
+        config_loader = self._get_config_loader()
+        # Read the version before the content, so a change in between triggers another reload instead of being missed
+        version = config_loader.get_version()
+        self._settings = self.SettingsClass(**config_loader.load())
+        self._version = version
+        self.last_refreshed_at = time.monotonic()
+
+    def _resolve_refresh_interval(self) -> float:
+        if not self._get_config_loader().is_remote:
+            return 0.0
+        return getattr(self._settings, "config_refresh_interval", DEFAULT_REFRESH_INTERVAL)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval or 0):
+            self.refresh()
+
+
+__all__ = ["CachedSettingsLoader"]
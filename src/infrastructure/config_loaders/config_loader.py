@@ -18,3 +18,16 @@ class ConfigLoader(ABC):
         :raises Exception: Subclasses should raise exceptions for errors encountered while loading configuration.
         """
         pass
+
+    @property
+    def is_remote(self) -> bool:
+        """Whether the configuration source is remote; only remote sources are polled for new versions by default."""
+        return False
+
+    def get_version(self) -> str | None:
+        """
+        Return an identifier of the current configuration version, used to skip reloading unchanged configuration.
+
+        :return: Version identifier, or None if the source cannot tell whether it changed.
+        """
+        return None
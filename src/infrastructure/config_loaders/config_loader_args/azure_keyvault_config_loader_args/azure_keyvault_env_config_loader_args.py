@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
-
-from azure.identity import DefaultAzureCredential
+from typing import TYPE_CHECKING, Optional
 
 from ..config_loader_args import ConfigLoaderArgs
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 @dataclass
 class AzureKeyVaultEnvConfigLoaderArgs(ConfigLoaderArgs):
@@ -12,7 +13,7 @@ class AzureKeyVaultEnvConfigLoaderArgs(ConfigLoaderArgs):
 
     vault_url_env_var: str = "AZURE_KEYVAULT_URL"
     secret_name_env_var: str = "AZURE_KEYVAULT_SECRET_NAME"
-    credential: Optional[DefaultAzureCredential] = None
+    credential: Optional["DefaultAzureCredential"] = None
 
     def __post_init__(self):
         """Validate required environment variables"""
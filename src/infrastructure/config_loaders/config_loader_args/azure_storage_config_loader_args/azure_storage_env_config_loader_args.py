@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
-
-from azure.identity import DefaultAzureCredential
+from typing import TYPE_CHECKING, Optional
 
 from ..config_loader_args import ConfigLoaderArgs
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 @dataclass
 class AzureStorageEnvConfigLoaderArgs(ConfigLoaderArgs):
@@ -12,7 +13,7 @@ class AzureStorageEnvConfigLoaderArgs(ConfigLoaderArgs):
 
     account_url_env_var: str = "AZURE_STORAGE_ACCOUNT_URL"
     blob_path_env_var: str = "AZURE_STORAGE_BLOB_PATH"
-    credential: Optional[DefaultAzureCredential] = None
+    credential: Optional["DefaultAzureCredential"] = None
 
     def __post_init__(self):
         """Validate required environment variables"""
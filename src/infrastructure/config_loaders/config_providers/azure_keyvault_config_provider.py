@@ -1,15 +1,15 @@
-from typing import Any, Dict, Optional
-
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .config_provider import ConfigProvider
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 class AzureKeyVaultConfigProvider(ConfigProvider):
     """Azure Key Vault configuration provider"""
 
-    def __init__(self, vault_url: str, secret_name: str, credential: Optional[DefaultAzureCredential] = None):
+    def __init__(self, vault_url: str, secret_name: str, credential: Optional["DefaultAzureCredential"] = None):
         """
         Initialize Azure Key Vault config provider
 
@@ -18,6 +18,10 @@ class AzureKeyVaultConfigProvider(ConfigProvider):
             secret_name: The name of the secret to retrieve
             credential: Azure credential for authentication
         """
+        # The Azure SDK is only imported when this provider is actually used
+        from azure.identity import DefaultAzureCredential
+        from azure.keyvault.secrets import SecretClient
+
         self.vault_url = vault_url
         self.secret_name = secret_name
         self.credential = credential or DefaultAzureCredential()
@@ -73,3 +77,23 @@ class AzureKeyVaultConfigProvider(ConfigProvider):
             return secret.value
         except Exception as e:
             raise ValueError(f"Failed to get config from Azure Key Vault: {e}")
+
+    def get_version(self) -> str | None:
+        """
+        Get the version of the configuration secret in Azure Key Vault.
+        Only the properties of the versions are listed; the secret value is not downloaded.
+
+        Returns:
+            The current (latest enabled) secret version, or None if it cannot be determined
+        """
+        try:
+            versions = [
+                properties
+                for properties in self.client.list_properties_of_secret_versions(self.secret_name)
+                if properties.enabled and properties.created_on is not None
+            ]
+        except Exception:
+            return None
+        if not versions:
+            return None
+        return max(versions, key=lambda properties: properties.created_on).version
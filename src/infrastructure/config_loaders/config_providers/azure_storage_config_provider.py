@@ -1,11 +1,11 @@
 import logging
-from typing import Optional
-
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from typing import TYPE_CHECKING, Optional
 
 from .config_provider import ConfigProvider
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 class AzureStorageConfigProvider(ConfigProvider):
     """
@@ -14,7 +14,7 @@ class AzureStorageConfigProvider(ConfigProvider):
     """
 
     def __init__(
-        self, account_url: str, container_name: str, blob_name: str, credential: Optional[DefaultAzureCredential] = None
+        self, account_url: str, container_name: str, blob_name: str, credential: Optional["DefaultAzureCredential"] = None
     ):
         """
         Initialize Azure Storage config provider
@@ -25,6 +25,10 @@ class AzureStorageConfigProvider(ConfigProvider):
             blob_name: The blob name
             credential: Azure credential for authentication
         """
+        # The Azure SDK is only imported when this provider is actually used
+        from azure.identity import DefaultAzureCredential
+        from azure.storage.blob import BlobServiceClient
+
         self.account_url = account_url
         self.container_name = container_name
         self.blob_name = blob_name
@@ -57,3 +61,14 @@ class AzureStorageConfigProvider(ConfigProvider):
                 f"An unexpected error occurred while fetching config from Azure Storage: {self.container_name}/{self.blob_name}: {e}"
             )
             return None
+
+    def get_version(self) -> str | None:
+        """
+        Returns the ETag of the blob, which changes on every write, without downloading it.
+        """
+        try:
+            blob_client = self.client.get_container_client(self.container_name).get_blob_client(self.blob_name)
+            return blob_client.get_blob_properties().etag
+        except Exception as e:
+            self.logger.warning(f"Could not fetch the ETag of {self.container_name}/{self.blob_name}: {e}")
+            return None
@@ -2,6 +2,16 @@ from abc import ABC, abstractmethod
 
 
 class ConfigProvider(ABC):
+    # Whether the configuration is fetched over the network, so that checking it for new versions costs a remote call
+    is_remote: bool = True
+
     @abstractmethod
     def get_config(self) -> str | None:
         pass
+
+    def get_version(self) -> str | None:
+        """
+        Return an identifier that changes whenever the configuration content changes.
+        :return: Version identifier (mtime, generation, ETag, ...), or None if the source cannot tell.
+        """
+        return None
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from .config_provider import ConfigProvider
 
@@ -8,6 +9,8 @@ class FileConfigProvider(ConfigProvider):
     Provides configuration by reading the content of a YAML file.
     """
 
+    is_remote = False
+
     def __init__(self, file_path: str):
         """
         Initialize the provider with the path to the YAML configuration file.
@@ -32,3 +35,15 @@ class FileConfigProvider(ConfigProvider):
         except Exception as e:
             self.logger.exception(f"Unexpected error while reading file {self.file_path}: {e}")
             raise
+
+    def get_version(self) -> str | None:
+        """
+        Identifies the file content by its modification time and size.
+        :return: Version identifier, or None if the file cannot be inspected.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except OSError as e:
+            self.logger.warning(f"Could not inspect configuration file {self.file_path}: {e}")
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
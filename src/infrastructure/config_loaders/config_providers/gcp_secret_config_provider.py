@@ -1,10 +1,12 @@
 import logging
-
-from google.auth.exceptions import DefaultCredentialsError
-from google.cloud.secretmanager import SecretManagerServiceClient
+import os
+from typing import TYPE_CHECKING, Optional
 
 from .config_provider import ConfigProvider
 
+if TYPE_CHECKING:
+    from google.cloud.secretmanager import SecretManagerServiceClient
+
 
 class GcpSecretConfigProvider(ConfigProvider):
     """
@@ -16,13 +18,31 @@ class GcpSecretConfigProvider(ConfigProvider):
         self.secret_name = secret_name
         self.project_id = project_id
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._client: Optional["SecretManagerServiceClient"] = None
+        self._client_pid: Optional[int] = None
+
+    @property
+    def client(self) -> "SecretManagerServiceClient":
+        """
+        The Secret Manager client, created on first use and reused by every call.
+        A forked worker creates its own, since gRPC channels do not survive a fork.
+        """
+        if self._client is None or self._client_pid != os.getpid():
+            # The Google Cloud SDK is only imported when this provider is actually used
+            from google.cloud.secretmanager import SecretManagerServiceClient
+
+            self._client = SecretManagerServiceClient()
+            self._client_pid = os.getpid()
+        return self._client
 
     def get_config(self) -> str | None:
         """
         Fetches the raw secret data from Google Cloud Secret Manager.
         """
+        from google.auth.exceptions import DefaultCredentialsError
+
         try:
-            client = SecretManagerServiceClient()
+            client = self.client
             # secret_path = f"projects/{self.project_id}/secrets/{self.secret_name}/versions/latest"
             secret_path = client.secret_version_path(self.project_id, self.secret_name, "latest")
             response = client.access_secret_version(name=secret_path)  # type: ignore
@@ -36,3 +56,15 @@ class GcpSecretConfigProvider(ConfigProvider):
                 f"An unexpected error occurred while fetching secret: {self.secret_name} (Project: {self.project_id})"
             )
             return None
+
+    def get_version(self) -> str | None:
+        """
+        Returns the resource name of the version that "latest" currently points to, without accessing the payload.
+        """
+        try:
+            client = self.client
+            secret_path = client.secret_version_path(self.project_id, self.secret_name, "latest")
+            return client.get_secret_version(name=secret_path).name  # type: ignore
+        except Exception as e:
+            self.logger.warning(f"Could not fetch the latest version of secret {self.secret_name}: {e}")
+            return None
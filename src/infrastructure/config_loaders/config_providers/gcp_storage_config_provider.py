@@ -1,10 +1,12 @@
 import logging
-
-from google.auth.exceptions import DefaultCredentialsError
-from google.cloud.storage import Client as StorageClient
+import os
+from typing import TYPE_CHECKING, Optional
 
 from .config_provider import ConfigProvider
 
+if TYPE_CHECKING:
+    from google.cloud.storage import Blob
+
 
 class GcpStorageConfigProvider(ConfigProvider):
     """
@@ -17,15 +19,32 @@ class GcpStorageConfigProvider(ConfigProvider):
         self.blob_name = blob_name
         self.project_id = project_id
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._blob: Optional["Blob"] = None
+        self._blob_pid: Optional[int] = None
+
+    @property
+    def blob(self) -> "Blob":
+        """
+        The configuration blob, bound to a client created on first use and reused by every call.
+        A forked worker creates its own, so the parent's HTTP connections are not shared.
+        """
+        if self._blob is None or self._blob_pid != os.getpid():
+            # The Google Cloud SDK is only imported when this provider is actually used
+            from google.cloud.storage import Client as StorageClient
+
+            self._blob = StorageClient(project=self.project_id).bucket(self.bucket_name).blob(self.blob_name)
+            self._blob_pid = os.getpid()
+        return self._blob
 
     def get_config(self) -> str | None:
         """
         Fetches the raw config data from a file in a GCS bucket.
+        Once get_version() has run, this downloads the generation it reported, so version and content match.
         """
+        from google.auth.exceptions import DefaultCredentialsError
+
         try:
-            client = StorageClient(project=self.project_id)
-            bucket = client.bucket(self.bucket_name)
-            blob = bucket.blob(self.blob_name)
+            blob = self.blob
             if not blob.exists():
                 self.logger.error(
                     f"Blob '{self.blob_name}' does not exist in bucket '{self.bucket_name}' within project '{self.project_id}'."
@@ -45,3 +64,19 @@ class GcpStorageConfigProvider(ConfigProvider):
                 f"An unexpected error occurred while fetching config from GCS: gs://{self.bucket_name}/{self.blob_name} (Project: {self.project_id}): {e}"
             )
             return None
+
+    def get_version(self) -> str | None:
+        """
+        Returns the generation of the blob, which changes on every upload, by reloading its metadata only.
+        """
+        from google.api_core.exceptions import NotFound
+
+        try:
+            blob = self.blob
+            blob.reload()
+            return str(blob.generation)
+        except NotFound:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not fetch the generation of gs://{self.bucket_name}/{self.blob_name}: {e}")
+            return None
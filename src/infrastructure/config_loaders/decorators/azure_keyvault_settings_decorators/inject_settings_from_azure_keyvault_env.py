@@ -1,16 +1,17 @@
 import os
 from functools import wraps
-from typing import Any, Callable, Type
-
-from azure.identity import DefaultAzureCredential
+from typing import TYPE_CHECKING, Any, Callable, Type
 
 from ...config_providers import AzureKeyVaultConfigProvider
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 def inject_settings_from_azure_keyvault_env(
     vault_url_env_var: str = "AZURE_KEYVAULT_URL",
     secret_name_env_var: str = "AZURE_KEYVAULT_SECRET_NAME",
-    credential: DefaultAzureCredential = None,
+    credential: "DefaultAzureCredential" = None,
 ) -> Callable[[Type[Any]], Type[Any]]:
     """
     Decorator to inject settings from Azure Key Vault using environment variables
@@ -1,16 +1,17 @@
 import os
 from functools import wraps
-from typing import Any, Callable, Type
-
-from azure.identity import DefaultAzureCredential
+from typing import TYPE_CHECKING, Any, Callable, Type
 
 from ...config_providers import AzureStorageConfigProvider
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+
 
 def inject_settings_from_azure_storage_env(
     account_url_env_var: str = "AZURE_STORAGE_ACCOUNT_URL",
     blob_path_env_var: str = "AZURE_STORAGE_BLOB_PATH",
-    credential: DefaultAzureCredential = None,
+    credential: "DefaultAzureCredential" = None,
 ) -> Callable[[Type[Any]], Type[Any]]:
     """
     Decorator to inject settings from Azure Storage using environment variables
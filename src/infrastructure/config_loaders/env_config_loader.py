@@ -41,6 +41,18 @@ class EnvConfigLoader(ConfigLoader):
             self.logger.exception(f"Unexpected error while loading environment variables: {e}")
             raise
 
+    @property
+    def is_remote(self) -> bool:
+        return self.config_provider.is_remote
+
+    def get_version(self) -> str | None:
+        """
+        Return the version reported by the configuration provider.
+
+        :return: Version identifier, or None if the provider cannot tell.
+        """
+        return self.config_provider.get_version()
+
     def _fetch_env_payload(self) -> str:
         """
         Fetch the environment configuration content from the provider.
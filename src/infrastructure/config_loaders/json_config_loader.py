@@ -45,3 +45,15 @@ class JsonConfigLoader(ConfigLoader):
         except Exception as e:
             self.logger.exception(f"Unexpected error while loading JSON configuration: {e}")
             raise
+
+    @property
+    def is_remote(self) -> bool:
+        return self.config_provider.is_remote
+
+    def get_version(self) -> str | None:
+        """
+        Return the version reported by the configuration provider.
+
+        :return: Version identifier, or None if the provider cannot tell.
+        """
+        return self.config_provider.get_version()
@@ -1,8 +1,6 @@
 import logging
 from typing import Any
 
-import yaml
-
 from .config_loader import ConfigLoader
 from .config_providers import ConfigProvider
 
@@ -29,6 +27,9 @@ class YamlConfigLoader(ConfigLoader):
         :raises ValueError: If the configuration content is empty.
         :raises Exception: For any unexpected errors.
         """
+        # PyYAML is only imported when YAML configuration is actually used
+        import yaml
+
         try:
             config_content = self.config_provider.get_config()
             if config_content is None or not config_content.strip():
@@ -46,3 +47,15 @@ class YamlConfigLoader(ConfigLoader):
         except Exception as e:
             self.logger.exception(f"Unexpected error while loading YAML configuration: {e}")
             raise
+
+    @property
+    def is_remote(self) -> bool:
+        return self.config_provider.is_remote
+
+    def get_version(self) -> str | None:
+        """
+        Return the version reported by the configuration provider.
+
+        :return: Version identifier, or None if the provider cannot tell.
+        """
+        return self.config_provider.get_version()
@@ -1,4 +1,8 @@
+from .pipeline_configuration import *
 from .pipeline_decorator import *
+from .pipeline_profiling import *
 
 __all__ = []
 __all__.extend(pipeline_decorator.__all__)
+__all__.extend(pipeline_profiling.__all__)
+__all__.extend(pipeline_configuration.__all__)
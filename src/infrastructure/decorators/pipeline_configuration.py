@@ -0,0 +1,181 @@
+"""Pipelines whose middleware list can be overridden from configuration."""
+
+import functools
+import threading
+from typing import Any, Callable, Mapping, Optional, Sequence, Union, cast
+
+from .pipeline_decorator import LazyPipelineMethod, PipelineFunction, PipelineItem, TargetFunc, is_async_callable, pipeline
+
+# Current pipeline configuration, keyed by pipeline name (see configure_pipelines)
+_pipeline_config: Mapping[str, Any] = {}
+_configured_targets: list["ConfiguredTarget"] = []
+# Methods of decorated classes that have not been looked up yet, so have no ConfiguredTarget
+_lazy_methods: list[LazyPipelineMethod] = []
+_config_lock = threading.Lock()
+
+
+def get_item_name(item: Any) -> str:
+    return getattr(item, "__name__", repr(item))
+
+
+class ConfigurablePipeline:
+    """
+    Pipeline whose middlewares can be selected per pipeline and per route from Settings.
+
+    Decorated targets are compiled into a plain pipeline once, with the current configuration:
+    on first call, or by compile_pipelines() during warm-up. Methods of decorated classes are
+    only wrapped on first use. Disabled middlewares are left out of the compiled chain, so they
+    cost nothing per request.
+    """
+
+    __is_pipeline__ = True
+    __is_configurable_pipeline__ = True
+
+    def __init__(self, name: Optional[str], items: Sequence[PipelineItem], registry: Mapping[str, PipelineItem]):
+        self.name = name
+        self.items = [item for item in items if item not in (None, "")]
+        self.registry = registry
+
+    def _lookup(self, middleware_name: str) -> PipelineItem:
+        item = self.registry.get(middleware_name)
+        if item is None:
+            raise ValueError(
+                f"Unknown middleware '{middleware_name}' in configuration of pipeline '{self.name}'. "
+                f"Available: {', '.join(sorted(self.registry))}"
+            )
+        return item
+
+    def resolve_items(self, route: str, config: Mapping[str, Any]) -> list[PipelineItem]:
+        """The pipeline items for a route, with configured selections applied (nested pipelines first)."""
+        items: list[PipelineItem] = []
+        for item in self.items:
+            if isinstance(item, ConfigurablePipeline):
+                items.extend(item.resolve_items(route, config))
+            else:
+                items.append(item)
+
+        pipeline_config = config.get(self.name) if self.name else None
+        if pipeline_config is None:
+            return items
+
+        middleware_names = pipeline_config.middlewares
+        disabled = set(pipeline_config.disabled_middlewares)
+
+        route_config = pipeline_config.routes.get(route)
+        if route_config is not None:
+            if route_config.middlewares is not None:
+                middleware_names = route_config.middlewares
+            disabled.update(route_config.disabled_middlewares)
+
+        if middleware_names is not None:
+            items = [self._lookup(middleware_name) for middleware_name in middleware_names]
+
+        for middleware_name in disabled:
+            self._lookup(middleware_name)  # Fail fast on typos
+
+        return [item for item in items if get_item_name(item) not in disabled]
+
+    def __call__(self, target: Union[TargetFunc, type]) -> Union[PipelineFunction, type]:
+        if isinstance(target, type):
+            method_names = [name for name, value in target.__dict__.items() if callable(value) and not name.startswith("__")]
+            lazy_methods = [LazyPipelineMethod(target, name, getattr(target, name), self) for name in method_names]
+            for lazy_method in lazy_methods:
+                setattr(target, lazy_method.name, lazy_method)
+            with _config_lock:
+                _lazy_methods.extend(lazy_methods)
+            return target
+
+        configured_target = ConfiguredTarget(self, target)
+        with _config_lock:
+            _configured_targets.append(configured_target)
+        return configured_target.create_wrapper()
+
+
+class ConfiguredTarget:
+    """A target decorated with a configurable pipeline, and its compiled chain."""
+
+    __slots__ = ("configurable", "target", "route", "compiled")
+
+    def __init__(self, configurable: ConfigurablePipeline, target: TargetFunc):
+        self.configurable = configurable
+        self.target = target
+        self.route = target.__qualname__
+        self.compiled: Optional[Callable[..., Any]] = None
+
+    def resolve_items(self, config: Mapping[str, Any]) -> list[PipelineItem]:
+        return self.configurable.resolve_items(self.route, config)
+
+    def compile(self, items: Optional[list[PipelineItem]] = None) -> Callable[..., Any]:
+        if items is None:
+            items = self.resolve_items(_pipeline_config)
+        self.compiled = pipeline(*items)(self.target)
+        return self.compiled
+
+    def create_wrapper(self) -> PipelineFunction:
+        if is_async_callable(self.target):
+
+            @functools.wraps(self.target)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                compiled = self.compiled or self.compile()
+                return await compiled(*args, **kwargs)
+
+            wrapper_with_mark = cast(PipelineFunction, async_wrapper)
+        else:
+
+            @functools.wraps(self.target)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                compiled = self.compiled or self.compile()
+                return compiled(*args, **kwargs)
+
+            wrapper_with_mark = cast(PipelineFunction, wrapper)
+
+        wrapper_with_mark.__is_pipeline__ = True
+        return wrapper_with_mark
+
+
+def configurable_pipeline(name: str, *items: PipelineItem, registry: Mapping[str, PipelineItem]) -> ConfigurablePipeline:
+    """Like pipeline(), but the middleware list can be changed under `name` in configuration."""
+    return ConfigurablePipeline(name, items, registry)
+
+
+def configure_pipelines(config: Mapping[str, Any]) -> None:
+    """
+    Apply pipeline configuration (Settings.pipelines), validating it against every configurable target.
+
+    Nothing is compiled here: targets compile with this configuration on their first call, or in
+    compile_pipelines() during warm-up. Targets compiled under a previous configuration are recompiled.
+    """
+    global _pipeline_config
+
+    with _config_lock:
+        # Resolve everything first so an invalid configuration leaves the current one in place
+        for configured_target in _configured_targets:
+            configured_target.resolve_items(config)
+        for lazy_method in _lazy_methods:
+            cast(ConfigurablePipeline, lazy_method.function_pipeline).resolve_items(lazy_method.method.__qualname__, config)
+
+        _pipeline_config = config
+        for configured_target in _configured_targets:
+            configured_target.compiled = None
+
+
+def compile_pipelines() -> int:
+    """Compile the configurable targets that have not been compiled yet, returning how many were compiled."""
+    with _config_lock:
+        lazy_methods = list(_lazy_methods)
+        _lazy_methods.clear()
+
+    # Wrapping a lazy method registers its target, unless a lookup already replaced it
+    for lazy_method in lazy_methods:
+        if lazy_method.owner.__dict__.get(lazy_method.name) is lazy_method:
+            lazy_method.compile()
+
+    with _config_lock:
+        pending = [configured_target for configured_target in _configured_targets if configured_target.compiled is None]
+
+    for configured_target in pending:
+        configured_target.compile()
+    return len(pending)
+
+
+__all__ = ["ConfigurablePipeline", "configurable_pipeline", "configure_pipelines", "compile_pipelines"]
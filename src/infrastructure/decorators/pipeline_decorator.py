@@ -1,15 +1,167 @@
 import functools
 import inspect
-from dataclasses import dataclass
-from typing import Any, Callable, Concatenate, ParamSpec, Protocol, TypeGuard, TypeVar, Union, cast, runtime_checkable
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Concatenate,
+    Generic,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    ParamSpec,
+    Protocol,
+    TypeGuard,
+    TypeVar,
+    Union,
+    cast,
+    runtime_checkable,
+)
+
+from injector import Injector, SingletonScope
+
+from ..metrics.synthetic_traffic import is_synthetic_traffic
+from .pipeline_profiling import RouteProfile, pipeline_profiler
+
+
+class LayeredKwargs(MutableMapping[str, Any]):
+    """
+    Two-layer kwargs store, like a ChainMap of (overlay, base).
+
+    Reads fall through the per-request overlay to the caller's kwargs; writes only
+    touch the overlay, so middlewares can add values without copying the whole dict.
+    """
+
+    __slots__ = ("overlay", "base")
+
+    def __init__(self, base: Optional[Mapping[str, Any]] = None):
+        self.overlay: dict[str, Any] = {}
+        self.base: Mapping[str, Any] = base if base is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.overlay[key]
+        except KeyError:
+            return self.base[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.overlay or key in self.base
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.overlay:
+            return self.overlay[key]
+        return self.base.get(key, default)
 
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.overlay[key] = value
 
-@dataclass
+    def __delitem__(self, key: str) -> None:
+        # Same rule as ChainMap: only the writable layer can be deleted from
+        try:
+            del self.overlay[key]
+        except KeyError:
+            raise KeyError(f"Key not found in the overlay: {key!r}")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.overlay
+        for key in self.base:
+            if key not in self.overlay:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.overlay) + sum(1 for key in self.base if key not in self.overlay)
+
+    def __or__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+        return {**self, **other}
+
+    def __ror__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+        return {**other, **self}
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(slots=True)
 class Context:
     func: Callable[..., Any]
     args: tuple
-    kwargs: dict
-    result = None
+    kwargs: MutableMapping[str, Any]
+    result: Any = field(default=None, init=False)
+
+    # Dispatch state, set by CompiledPipeline when the context is created for a call
+    _compiled: "CompiledPipeline" = field(init=False, repr=False, compare=False)
+    _index: int = field(default=0, init=False, repr=False, compare=False)
+    _next: "Next" = field(init=False, repr=False, compare=False)
+    # Time spent in downstream stages of the stage being profiled, see proceed_profiled()
+    _downstream_time: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def proceed(self) -> Any:
+        """Run the stage at the current index; handed to every middleware as its `next`."""
+        index = self._index
+        compiled = self._compiled
+
+        if index == compiled.stage_count:
+            # A middleware may swap the target, in which case its plan has to be resolved here
+            plan = compiled.target_plan if self.func is compiled.target_func else CallPlan.from_callable(self.func)
+            # Clean kwargs for the target function to avoid passing middleware-specific args
+            return self.func(*self.args, **plan.clean_kwargs(self.args, self.kwargs))
+
+        middleware, middleware_plan = compiled.stages[index]
+        self._index = index + 1
+        try:
+            return middleware(self, self._next, **middleware_plan.clean_kwargs((), self.kwargs))
+        finally:
+            # Restore the index so a middleware can call next() more than once (e.g. retries)
+            self._index = index
+
+    def proceed_profiled(self) -> Any:
+        """proceed() that also records the stage's inclusive and exclusive time."""
+        index = self._index
+        parent_downstream_time = self._downstream_time
+        self._downstream_time = 0.0
+        start = time.perf_counter()
+        try:
+            return self.proceed()
+        finally:
+            elapsed = time.perf_counter() - start
+            # Nested proceed_profiled() calls add their time to _downstream_time, the remainder is this stage's own
+            self._compiled.profile.record(index, elapsed, elapsed - self._downstream_time)
+            self._downstream_time = parent_downstream_time + elapsed
+
+    async def proceed_async(self) -> Any:
+        """Async counterpart of proceed(); next() returns a coroutine that async middlewares await."""
+        index = self._index
+        compiled = self._compiled
+
+        if index == compiled.stage_count:
+            plan = compiled.target_plan if self.func is compiled.target_func else CallPlan.from_callable(self.func)
+            result = self.func(*self.args, **plan.clean_kwargs(self.args, self.kwargs))
+            return await result if inspect.isawaitable(result) else result
+
+        middleware, middleware_plan = compiled.stages[index]
+        self._index = index + 1
+        try:
+            result = middleware(self, self._next, **middleware_plan.clean_kwargs((), self.kwargs))
+            # Sync middlewares hand back the coroutine returned by next(), so it's awaited here
+            return await result if inspect.isawaitable(result) else result
+        finally:
+            self._index = index
+
+    async def proceed_async_profiled(self) -> Any:
+        """proceed_async() that also records the stage's inclusive and exclusive (wall clock) time."""
+        index = self._index
+        parent_downstream_time = self._downstream_time
+        self._downstream_time = 0.0
+        start = time.perf_counter()
+        try:
+            return await self.proceed_async()
+        finally:
+            elapsed = time.perf_counter() - start
+            self._compiled.profile.record(index, elapsed, elapsed - self._downstream_time)
+            self._downstream_time = parent_downstream_time + elapsed
 
 
 T = TypeVar("T")
@@ -47,26 +199,116 @@ PipelineItem = Union[
 ]
 
 
-def clean_kwargs_for_target(func: TargetFunc, args: tuple, kwargs: dict[str, Any]) -> dict[str, Any]:
+@dataclass(frozen=True)
+class CallPlan:
+    """Signature facts about a callable, resolved once so dispatch only filters dicts."""
+
+    param_names: tuple[str, ...]
+    positional_names: tuple[str, ...]
+    has_var_positional: bool
+    has_var_keyword: bool
+
+    @classmethod
+    def from_callable(cls, func: Callable[..., Any]) -> "CallPlan":
+        parameters = inspect.signature(func).parameters.values()
+        positional_names = []
+        for p in parameters:
+            if p.kind not in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                break
+            positional_names.append(p.name)
+
+        return cls(
+            param_names=tuple(p.name for p in parameters if p.kind not in _VAR_KINDS),
+            positional_names=tuple(positional_names),
+            has_var_positional=any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters),
+            has_var_keyword=any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters),
+        )
+
+    @classmethod
+    def for_middleware(cls, middleware: Callable[..., Any]) -> "CallPlan":
+        """Plan for a middleware, whose (context, next) are always passed positionally."""
+        plan = cls.from_callable(middleware)
+        skipped = plan.positional_names[:2]
+        return cls(
+            param_names=tuple(name for name in plan.param_names if name not in skipped),
+            positional_names=plan.positional_names[2:],
+            has_var_positional=plan.has_var_positional,
+            has_var_keyword=plan.has_var_keyword,
+        )
+
+    def clean_kwargs(self, args: tuple, kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        """Same result as `clean_kwargs_for_target`, without re-inspecting the callable."""
+        if len(args) > len(self.positional_names) and not self.has_var_positional:
+            raise TypeError("too many positional arguments")
+
+        # Parameter names that are already filled by args
+        args_params = self.positional_names[: len(args)]
+
+        if not self.has_var_keyword:
+            if not self.param_names:
+                return {}
+            # Keep kwargs that are parameters AND not already in args
+            return {k: kwargs[k] for k in self.param_names if k in kwargs and k not in args_params}
+
+        # If function has **kwargs, only filter out args params
+        if not args_params:
+            return dict(kwargs)
+        return {k: v for k, v in kwargs.items() if k not in args_params}
+
+
+_VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
+class CompiledPipeline:
+    """Dispatch table for one target: the stages are fixed at decoration time, so a call allocates no closures."""
+
+    __slots__ = ("stages", "stage_count", "target_func", "target_plan", "_profile")
+
+    def __init__(self, stages: tuple[tuple[MiddlewareFunc, CallPlan], ...], target_func: TargetFunc):
+        self.stages = stages
+        self.stage_count = len(stages)
+        self.target_func = target_func
+        self.target_plan = CallPlan.from_callable(target_func)
+        self._profile: Optional[RouteProfile] = None
+
+    @property
+    def profile(self) -> RouteProfile:
+        """Timings of this target's stages, registered with the pipeline profiler on first use."""
+        if self._profile is None:
+            route = f"{self.target_func.__module__}.{self.target_func.__qualname__}"
+            stage_names = [getattr(middleware, "__name__", repr(middleware)) for middleware, _ in self.stages]
+            self._profile = pipeline_profiler.route(route, [*stage_names, self.target_func.__name__])
+        return self._profile
+
+    def _create_context(self, args: tuple, kwargs: dict) -> Context:
+        ctx = Context(self.target_func, args, LayeredKwargs(kwargs))
+        ctx._compiled = self
+        return ctx
+
+    def run(self, args: tuple, kwargs: dict) -> Any:
+        ctx = self._create_context(args, kwargs)
+        ctx._next = ctx.proceed_profiled if pipeline_profiler.enabled and not is_synthetic_traffic() else ctx.proceed
+        return ctx._next()
+
+    async def run_async(self, args: tuple, kwargs: dict) -> Any:
+        ctx = self._create_context(args, kwargs)
+        ctx._next = ctx.proceed_async_profiled if pipeline_profiler.enabled and not is_synthetic_traffic() else ctx.proceed_async
+        return await ctx._next()
+
+
+def clean_kwargs_for_target(func: TargetFunc, args: tuple, kwargs: Mapping[str, Any]) -> dict[str, Any]:
     """
     Clean kwargs by removing values that are already provided in args
     to avoid "multiple values for argument" error
     """
-    sig = inspect.signature(func)
-    param_names = set(sig.parameters.keys())
-
-    has_var_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
-
-    # Get parameter names that are already filled by args
-    bound_args = sig.bind_partial(*args)
-    args_params = set(bound_args.arguments.keys())
+    return CallPlan.from_callable(func).clean_kwargs(args, kwargs)
 
-    if not has_var_keyword:
-        # Filter kwargs: must be in param_names AND not already in args
-        return {k: v for k, v in kwargs.items() if k in param_names and k not in args_params}
 
-    # If function has **kwargs, only filter out args params
-    return {k: v for k, v in kwargs.items() if k not in args_params}
+def is_async_callable(item: Any) -> bool:
+    """Check if calling item returns a coroutine (async def functions and classes with async __call__)."""
+    if inspect.isclass(item):
+        return inspect.iscoroutinefunction(getattr(item, "__call__", None))
+    return inspect.iscoroutinefunction(item) or inspect.iscoroutinefunction(getattr(item, "__call__", None))
 
 
 def is_middleware_func(item: Any) -> bool:
@@ -92,7 +334,7 @@ def create_middleware_from_pipeline(
             # CRITICAL FIX: Pass context from one pipeline to next pipeline
             # Update context args but preserve all existing context (including injector)
             context.args = args
-            context.kwargs = {**context.kwargs, **inner_kwargs}
+            context.kwargs.update(inner_kwargs)
             return next()
 
         return wrapped_next(*context.args, **context.kwargs)
@@ -106,22 +348,116 @@ def create_middleware_from_class(cls: Any) -> MiddlewareFunc:
         if not injector:
             raise RuntimeError(f"No injector found in context.kwargs while trying to resolve {cls}.")
         instance = injector.get(cls)
-        return instance(context, next, kwargs)
+        # Class middlewares get their dependencies through __init__
+        return instance(context, next)
 
+    if is_async_callable(cls):
+        inspect.markcoroutinefunction(resolver)
     return resolver
 
 
+def is_singleton_binding(injector_obj: Injector, interface: Any) -> bool:
+    """Check if the injector resolves interface from a singleton-scoped binding."""
+    try:
+        binding, _ = injector_obj.binder.get_binding(interface)
+    except Exception:
+        return False
+    return isinstance(binding.scope, type) and issubclass(binding.scope, SingletonScope)
+
+
+class InjectionPlan:
+    """
+    Which middleware parameters need injection, resolved once per middleware.
+
+    Singleton-scoped dependencies are cached per injector at first use; every other
+    scope is still resolved through the injector on each call.
+    """
+
+    __slots__ = ("params", "_last_injector", "_last_singletons", "_singletons_by_injector")
+
+    def __init__(self, middleware_func: MiddlewareFunc):
+        parameters = inspect.signature(middleware_func).parameters
+        self.params = tuple(
+            (name, param.annotation)
+            for name, param in parameters.items()
+            if name not in ("context", "next") and param.annotation is not inspect.Parameter.empty
+        )
+        # Almost every call uses the same container, so keep a fast path for the last one seen
+        self._last_injector: Optional[Injector] = None
+        self._last_singletons: dict[str, Any] = {}
+        self._singletons_by_injector: weakref.WeakKeyDictionary[Injector, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+    def _singletons_for(self, injector_obj: Injector) -> dict[str, Any]:
+        if injector_obj is self._last_injector:
+            return self._last_singletons
+
+        singletons = self._singletons_by_injector.get(injector_obj)
+        if singletons is None:
+            singletons = self._singletons_by_injector.setdefault(injector_obj, {})
+        self._last_injector, self._last_singletons = injector_obj, singletons
+        return singletons
+
+    def resolve(self, injector_obj: Injector, kwargs: Mapping[str, Any]) -> dict[str, Any]:
+        singletons = self._singletons_for(injector_obj)
+        middleware_kwargs = {}
+
+        for param_name, annotated_type in self.params:
+            # Try to get from existing kwargs first
+            if param_name in kwargs:
+                middleware_kwargs[param_name] = kwargs[param_name]
+            elif param_name in singletons:
+                middleware_kwargs[param_name] = singletons[param_name]
+            else:
+                # If not in kwargs, try to inject
+                dependency = injector_obj.get(annotated_type)
+                if is_singleton_binding(injector_obj, annotated_type):
+                    singletons[param_name] = dependency
+                middleware_kwargs[param_name] = dependency
+
+        return middleware_kwargs
+
+
+class PlanCache(Generic[T]):
+    """
+    Per-function plans built from a signature, for middlewares that inspect the target of each call.
+
+    The plan of a function is built on its first call and reused while the function is alive; the last function
+    seen has a fast path, since a pipeline mostly runs the same target over and over.
+    """
+
+    __slots__ = ("factory", "_last", "_plans")
+
+    def __init__(self, factory: Callable[[Callable[..., Any]], T]):
+        self.factory = factory
+        # One tuple, so a thread never reads the function of one lookup with the plan of another
+        self._last: Optional[tuple[Callable[..., Any], T]] = None
+        self._plans: weakref.WeakKeyDictionary[Callable[..., Any], T] = weakref.WeakKeyDictionary()
+
+    def get(self, func: Callable[..., Any]) -> T:
+        last = self._last
+        if last is not None and last[0] is func:
+            return last[1]
+
+        try:
+            plan = self._plans.get(func)
+        except TypeError:
+            # Not weak-referenceable, so never cached
+            return self.factory(func)
+        if plan is None:
+            plan = self._plans.setdefault(func, self.factory(func))
+        self._last = (func, plan)
+        return plan
+
+
 def create_middleware_with_injection(middleware_func: MiddlewareFunc) -> MiddlewareFunc:
+    injection_plan = InjectionPlan(middleware_func)
+
     @functools.wraps(middleware_func)  # Preserve original function metadata
     def resolver(context: Context, next: Next, **kwargs: Any) -> Any:
-        # Get signature of the middleware function
-        middleware_sig = inspect.signature(middleware_func)
-
-        # The right-side dict takes precedence, so existing context kwargs take precedence
-        extended_kwargs = kwargs | context.kwargs
-
-        # Get injector from kwargs
-        injector_obj = extended_kwargs.get("injector", None)
+        # Get injector from kwargs, existing context kwargs take precedence
+        injector_obj = context.kwargs.get("injector")
+        if injector_obj is None:
+            injector_obj = kwargs.get("injector")
         if injector_obj is None:
             raise RuntimeError(
                 f"Cannot inject dependencies for middleware '{middleware_func.__name__}' "
@@ -129,26 +465,10 @@ def create_middleware_with_injection(middleware_func: MiddlewareFunc) -> Middlew
                 "Did you forget to add container_builder_middleware?"
             )
 
-        # Prepare kwargs for middleware
-        middleware_kwargs = {}
-
-        # For each parameter in middleware function
-        for param_name, param in middleware_sig.parameters.items():
-            if param_name in ["context", "next"]:
-                continue
-
-            annotated_type = param.annotation
-            if annotated_type != inspect.Parameter.empty:
-                # Try to get from existing kwargs first
-                if param_name in kwargs:
-                    middleware_kwargs[param_name] = kwargs[param_name]
-                else:
-                    # If not in kwargs, try to inject
-                    dependency = injector_obj.get(annotated_type)
-                    middleware_kwargs[param_name] = dependency
-
-        return middleware_func(context, next, **middleware_kwargs)
+        return middleware_func(context, next, **injection_plan.resolve(injector_obj, kwargs))
 
+    if is_async_callable(middleware_func):
+        inspect.markcoroutinefunction(resolver)
     return resolver
 
 
@@ -160,6 +480,7 @@ def create_middleware(item: Any) -> MiddlewareFunc:
         if item.__name__ in [
             "inject_dependency_middleware",
             "container_builder_middleware",
+            "request_scope_middleware",
         ]:
             return item
 
@@ -174,24 +495,29 @@ def create_function_pipeline(
     middlewares: list[MiddlewareFunc],
 ) -> Callable[[TargetFunc], PipelineFunction]:
     """Create a pipeline for functions."""
+    # Middleware signatures don't change between requests, so resolve them once per pipeline
+    stages = tuple((middleware, CallPlan.for_middleware(middleware)) for middleware in middlewares)
+    has_async_middleware = any(is_async_callable(middleware) for middleware in middlewares)
 
     def function_decorator(target_func: TargetFunc) -> PipelineFunction:
-        @functools.wraps(target_func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            ctx = Context(target_func, args, kwargs)
+        compiled = CompiledPipeline(stages, target_func)
 
-            def dispatch(index: int) -> Any:
-                if index == len(middlewares):
-                    # Clean kwargs for the target function to avoid passing middleware-specific args
-                    clean_kwargs = clean_kwargs_for_target(ctx.func, ctx.args, ctx.kwargs)
-                    # clean_kwargs = ctx.kwargs
-                    return ctx.func(*ctx.args, **clean_kwargs)
+        if has_async_middleware or is_async_callable(target_func):
+            run_async = compiled.run_async
 
-                middleware_kwargs = clean_kwargs_for_target(middlewares[index], (), ctx.kwargs)
+            @functools.wraps(target_func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await run_async(args, kwargs)
 
-                return middlewares[index](ctx, lambda: dispatch(index + 1), **middleware_kwargs)
+            async_wrapper_with_mark = cast(PipelineFunction, async_wrapper)
+            async_wrapper_with_mark.__is_pipeline__ = True
+            return async_wrapper_with_mark
 
-            return dispatch(0)
+        run = compiled.run
+
+        @functools.wraps(target_func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return run(args, kwargs)
 
         wrapper_with_mark = cast(PipelineFunction, wrapper)
         wrapper_with_mark.__is_pipeline__ = True
@@ -200,28 +526,74 @@ def create_function_pipeline(
     return function_decorator
 
 
+class LazyPipelineMethod:
+    """Class attribute that compiles its method's pipeline on first access and then replaces itself with it."""
+
+    __slots__ = ("owner", "name", "method", "function_pipeline", "__wrapped__")
+
+    def __init__(self, owner: type, name: str, method: TargetFunc, function_pipeline: Callable[[TargetFunc], PipelineFunction]):
+        self.owner = owner
+        self.name = name
+        self.method = method
+        self.function_pipeline = function_pipeline
+        self.__wrapped__ = method
+
+    def compile(self) -> PipelineFunction:
+        decorated_method = self.function_pipeline(self.method)
+        # Cache on the decorated class itself, so subclasses and later lookups hit the compiled method directly
+        setattr(self.owner, self.name, decorated_method)
+        return decorated_method
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        decorated_method = self.compile()
+        return decorated_method.__get__(instance, owner) if instance is not None else decorated_method
+
+
 def create_class_pipeline(middlewares: list[MiddlewareFunc]) -> Callable[[type], type]:
-    """Create a pipeline for classes."""
+    """Create a pipeline for classes, compiling each method on first use."""
+    # All methods of the class share one set of resolved stages
+    function_pipeline = create_function_pipeline(middlewares)
 
     def class_decorator(cls: type) -> type:
         method_names = [name for name, value in cls.__dict__.items() if callable(value) and not name.startswith("__")]
 
         for name in method_names:
             original_method = getattr(cls, name)
-            function_pipeline = create_function_pipeline(middlewares)
-            decorated_method = function_pipeline(original_method)
-            setattr(cls, name, decorated_method)
+            setattr(cls, name, LazyPipelineMethod(cls, name, original_method, function_pipeline))
 
         return cls
 
     return class_decorator
 
 
+def flatten_pipeline_items(items: tuple[PipelineItem, ...]) -> list[PipelineItem]:
+    """Inline nested pipelines into one flat item list, keeping only the first occurrence of each item."""
+    flat_items: list[PipelineItem] = []
+
+    for item in items:
+        if item in (None, ""):
+            continue
+
+        # Pipelines built by pipeline() expose their (already flat) items, so they can be inlined
+        nested_items = getattr(item, "__pipeline_items__", None)
+        for flat_item in nested_items if nested_items is not None else (item,):
+            if not any(flat_item is existing for existing in flat_items):
+                flat_items.append(flat_item)
+
+    return flat_items
+
+
 def pipeline(*items: PipelineItem) -> PipelineFunction:
-    filtered_items = [item for item in items if item not in (None, "")]
+    if any(getattr(item, "__is_configurable_pipeline__", False) for item in items):
+        # Configurable pipelines only know their middlewares once configuration is applied
+        from .pipeline_configuration import ConfigurablePipeline
+
+        return cast(PipelineFunction, ConfigurablePipeline(None, items, registry={}))
+
+    flat_items = flatten_pipeline_items(items)
     middlewares: list[MiddlewareFunc] = []
 
-    for item in filtered_items:
+    for item in flat_items:
         try:
             middleware = create_middleware(item)
             middlewares.append(middleware)
@@ -235,16 +607,19 @@ def pipeline(*items: PipelineItem) -> PipelineFunction:
 
     pipeline_decorator_with_mark = cast(PipelineFunction, pipeline_decorator)
     pipeline_decorator_with_mark.__is_pipeline__ = True
+    setattr(pipeline_decorator_with_mark, "__pipeline_items__", tuple(flat_items))
     return pipeline_decorator_with_mark
 
 
 __all__ = [
     "pipeline",
     "Context",
+    "LayeredKwargs",
     "Next",
     "MiddlewareClass",
     "MiddlewareFunc",
     "MiddlewareProtocol",
     "PipelineDecorator",
     "PipelineItem",
+    "PlanCache",
 ]
@@ -0,0 +1,93 @@
+"""Optional per-stage timing breakdown for pipelines."""
+
+import json
+import threading
+from typing import Any, Optional, Sequence
+
+from ..metrics.histogram import Histogram
+
+
+class StageTimings:
+    """Inclusive (stage plus everything downstream) and exclusive (stage only) timings of one stage."""
+
+    __slots__ = ("name", "inclusive", "exclusive")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.inclusive = Histogram()
+        self.exclusive = Histogram()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"stage": self.name, "inclusive": self.inclusive.to_dict(), "exclusive": self.exclusive.to_dict()}
+
+
+class RouteProfile:
+    """Timings for every stage of one decorated target, in pipeline order (the target is the last stage)."""
+
+    def __init__(self, route: str, stage_names: Sequence[str]):
+        self.route = route
+        self.stages = [StageTimings(name) for name in stage_names]
+
+    def record(self, index: int, inclusive: float, exclusive: float) -> None:
+        stage = self.stages[index]
+        stage.inclusive.observe(inclusive)
+        stage.exclusive.observe(exclusive)
+
+    def reset(self) -> None:
+        for stage in self.stages:
+            stage.inclusive.reset()
+            stage.exclusive.reset()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"route": self.route, "stages": [stage.to_dict() for stage in self.stages]}
+
+
+class PipelineProfiler:
+    """
+    Collects per-stage timings from every pipeline while enabled.
+
+    Disabled by default: the only cost then is one attribute check per pipeline call.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._routes: dict[str, RouteProfile] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def route(self, route: str, stage_names: Sequence[str]) -> RouteProfile:
+        """Get the profile for a route, creating it on first use."""
+        profile = self._routes.get(route)
+        if profile is None:
+            with self._lock:
+                profile = self._routes.setdefault(route, RouteProfile(route, stage_names))
+        return profile
+
+    def get_route(self, route: str) -> Optional[RouteProfile]:
+        return self._routes.get(route)
+
+    def reset(self) -> None:
+        """Clear collected timings, keeping the known routes."""
+        for profile in list(self._routes.values()):
+            profile.reset()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {route: profile.to_dict() for route, profile in sorted(self._routes.items())}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def dump_json(self, file_path: str) -> None:
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+
+# Process-wide profiler used by every pipeline
+pipeline_profiler = PipelineProfiler()
+
+__all__ = ["PipelineProfiler", "RouteProfile", "StageTimings", "pipeline_profiler"]
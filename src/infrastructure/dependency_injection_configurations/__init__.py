@@ -1,17 +1,26 @@
-from .build_di_container import build_di_container
+from .build_di_container import WARMUP_SINGLETONS, build_di_container
 from .greeting_module import GreetingModule
+from .health_module import HealthModule
 from .logging_module import LoggingModule
+from .request_scope import RequestScope, in_request_scope, open_request_scope, request_scoped
 from .settings_module import SettingsModule
-from .shared_pipeline import authenticated_pipeline, http_pipeline, shared_pipeline
+from .shared_pipeline import authenticated_pipeline, http_pipeline, shared_pipeline, startup_pipeline
 from .web_framework_module import WebFrameworkModule
 
 __all__ = [
     "build_di_container",
+    "WARMUP_SINGLETONS",
     "SettingsModule",
     "GreetingModule",
+    "HealthModule",
     "LoggingModule",
     "WebFrameworkModule",
+    "RequestScope",
+    "request_scoped",
+    "in_request_scope",
+    "open_request_scope",
     "shared_pipeline",
+    "startup_pipeline",
     "http_pipeline",
     "authenticated_pipeline",
 ]
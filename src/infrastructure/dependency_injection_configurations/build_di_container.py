@@ -1,9 +1,19 @@
+import os
 from typing import Optional
 
+import redis
 from injector import Injector, Module
+from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
 
 from ..config_loaders.config_loader_args import JsonConfigLoaderArgs
+from ..health import HealthMonitor
+from ..logger import LoggerStrategy
+from ..models.settings import Settings
+from ..repositories import AuthRepository
+from ..web_apps.web_app_interface import WebAppInterface
 from .greeting_module import GreetingModule
+from .health_module import HealthModule
 from .logging_module import LoggingModule
 from .redis_module import RedisModule
 from .repositories_module import RepositoriesModule
@@ -11,16 +21,29 @@ from .settings_module import SettingsModule
 from .sqlalchemy_module import SQLAlchemyModule
 from .web_framework_module import WebFrameworkModule
 
+# Singletons of the modules below that are worth creating before traffic arrives: connections, pings, the web app
+WARMUP_SINGLETONS = (
+    Settings,
+    LoggerStrategy,
+    WebAppInterface,
+    redis.Redis,
+    Engine,
+    sessionmaker,
+    AuthRepository,
+    HealthMonitor,
+)
+
 
 def build_di_container(extra_modules: Optional[list[Module]] = None) -> Injector:
     base_modules = [
-        SettingsModule(config_loader_args=JsonConfigLoaderArgs(file_path="config.json")),
+        SettingsModule(config_loader_args=JsonConfigLoaderArgs(file_path=os.environ.get("CONFIG_FILE", "config.json"))),
         LoggingModule(),
         RedisModule(),
         SQLAlchemyModule(),
         RepositoriesModule(),
         GreetingModule(),
         WebFrameworkModule(),  # Add web framework module
+        HealthModule(),
     ]
 
     if extra_modules:
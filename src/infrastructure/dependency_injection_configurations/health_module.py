@@ -0,0 +1,46 @@
+"""Health module for dependency injection."""
+
+import redis
+from injector import Injector, Module, provider, singleton
+from sqlalchemy import Engine, text
+
+from ..config_loaders import CachedSettingsLoader
+from ..health import HealthMonitor
+from ..logger import LoggerStrategy
+from ..models.settings import Settings
+from ..web_apps.web_app_interface import WebAppInterface
+
+# Refresh intervals the configuration source may go unchecked before the application stops being ready
+MAX_MISSED_CONFIG_REFRESHES = 3
+
+
+class HealthModule(Module):
+    """Module for the readiness checks of the services the application depends on."""
+
+    @singleton
+    @provider
+    def provide_health_monitor(
+        self, injector: Injector, settings: Settings, web_app: WebAppInterface, logger: LoggerStrategy
+    ) -> HealthMonitor:
+        """Provide the health monitor; dependencies are resolved in every check, so one that failed to start is retried"""
+
+        def check_redis() -> None:
+            injector.get(redis.Redis).ping()
+
+        def check_database() -> None:
+            with injector.get(Engine).connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        def check_config() -> None:
+            # The settings cache polls the configuration source in the background; this reads how its last poll went
+            settings_loader = injector.get(CachedSettingsLoader)
+            settings_loader.get()
+            if settings_loader.last_refresh_error is not None:
+                raise RuntimeError(f"Configuration refresh failed: {settings_loader.last_refresh_error}")
+            max_age = MAX_MISSED_CONFIG_REFRESHES * (settings_loader.refresh_interval or 0)
+            refresh_age = settings_loader.refresh_age
+            if max_age > 0 and refresh_age is not None and refresh_age > max_age:
+                raise RuntimeError(f"Configuration source not checked for {refresh_age:.1f}s")
+
+        checks = {"redis": check_redis, "database": check_database, "config": check_config}
+        return HealthMonitor(checks, logger, interval=settings.health_check_interval, json_codec=web_app.json_codec)
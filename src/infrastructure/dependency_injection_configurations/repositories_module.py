@@ -3,6 +3,7 @@
 from injector import Module, singleton
 
 from ..repositories import AuthRepository, OrganizationRepository, UserRepository
+from .request_scope import request_scoped
 
 
 class RepositoriesModule(Module):
@@ -11,5 +12,6 @@ class RepositoriesModule(Module):
     def configure(self, binder):
         """Configure repository bindings."""
         binder.bind(AuthRepository, to=AuthRepository, scope=singleton)
-        binder.bind(UserRepository, to=UserRepository, scope=singleton)
-        binder.bind(OrganizationRepository, to=OrganizationRepository, scope=singleton)
+        # Database repositories hold a Session, which must not outlive the request or be shared across threads
+        binder.bind(UserRepository, to=UserRepository, scope=request_scoped)
+        binder.bind(OrganizationRepository, to=OrganizationRepository, scope=request_scoped)
@@ -0,0 +1,87 @@
+"""Request scope for the injector: one instance per binding and request, closed when the request ends."""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from injector import InstanceProvider, Provider, Scope, ScopeDecorator
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCache:
+    """Instances created for one request, in creation order so they can be closed in reverse."""
+
+    __slots__ = ("providers", "instances")
+
+    def __init__(self):
+        self.providers: dict[tuple[Scope, Any], Provider] = {}
+        self.instances: list[Any] = []
+
+    def close(self) -> None:
+        for instance in reversed(self.instances):
+            close = getattr(instance, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception:
+                logger.exception(f"Failed to close request scoped {type(instance).__name__}")
+        self.instances.clear()
+        self.providers.clear()
+
+
+_current_request: ContextVar[Optional[RequestCache]] = ContextVar("current_request", default=None)
+
+
+class RequestScope(Scope):
+    """A scope that returns one instance per key for the duration of a request.
+
+    Instances with a ``close()`` method (e.g. SQLAlchemy sessions) are closed when the request ends.
+    Resolving a request scoped binding outside of a request is an error.
+    """
+
+    def get(self, key: Any, provider: Provider) -> Provider:
+        request_cache = _current_request.get()
+        if request_cache is None:
+            raise RuntimeError(
+                f"Cannot provide request scoped {key} outside of a request. "
+                "Did you forget to add request_scope_middleware or to use open_request_scope()?"
+            )
+
+        try:
+            return request_cache.providers[(self, key)]
+        except KeyError:
+            instance = provider.get(self.injector)
+            request_cache.instances.append(instance)
+            instance_provider = InstanceProvider(instance)
+            request_cache.providers[(self, key)] = instance_provider
+            return instance_provider
+
+
+request_scoped = ScopeDecorator(RequestScope)
+
+
+def in_request_scope() -> bool:
+    """Whether a request scope is active in the current context."""
+    return _current_request.get() is not None
+
+
+@contextmanager
+def open_request_scope() -> Iterator[None]:
+    """Run the enclosed block as one request; nested uses join the enclosing request."""
+    if _current_request.get() is not None:
+        yield
+        return
+
+    request_cache = RequestCache()
+    token = _current_request.set(request_cache)
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+        request_cache.close()
+
+
+__all__ = ["RequestScope", "request_scoped", "in_request_scope", "open_request_scope"]
@@ -1,14 +1,24 @@
+from typing import Optional
+
 from injector import Module, provider
 
-from ..config_loaders import ConfigLoaderArgs, load_settings_from_config_loader
+from ..config_loaders import CachedSettingsLoader, ConfigLoaderArgs
 from ..models.settings import Settings
 
 
 class SettingsModule(Module):
-    def __init__(self, config_loader_args: ConfigLoaderArgs):
+    def __init__(self, config_loader_args: ConfigLoaderArgs, refresh_interval: Optional[float] = None):
         self.config_loader_args = config_loader_args
+        # Loaded once and shared; reloaded only when the configuration source reports a new version. Remote sources are
+        # polled every settings.config_refresh_interval seconds unless refresh_interval is given
+        self.settings_loader = CachedSettingsLoader(
+            config_loader_args=config_loader_args, SettingsClass=Settings, refresh_interval=refresh_interval
+        )
 
     @provider
     def provide_settings(self) -> Settings:
-        settings = load_settings_from_config_loader(config_loader_args=self.config_loader_args, SettingsClass=Settings)
-        return settings
+        return self.settings_loader.get()
+
+    @provider
+    def provide_settings_loader(self) -> CachedSettingsLoader:
+        return self.settings_loader
@@ -1,14 +1,18 @@
 """Shared pipeline configuration for the application."""
 
-from ..decorators import pipeline
+from ..decorators import configurable_pipeline
 from ..middlewares import (
+    LogMiddleware,
+    TimeMiddleware,
     container_builder_middleware,
     error_handling_middleware,
     inject_dependency_middleware,
     jwt_authentication_middleware,
     logger_middleware,
+    metrics_middleware,
     performance_middleware,
     redis_cache_middleware,
+    request_scope_middleware,
     request_validation_middleware,
     session_management_middleware,
     time_middleware,
@@ -17,9 +21,34 @@ from ..middlewares import (
 
 di_container_builder_middleware = container_builder_middleware()
 
+# Middlewares that Settings.pipelines can refer to by name
+middleware_registry = {
+    item.__name__: item
+    for item in (
+        di_container_builder_middleware,
+        metrics_middleware,
+        request_scope_middleware,
+        inject_dependency_middleware,
+        typed_request_middleware,
+        request_validation_middleware,
+        logger_middleware,
+        time_middleware,
+        performance_middleware,
+        error_handling_middleware,
+        jwt_authentication_middleware,
+        redis_cache_middleware,
+        session_management_middleware,
+        TimeMiddleware,
+        LogMiddleware,
+    )
+}
+
 # Shared pipeline configuration used across the application
-shared_pipeline = pipeline(
+shared_pipeline = configurable_pipeline(
+    "shared_pipeline",
     di_container_builder_middleware,
+    metrics_middleware,
+    request_scope_middleware,
     inject_dependency_middleware,
     typed_request_middleware,
     request_validation_middleware,
@@ -27,11 +56,27 @@ shared_pipeline = pipeline(
     time_middleware,
     performance_middleware,
     error_handling_middleware,
+    registry=middleware_registry,
+)
+
+# Pipeline for the application entry point; it runs for the lifetime of the server, so it must not open a request scope
+startup_pipeline = configurable_pipeline(
+    "startup_pipeline",
+    di_container_builder_middleware,
+    inject_dependency_middleware,
+    logger_middleware,
+    time_middleware,
+    performance_middleware,
+    error_handling_middleware,
+    registry=middleware_registry,
 )
 
 # HTTP-specific pipeline with comprehensive middleware for aspect-oriented programming
-http_pipeline = pipeline(
+http_pipeline = configurable_pipeline(
+    "http_pipeline",
     di_container_builder_middleware,
+    metrics_middleware,
+    request_scope_middleware,
     inject_dependency_middleware,
     typed_request_middleware,
     request_validation_middleware,
@@ -39,11 +84,15 @@ http_pipeline = pipeline(
     time_middleware,
     performance_middleware,
     error_handling_middleware,
+    registry=middleware_registry,
 )
 
 # Authenticated pipeline with JWT authentication, Redis cache, and session management
-authenticated_pipeline = pipeline(
+authenticated_pipeline = configurable_pipeline(
+    "authenticated_pipeline",
     di_container_builder_middleware,
+    metrics_middleware,
+    request_scope_middleware,
     inject_dependency_middleware,
     jwt_authentication_middleware,
     typed_request_middleware,
@@ -54,6 +103,7 @@ authenticated_pipeline = pipeline(
     time_middleware,
     performance_middleware,
     error_handling_middleware,
+    registry=middleware_registry,
 )
 
-__all__ = ["shared_pipeline", "http_pipeline", "authenticated_pipeline"]
+__all__ = ["shared_pipeline", "startup_pipeline", "http_pipeline", "authenticated_pipeline"]
@@ -1,14 +1,12 @@
 """SQLAlchemy module for dependency injection."""
 
-from typing import Optional
-
 from injector import Module, provider, singleton
 from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from ..logger import LoggerStrategy
 from ..models.settings import Settings
+from .request_scope import request_scoped
 
 
 class SQLAlchemyModule(Module):
@@ -16,7 +14,7 @@ class SQLAlchemyModule(Module):
 
     @singleton
     @provider
-    def provide_database_engine(self, settings: Settings, logger: LoggerStrategy) -> Optional[Engine]:
+    def provide_database_engine(self, settings: Settings, logger: LoggerStrategy) -> Engine:
         """Provide SQLAlchemy database engine."""
         try:
             # In a real application, these would come from settings
@@ -28,17 +26,17 @@ class SQLAlchemyModule(Module):
 
             # Build database URL
             if db_password:
-                database_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+                database_url = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
             else:
-                database_url = f"postgresql://{db_user}@{db_host}:{db_port}/{db_name}"
+                database_url = f"postgresql+psycopg2://{db_user}@{db_host}:{db_port}/{db_name}"
 
             logger.info(f"Database connecting to {db_host}:{db_port}/{db_name}")
 
-            # Create engine with appropriate configuration
+            # Create engine with appropriate configuration; the default QueuePool hands every request
+            # scoped session its own connection and takes it back when the session closes
             engine = create_engine(
                 database_url,
                 echo=settings.debug,  # Log SQL queries in debug mode
-                poolclass=StaticPool,  # Use static pool for development
                 pool_size=10,
                 max_overflow=20,
                 pool_pre_ping=True,  # Verify connections before use
@@ -63,12 +61,14 @@ class SQLAlchemyModule(Module):
             logger.info("Using in-memory SQLite database")
             return fallback_engine
 
+    @singleton
     @provider
-    def provide_database_session_factory(self, engine) -> sessionmaker:
+    def provide_database_session_factory(self, engine: Engine) -> sessionmaker:
         """Provide SQLAlchemy session factory."""
         return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+    @request_scoped
     @provider
     def provide_database_session(self, session_factory: sessionmaker) -> Session:
-        """Provide SQLAlchemy database session."""
+        """Provide the SQLAlchemy database session of the current request, closed when the request ends."""
         return session_factory()
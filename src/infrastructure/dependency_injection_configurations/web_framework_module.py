@@ -1,7 +1,9 @@
 from injector import Module, provider, singleton
 
+from ..web_apps.asgi_web_app import AsgiWebApp
 from ..web_apps.fastapi_web_app import FastAPIWebApp
 from ..web_apps.flask_web_app import FlaskWebApp
+from ..web_apps.json_codec import create_json_codec
 from ..web_apps.web_app_interface import WebAppInterface
 from .settings_module import Settings
 
@@ -16,10 +18,13 @@ class WebFrameworkModule(Module):
 
         # Use settings.web_framework from the config loader
         framework = settings.web_framework.lower()
+        json_codec = create_json_codec(settings.json_codec)
 
         if framework == "fastapi":
-            return FastAPIWebApp()
+            return FastAPIWebApp(settings.server, json_codec, settings.compression)
         elif framework == "flask":
-            return FlaskWebApp()
+            return FlaskWebApp(json_codec, settings.compression)
+        elif framework == "asgi":
+            return AsgiWebApp(settings.server, json_codec, settings.compression)
         else:
-            raise ValueError(f"Unsupported web framework: {framework}. Supported: flask, fastapi")
+            raise ValueError(f"Unsupported web framework: {framework}. Supported: flask, fastapi, asgi")
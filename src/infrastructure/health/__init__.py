@@ -0,0 +1,3 @@
+from .health_monitor import HealthCheck, HealthMonitor
+
+__all__ = ["HealthCheck", "HealthMonitor"]
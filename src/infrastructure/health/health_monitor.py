@@ -0,0 +1,85 @@
+"""Background readiness checks with a pre-serialized result."""
+
+import datetime
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from ..logger import LoggerStrategy
+from ..web_apps.json_codec import JsonCodec
+
+# A check passes when it returns, whatever it returns, and fails when it raises
+HealthCheck = Callable[[], Any]
+
+
+class HealthMonitor:
+    """Runs the readiness checks on a background thread every `interval` seconds.
+
+    The readiness probe only reads the last result, a status code and a body serialized once per refresh, so probes
+    never wait on Redis or the database and never multiply the load on them.
+    """
+
+    def __init__(
+        self,
+        checks: dict[str, HealthCheck],
+        logger: LoggerStrategy,
+        interval: float = 10.0,
+        json_codec: JsonCodec = JsonCodec(),
+    ):
+        self.checks = checks
+        self.logger = logger
+        self.interval = interval
+        self.json_codec = json_codec
+        self._readiness = (503, json_codec.encode({"status": "starting", "checks": {}}))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def readiness(self) -> tuple[int, bytes]:
+        """Status code and JSON body of the last refresh; 503 until the first one completes"""
+        return self._readiness
+
+    def start(self) -> None:
+        """Start refreshing in the background; the first refresh starts right away"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def refresh(self) -> tuple[int, bytes]:
+        """Run every check once and publish the result"""
+        results = {}
+        for name, check in self.checks.items():
+            start = time.perf_counter()
+            try:
+                check()
+                results[name] = {"status": "up"}
+            except Exception as e:
+                results[name] = {"status": "down", "error": str(e)}
+            results[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        ready = all(result["status"] == "up" for result in results.values())
+        body = {
+            "status": "ready" if ready else "not_ready",
+            "checked_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "checks": results,
+        }
+        # Published as one tuple, so a probe never sees the status of one refresh with the body of another
+        self._readiness = (200 if ready else 503, self.json_codec.encode(body))
+        return self._readiness
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                status_code, body = self.refresh()
+                if status_code != 200:
+                    self.logger.warning(f"⚠️ Readiness checks failing: {body.decode()}")
+            except Exception as e:
+                self.logger.error(f"Readiness refresh failed: {str(e)}")
+            self._stop.wait(self.interval)
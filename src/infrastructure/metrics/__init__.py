@@ -0,0 +1,34 @@
+from .hdr_histogram import HdrHistogram, WindowedHistogram
+from .histogram import DEFAULT_LATENCY_BUCKETS, Histogram
+from .process_sampler import ProcessMetricsSampler, ProcessSample, process_sampler
+from .registry import (
+    PROMETHEUS_CONTENT_TYPE,
+    CounterMetric,
+    GaugeChild,
+    GaugeMetric,
+    HistogramMetric,
+    MetricsRegistry,
+    SummaryMetric,
+    metrics_registry,
+)
+from .synthetic_traffic import is_synthetic_traffic, synthetic_traffic
+
+__all__ = [
+    "Histogram",
+    "DEFAULT_LATENCY_BUCKETS",
+    "HdrHistogram",
+    "WindowedHistogram",
+    "ProcessMetricsSampler",
+    "ProcessSample",
+    "process_sampler",
+    "CounterMetric",
+    "GaugeChild",
+    "GaugeMetric",
+    "HistogramMetric",
+    "MetricsRegistry",
+    "SummaryMetric",
+    "PROMETHEUS_CONTENT_TYPE",
+    "metrics_registry",
+    "synthetic_traffic",
+    "is_synthetic_traffic",
+]
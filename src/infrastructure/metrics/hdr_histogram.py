@@ -0,0 +1,221 @@
+"""Log-linear (HDR-style) histogram and its windowed variant, for latency percentiles."""
+
+import array
+import math
+import struct
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence
+
+# Layout and totals ahead of the counts in to_bytes()
+_HEADER = struct.Struct("=ddiqddd")
+
+
+class HdrHistogram:
+    """
+    Counts values in log-linear buckets held in one preallocated array.
+
+    Values under `2**sub_bucket_bits` units get a bucket each; every power of two above that is split into
+    `2**(sub_bucket_bits - 1)` equal buckets, so a percentile is within 1 / 2**(sub_bucket_bits - 1) of the
+    true value (1.6% with the default 7 bits). Recording is a few integer operations and one increment, memory
+    is fixed by `highest`, and values above it are counted in the last bucket.
+
+    Histograms with the same layout merge exactly by adding their counts, whether they come from other threads
+    or, through to_bytes() and from_bytes(), from other worker processes. Not thread-safe on its own.
+    """
+
+    def __init__(self, unit: float = 1e-6, highest: float = 60.0, sub_bucket_bits: int = 7):
+        self.unit = unit
+        self.highest = highest
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._sub_bucket_half = self._sub_bucket_count >> 1
+        self._highest_units = max(int(highest / unit), self._sub_bucket_count)
+        self._length = self._index(self._highest_units) + 1
+        self.counts = array.array("q", bytes(8 * self._length))
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        units = int(value / self.unit)
+        self.counts[self._index(min(max(units, 0), self._highest_units))] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentiles(self, percents: Sequence[float]) -> list[Optional[float]]:
+        """Several percentiles in one pass over the counts; each is the upper bound of the bucket holding it"""
+        results: list[Optional[float]] = [None] * len(percents)
+        if not self.count:
+            return results
+
+        ranks = sorted((max(1, math.ceil(percent / 100 * self.count)), position) for position, percent in enumerate(percents))
+        seen = 0
+        next_rank = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            # The last bucket also holds the values above `highest`, so it reports the max
+            value = self.max if index == self._length - 1 else min(self._upper_bound(index) * self.unit, self.max)
+            while next_rank < len(ranks) and seen >= ranks[next_rank][0]:
+                results[ranks[next_rank][1]] = value
+                next_rank += 1
+            if next_rank == len(ranks):
+                break
+        return results
+
+    def percentile(self, percent: float) -> Optional[float]:
+        return self.percentiles([percent])[0]
+
+    def merge(self, other: "HdrHistogram") -> None:
+        if other._layout() != self._layout():
+            raise ValueError(f"Cannot merge histograms with different layouts: {other._layout()} into {self._layout()}")
+        counts = self.counts
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "HdrHistogram":
+        histogram = HdrHistogram(self.unit, self.highest, self.sub_bucket_bits)
+        histogram.counts = self.counts[:]
+        histogram.count, histogram.sum, histogram.min, histogram.max = self.count, self.sum, self.min, self.max
+        return histogram
+
+    def reset(self) -> None:
+        self.counts = array.array("q", bytes(8 * self._length))
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def to_bytes(self) -> bytes:
+        """Layout, totals and counts, in native byte order, for merging into the histogram of another process"""
+        header = _HEADER.pack(self.unit, self.highest, self.sub_bucket_bits, self.count, self.sum, self.min, self.max)
+        return header + self.counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HdrHistogram":
+        unit, highest, sub_bucket_bits, count, total, minimum, maximum = _HEADER.unpack_from(data)
+        histogram = cls(unit, highest, sub_bucket_bits)
+        counts = array.array("q")
+        counts.frombytes(data[_HEADER.size :])
+        if len(counts) != histogram._length:
+            raise ValueError(f"Expected {histogram._length} counts, got {len(counts)}")
+        histogram.counts = counts
+        histogram.count, histogram.sum, histogram.min, histogram.max = count, total, minimum, maximum
+        return histogram
+
+    def to_dict(self) -> dict[str, Any]:
+        p50, p90, p99, p999 = self.percentiles([50, 90, 99, 99.9])
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "p999": p999,
+        }
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_bucket_count:
+            return units
+        # Shift the value down until it fits in the sub-buckets; the shift picks the power of two
+        shift = units.bit_length() - self.sub_bucket_bits
+        return self._sub_bucket_count + (shift - 1) * self._sub_bucket_half + (units >> shift) - self._sub_bucket_half
+
+    def _upper_bound(self, index: int) -> int:
+        """Largest value, in units, counted in the bucket at index"""
+        if index < self._sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self._sub_bucket_count, self._sub_bucket_half)
+        return ((self._sub_bucket_half + offset + 1) << (shift + 1)) - 1
+
+    def _layout(self) -> tuple[float, float, int]:
+        return self.unit, self.highest, self.sub_bucket_bits
+
+
+class WindowedHistogram:
+    """
+    Percentiles over a sliding window, from a ring of `slices` histograms covering `slice_seconds` each.
+
+    Recording goes to the slice of the current period, which is cleared when the ring comes back around to it;
+    reading merges the slices still inside the window. Slices follow the wall clock, so the slices of several
+    worker processes cover the same periods. Memory is fixed whatever the traffic: `slices` histograms.
+    """
+
+    def __init__(
+        self,
+        slice_seconds: float = 60.0,
+        slices: int = 5,
+        clock: Callable[[], float] = time.time,
+        **histogram_options: Any,
+    ):
+        self.slice_seconds = slice_seconds
+        self.slices = slices
+        self.clock = clock
+        self._histogram_options = histogram_options
+        self._ring = [HdrHistogram(**histogram_options) for _ in range(slices)]
+        self._periods = [-1] * slices
+        # Since the start, unlike the window: Prometheus expects the _sum and _count of a summary to only grow
+        self.total_count = 0
+        self.total_sum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value: float) -> None:
+        period = int(self.clock() // self.slice_seconds)
+        slot = period % self.slices
+        # Held for an increment: threads share the slices, so memory per route does not grow with the threads
+        with self._lock:
+            if self._periods[slot] != period:
+                self._ring[slot].reset()
+                self._periods[slot] = period
+            self._ring[slot].record(value)
+            self.total_count += 1
+            self.total_sum += value
+
+    def snapshot(self) -> HdrHistogram:
+        """The slices inside the window merged into one histogram"""
+        oldest_period = int(self.clock() // self.slice_seconds) - self.slices + 1
+        with self._lock:
+            # Copying the arrays is quick, so recording threads do not wait for the merge
+            copies = [histogram.copy() for histogram, period in zip(self._ring, self._periods) if period >= oldest_period]
+        if not copies:
+            return HdrHistogram(**self._histogram_options)
+        merged, *others = copies
+        for histogram in others:
+            merged.merge(histogram)
+        return merged
+
+    def percentiles(self, percents: Sequence[float]) -> list[Optional[float]]:
+        return self.snapshot().percentiles(percents)
+
+    def reset(self) -> None:
+        with self._lock:
+            for histogram in self._ring:
+                histogram.reset()
+            self._periods = [-1] * self.slices
+            self.total_count = 0
+            self.total_sum = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"window_seconds": self.slice_seconds * self.slices, **self.snapshot().to_dict()}
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+
+__all__ = ["HdrHistogram", "WindowedHistogram"]
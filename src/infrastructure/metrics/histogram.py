@@ -0,0 +1,98 @@
+"""Fixed-bucket histogram for latency distributions."""
+
+import bisect
+import threading
+from typing import Any, Optional, Sequence
+
+# Upper bounds in seconds, from 10us to 10s, roughly 1-2.5-5 per decade
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """In-memory histogram with fixed upper bounds; values above the last bound go to an overflow bucket."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Approximate percentile: the upper bound of the bucket holding it (the max for the overflow bucket)."""
+        with self._lock:
+            if not self._count:
+                return None
+            rank = percent / 100 * self._count
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank and bucket_count:
+                    return self.buckets[index] if index < len(self.buckets) else self._max
+            return self._max
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._min = None
+            self._max = None
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            count, total, minimum, maximum = self._count, self._sum, self._min, self._max
+
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else None,
+            "min": minimum,
+            "max": maximum,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": {str(bound): bucket_count for bound, bucket_count in zip(self.buckets, counts)} | {"+Inf": counts[-1]},
+        }
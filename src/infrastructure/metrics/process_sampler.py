@@ -0,0 +1,162 @@
+"""Background sampler of process-level resource metrics."""
+
+import collections
+import gc
+import os
+import threading
+import time
+from typing import Any, NamedTuple, Optional
+
+import psutil
+
+from .registry import MetricsRegistry
+
+
+class ProcessSample(NamedTuple):
+    timestamp: float
+    monotonic: float
+    rss_bytes: int
+    # Cumulative CPU seconds of the process
+    cpu_user: float
+    cpu_system: float
+    # CPU used since the previous sample, in percent of one core
+    cpu_percent: float
+    threads: int
+    # Objects tracked per generation, and cumulative collections and collected objects per generation
+    gc_counts: tuple[int, ...]
+    gc_collections: tuple[int, ...]
+    gc_collected: tuple[int, ...]
+
+
+class ProcessMetricsSampler:
+    """
+    Samples the resource usage of this process on a background thread into a fixed-size ring buffer.
+
+    Requests pay nothing for it: the syscalls happen once per interval, whatever the traffic.
+    """
+
+    def __init__(self, interval: float = 5.0, capacity: int = 120):
+        self.interval = interval
+        self._samples: collections.deque[ProcessSample] = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[psutil.Process] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Start sampling in the background; the first sample is taken right away."""
+        if interval is not None:
+            self.interval = interval
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="process-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self) -> ProcessSample:
+        """Take one sample and add it to the ring buffer."""
+        if self._process is None:
+            self._process = psutil.Process()
+        with self._process.oneshot():
+            rss_bytes = self._process.memory_info().rss
+            cpu_times = self._process.cpu_times()
+            threads = self._process.num_threads()
+        timestamp, monotonic = time.time(), time.monotonic()
+        gc_stats = gc.get_stats()
+
+        previous = self.latest()
+        cpu_percent = 0.0
+        if previous is not None and monotonic > previous.monotonic:
+            cpu_used = cpu_times.user + cpu_times.system - previous.cpu_user - previous.cpu_system
+            cpu_percent = cpu_used / (monotonic - previous.monotonic) * 100
+
+        sample = ProcessSample(
+            timestamp=timestamp,
+            monotonic=monotonic,
+            rss_bytes=rss_bytes,
+            cpu_user=cpu_times.user,
+            cpu_system=cpu_times.system,
+            cpu_percent=cpu_percent,
+            threads=threads,
+            gc_counts=gc.get_count(),
+            gc_collections=tuple(generation["collections"] for generation in gc_stats),
+            gc_collected=tuple(generation["collected"] for generation in gc_stats),
+        )
+        with self._lock:
+            self._samples.append(sample)
+        return sample
+
+    def latest(self) -> Optional[ProcessSample]:
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def samples(self) -> list[ProcessSample]:
+        """The buffered samples, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        samples = self.samples()
+        if not samples:
+            return {"interval": self.interval, "samples": 0, "latest": None}
+        return {
+            "interval": self.interval,
+            "samples": len(samples),
+            "latest": samples[-1]._asdict(),
+            "rss_bytes_max": max(sample.rss_bytes for sample in samples),
+            "cpu_percent_mean": sum(sample.cpu_percent for sample in samples[1:]) / max(len(samples) - 1, 1),
+        }
+
+    def register_metrics(self, registry: MetricsRegistry) -> None:
+        """Expose the latest sample as gauges; a scrape reads the ring buffer and makes no syscall."""
+
+        def latest(field: str) -> Any:
+            return lambda: getattr(self.latest(), field, None)
+
+        registry.gauge("process_resident_memory_bytes", "Resident memory size in bytes").set_function(latest("rss_bytes"))
+        registry.gauge("process_cpu_percent", "CPU used between the last two samples, in percent of one core").set_function(
+            latest("cpu_percent")
+        )
+        registry.gauge("process_threads", "Number of OS threads").set_function(latest("threads"))
+        cpu_seconds = registry.counter("process_cpu_seconds_total", "User and system CPU time spent in seconds", ("mode",))
+        cpu_seconds.labels("user").set_function(latest("cpu_user"))
+        cpu_seconds.labels("system").set_function(latest("cpu_system"))
+        gc_collections = registry.counter("python_gc_collections_total", "Garbage collections per generation", ("generation",))
+        for generation in range(len(gc.get_stats())):
+            gc_collections.labels(generation).set_function(
+                lambda generation=generation: sample.gc_collections[generation] if (sample := self.latest()) else None
+            )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def _after_fork_in_child(self) -> None:
+        # The sampling thread does not survive a fork and the samples belong to the parent
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._process = None
+        self._samples.clear()
+
+
+# Process-wide sampler, started by every serving process
+process_sampler = ProcessMetricsSampler()
+os.register_at_fork(after_in_child=process_sampler._after_fork_in_child)
+
+__all__ = ["ProcessMetricsSampler", "ProcessSample", "process_sampler"]
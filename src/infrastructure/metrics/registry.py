@@ -0,0 +1,456 @@
+"""Counters, gauges, fixed-bucket histograms and windowed summaries, exposed in the Prometheus text format."""
+
+import bisect
+import itertools
+import math
+import os
+import threading
+import weakref
+from typing import Callable, Generic, Iterator, Optional, Sequence, TypeVar, Union
+
+from .hdr_histogram import WindowedHistogram
+from .histogram import DEFAULT_LATENCY_BUCKETS
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99, 0.999)
+
+Number = Union[int, float]
+# Name suffix, labels and value of one line of the exposition
+Sample = tuple[str, dict[str, str], Number]
+
+
+class _CellOwner:
+    """Lives in a thread's local storage, so it is collected when the thread exits"""
+
+    __slots__ = ("__weakref__",)
+
+
+class ThreadCells:
+    """
+    One accumulator list per thread.
+
+    A thread only ever writes its own cell, so recording takes no lock and threads never contend; a read sums the
+    cells of every live thread. When a thread exits, its cell is folded into a shared base and dropped, so the
+    number of cells follows the live threads rather than every thread that ever recorded.
+    """
+
+    __slots__ = ("size", "_local", "_cells", "_base", "_keys", "_lock")
+
+    def __init__(self, size: int):
+        self.size = size
+        self._local = threading.local()
+        self._cells: dict[int, list[Number]] = {}
+        self._base: list[Number] = [0] * size
+        self._keys = itertools.count()
+        # Reentrant: a collection triggered while the lock is held may retire a cell of this same instance
+        self._lock = threading.RLock()
+
+    def cell(self) -> list[Number]:
+        """The cell of the calling thread, created on its first use"""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell: list[Number] = [0] * self.size
+            key = next(self._keys)
+            owner = _CellOwner()
+            with self._lock:
+                self._cells[key] = cell
+            weakref.finalize(owner, self._retire, key).atexit = False
+            self._local.owner = owner
+            self._local.cell = cell
+            return cell
+
+    def totals(self) -> list[Number]:
+        with self._lock:
+            totals = list(self._base)
+            cells = list(self._cells.values())
+        for cell in cells:
+            for index, value in enumerate(cell):
+                totals[index] += value
+        return totals
+
+    def reset(self) -> None:
+        # Fresh cells rather than zeroed ones, so a thread still writing to its old cell cannot undo the reset
+        with self._lock:
+            self._local = threading.local()
+            self._cells = {}
+            self._base = [0] * self.size
+
+    def _retire(self, key: int) -> None:
+        """Fold the cell of an exited thread into the base; cells dropped by a reset since are already gone"""
+        with self._lock:
+            cell = self._cells.pop(key, None)
+            if cell is not None:
+                for index, value in enumerate(cell):
+                    self._base[index] += value
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.RLock()
+
+
+class ValueChild:
+    """A single value; set_function replaces it with one computed at exposition time."""
+
+    __slots__ = ("_cells", "_function")
+
+    def __init__(self):
+        self._cells = ThreadCells(1)
+        self._function: Optional[Callable[[], Optional[Number]]] = None
+
+    @property
+    def value(self) -> Optional[Number]:
+        """The current value; None when a function sets it and has nothing to report yet"""
+        if self._function is not None:
+            return self._function()
+        return self._cells.totals()[0]
+
+    def set_function(self, function: Callable[[], Optional[Number]]) -> None:
+        self._function = function
+
+    def samples(self) -> Iterator[Sample]:
+        value = self.value
+        if value is not None:
+            yield "", {}, value
+
+    def reset(self) -> None:
+        self._cells.reset()
+
+    def _after_fork_in_child(self) -> None:
+        self._cells._after_fork_in_child()
+        self.reset()
+
+
+class CounterChild(ValueChild):
+    __slots__ = ()
+
+    def inc(self, amount: Number = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._cells.cell()[0] += amount
+
+
+class GaugeChild(ValueChild):
+    __slots__ = ("_base",)
+
+    def __init__(self):
+        super().__init__()
+        self._base: Number = 0
+
+    @property
+    def value(self) -> Optional[Number]:
+        if self._function is not None:
+            return self._function()
+        return self._base + self._cells.totals()[0]
+
+    def inc(self, amount: Number = 1) -> None:
+        self._cells.cell()[0] += amount
+
+    def dec(self, amount: Number = 1) -> None:
+        self._cells.cell()[0] -= amount
+
+    def set(self, value: Number) -> None:
+        """Set the value outright; increments racing with it from other threads may be lost"""
+        self._cells.reset()
+        self._base = value
+
+    def reset(self) -> None:
+        self.set(0)
+
+
+class HistogramChild:
+    """Cumulative bucket counts and the sum of the observations, the way Prometheus expects them."""
+
+    __slots__ = ("buckets", "_cells")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        # One count per bucket, the overflow (+Inf) bucket, then the sum
+        self._cells = ThreadCells(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    @property
+    def count(self) -> int:
+        return int(sum(self._cells.totals()[:-1]))
+
+    @property
+    def sum(self) -> float:
+        return self._cells.totals()[-1]
+
+    def samples(self) -> Iterator[Sample]:
+        totals = self._cells.totals()
+        cumulative = 0
+        for bound, bucket_count in zip((*self.buckets, math.inf), totals):
+            cumulative += bucket_count
+            yield "_bucket", {"le": format_value(bound)}, cumulative
+        yield "_sum", {}, totals[-1]
+        yield "_count", {}, cumulative
+
+    def reset(self) -> None:
+        self._cells.reset()
+
+    def _after_fork_in_child(self) -> None:
+        self._cells._after_fork_in_child()
+        self.reset()
+
+
+Child = TypeVar("Child", CounterChild, GaugeChild, HistogramChild, WindowedHistogram)
+
+
+class Metric(Generic[Child]):
+    """A metric family: one child per combination of label values."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Child] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: object) -> Child:
+        """The child for these label values, in labelnames order"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._create_child())
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], Child]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def samples(self) -> Iterator[Sample]:
+        for values, child in self.children():
+            labels = dict(zip(self.labelnames, values))
+            for suffix, extra_labels, value in child.samples():
+                yield suffix, (labels | extra_labels) if extra_labels else labels, value
+
+    def reset(self) -> None:
+        # The children stay, with the functions set on them
+        for _, child in self.children():
+            child.reset()
+
+    def _create_child(self) -> Child:
+        raise NotImplementedError
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+        for child in self._children.values():
+            child._after_fork_in_child()
+
+
+class CounterMetric(Metric[CounterChild]):
+    type_name = "counter"
+
+    def inc(self, amount: Number = 1) -> None:
+        self.labels().inc(amount)
+
+    def set_function(self, function: Callable[[], Optional[Number]]) -> None:
+        """Report a total kept elsewhere, read at exposition time"""
+        self.labels().set_function(function)
+
+    def _create_child(self) -> CounterChild:
+        return CounterChild()
+
+
+class GaugeMetric(Metric[GaugeChild]):
+    type_name = "gauge"
+
+    def inc(self, amount: Number = 1) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: Number = 1) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: Number) -> None:
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], Optional[Number]]) -> None:
+        self.labels().set_function(function)
+
+    def _create_child(self) -> GaugeChild:
+        return GaugeChild()
+
+
+class HistogramMetric(Metric[HistogramChild]):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bound for bound in buckets if bound != math.inf))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _create_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+
+class SummaryMetric(Metric[WindowedHistogram]):
+    """Quantiles over a sliding window, from log-linear histograms; _sum and _count cover every observation."""
+
+    type_name = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        slice_seconds: float = 60.0,
+        slices: int = 5,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.quantiles = tuple(quantiles)
+        self.slice_seconds = slice_seconds
+        self.slices = slices
+
+    def record(self, value: float) -> None:
+        self.labels().record(value)
+
+    def samples(self) -> Iterator[Sample]:
+        for values, child in self.children():
+            labels = dict(zip(self.labelnames, values))
+            percentiles = child.percentiles([quantile * 100 for quantile in self.quantiles])
+            for quantile, value in zip(self.quantiles, percentiles):
+                if value is not None:
+                    yield "", labels | {"quantile": format_value(quantile)}, value
+            yield "_sum", labels, child.total_sum
+            yield "_count", labels, child.total_count
+
+    def _create_child(self) -> WindowedHistogram:
+        return WindowedHistogram(self.slice_seconds, self.slices)
+
+
+class MetricsRegistry:
+    """
+    The metrics of this process, by name.
+
+    Recording is cheap enough for the request path: a dict lookup for the labels and a write to the calling
+    thread's own cell. The cost of summing the cells of every thread is paid by the scrape instead.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> CounterMetric:
+        return self._register(CounterMetric, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> GaugeMetric:
+        return self._register(GaugeMetric, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> HistogramMetric:
+        return self._register(HistogramMetric, name, documentation, labelnames, buckets=buckets)
+
+    def summary(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        slice_seconds: float = 60.0,
+        slices: int = 5,
+    ) -> SummaryMetric:
+        return self._register(
+            SummaryMetric, name, documentation, labelnames, quantiles=quantiles, slice_seconds=slice_seconds, slices=slices
+        )
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def expose(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop the recorded values; the metrics stay registered"""
+        for metric in self.metrics():
+            metric.reset()
+
+    def _register(self, metric_type: type[Metric], name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        # Registering the same metric twice returns the existing one, so modules can declare the metrics they feed
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not metric_type or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.type_name} with labels {metric.labelnames}")
+            return metric
+
+    def _after_fork_in_child(self) -> None:
+        # The counts recorded before the fork belong to the parent
+        self._lock = threading.Lock()
+        for metric in self._metrics.values():
+            metric._after_fork_in_child()
+
+
+def escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: Number) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(value)
+
+
+# Process-wide registry, fed by the pipelines and exposed on /metrics
+metrics_registry = MetricsRegistry()
+os.register_at_fork(after_in_child=metrics_registry._after_fork_in_child)
+
+__all__ = [
+    "CounterMetric",
+    "GaugeChild",
+    "GaugeMetric",
+    "HistogramMetric",
+    "SummaryMetric",
+    "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
+    "metrics_registry",
+]
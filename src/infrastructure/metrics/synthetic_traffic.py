@@ -0,0 +1,21 @@
+"""Marks the requests the application sends to itself, such as the startup warm-up, so they stay out of the metrics."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_synthetic: ContextVar[bool] = ContextVar("synthetic_traffic", default=False)
+
+
+@contextmanager
+def synthetic_traffic() -> Iterator[None]:
+    """Mark every request dispatched in this block, and in the tasks and threads it starts, as synthetic."""
+    token = _synthetic.set(True)
+    try:
+        yield
+    finally:
+        _synthetic.reset(token)
+
+
+def is_synthetic_traffic() -> bool:
+    return _synthetic.get()
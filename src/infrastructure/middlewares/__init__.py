@@ -4,8 +4,10 @@ from .inject_dependency_middleware import inject_dependency_middleware
 from .jwt_authentication_middleware import jwt_authentication_middleware
 from .log_class_middleware import LogMiddleware
 from .logger_middleware import logger_middleware
+from .metrics_middleware import metrics_middleware
 from .performance_middleware import performance_middleware
 from .redis_cache_middleware import redis_cache_middleware
+from .request_scope_middleware import request_scope_middleware
 from .request_validation_middleware import request_validation_middleware
 from .session_management_middleware import session_management_middleware
 from .time_class_middleware import TimeMiddleware
@@ -22,8 +24,10 @@ __all__ = [
     "container_builder_middleware",
     "TimeMiddleware",
     "LogMiddleware",
+    "request_scope_middleware",
     "request_validation_middleware",
     "performance_middleware",
+    "metrics_middleware",
     "error_handling_middleware",
     "jwt_authentication_middleware",
     "redis_cache_middleware",
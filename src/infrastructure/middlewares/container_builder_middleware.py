@@ -1,17 +1,57 @@
+import os
+import threading
+import weakref
 from typing import Optional
 
-from injector import Module
+from injector import Injector, Module
 
 from ..decorators.pipeline_decorator import Context, Next
 from ..dependency_injection_configurations import build_di_container
 
 
+class _LazyContainer:
+    """The container of one container_builder_middleware, built by the first request that needs it."""
+
+    def __init__(self, extra_modules: Optional[list[Module]]):
+        self.extra_modules = extra_modules
+        self._container: Optional[Injector] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Injector:
+        container = self._container
+        if container is None:
+            # Concurrent first requests must not build, and connect, two containers
+            with self._lock:
+                if self._container is None:
+                    self._container = build_di_container(self.extra_modules)
+                container = self._container
+        return container
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+        self._container = None
+
+
+_containers: "weakref.WeakSet[_LazyContainer]" = weakref.WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    # A forked worker builds its own container, so it never shares the parent's Redis or database connections
+    for container in list(_containers):
+        container._after_fork_in_child()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 def container_builder_middleware(extra_modules: Optional[list[Module]] = None):
-    container = build_di_container(extra_modules)
+    # Built on first use rather than at import, so importing the pipelines opens no connections
+    container = _LazyContainer(extra_modules)
+    _containers.add(container)
 
     def middleware(context: Context, next: Next):
         if "injector" not in context.kwargs:
-            context.kwargs["injector"] = container
+            context.kwargs["injector"] = container.get()
         return next()
 
     # Set the name dynamically
@@ -1,52 +1,93 @@
 import inspect
+from typing import Any, Callable, Mapping, Optional
 
-from ..decorators.pipeline_decorator import Context, Next
+from injector import Injector
 
+from ..decorators.pipeline_decorator import Context, Next, PlanCache
 
-def inject_dependency_middleware(context: Context, next: Next):
-    func = context.func
-    original_args = context.args
-    original_kwargs = dict(context.kwargs)  # make a copy so we can modify safely
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
 
-    sig = inspect.signature(func)
-    param_names = set(sig.parameters.keys())
 
-    # Grab the injector object if any (from container_builder_middleware)
-    injector_obj = original_kwargs.get("injector", None)
+class DependencyPlan:
+    """
+    The parameters of a target, resolved once per function.
+
+    bind() gives the same arguments as binding the call with `Signature.bind_partial` and `apply_defaults`, then
+    injecting every typed parameter still unfilled, without inspecting the signature on every call.
+    """
 
-    # If the function does NOT declare **kwargs, remove unrecognized keys
-    # so that bind_partial won't complain about an extra param.
-    has_var_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+    __slots__ = ("params", "positional_count", "has_var_positional")
 
-    if not has_var_keyword:
-        # Filter out all kwargs that are not in param_names
-        original_kwargs = {k: v for k, v in original_kwargs.items() if k in param_names}
+    def __init__(self, func: Callable[..., Any]):
+        parameters = inspect.signature(func).parameters.values()
+        self.params = tuple(
+            (param.name, param.kind, param.annotation, param.default)
+            for param in parameters
+            if param.kind is not inspect.Parameter.VAR_KEYWORD
+        )
+        self.positional_count = sum(1 for param in parameters if param.kind in _POSITIONAL_KINDS)
+        self.has_var_positional = any(param.kind is inspect.Parameter.VAR_POSITIONAL for param in parameters)
 
-    # Now bind partial with the safe set of kwargs
-    bound_args = sig.bind_partial(*original_args, **original_kwargs)
-    bound_args.apply_defaults()
+    def bind(self, args: tuple, kwargs: Mapping[str, Any], injector_obj: Optional[Injector]) -> tuple[tuple, dict[str, Any]]:
+        """The positional and keyword arguments of the call, with defaults applied and dependencies injected"""
+        if len(args) > self.positional_count and not self.has_var_positional:
+            raise TypeError("too many positional arguments")
 
-    # For each unfilled parameter with a type annotation, attempt injection
-    for param_name, param in sig.parameters.items():
-        if param_name not in bound_args.arguments:
-            annotated_type = param.annotation
+        bound_args: list[Any] = []
+        bound_kwargs: dict[str, Any] = {}
+        # Like BoundArguments.args, positional parameters go into args until the first one left unfilled
+        positional = True
+        index = 0
+        for name, kind, annotated_type, default in self.params:
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                bound_args.extend(args[index:])
+                index = len(args)
+                positional = False
+                continue
 
-            # If the param is typed, we try to get it from 'injector_obj'
-            if annotated_type != inspect.Parameter.empty:
+            if kind in _POSITIONAL_KINDS and index < len(args):
+                value = args[index]
+                index += 1
+            elif name in kwargs and kind is not inspect.Parameter.POSITIONAL_ONLY:
+                value = kwargs[name]
+            elif default is not inspect.Parameter.empty:
+                value = default
+            elif annotated_type is not inspect.Parameter.empty:
                 if injector_obj is None:
                     # No injector found - user can decide to raise or skip
                     raise RuntimeError(
-                        f"Cannot inject '{param_name}' (type={annotated_type}) "
+                        f"Cannot inject '{name}' (type={annotated_type}) "
                         f"because no injector is available. "
                         "Did you forget to add container_builder_middleware?"
                     )
-                # Attempt to resolve from the injector
-                dependency = injector_obj.get(annotated_type)
-                bound_args.arguments[param_name] = dependency
+                value = injector_obj.get(annotated_type)
+            else:
+                positional = False
+                continue
+
+            if positional and kind in _POSITIONAL_KINDS:
+                bound_args.append(value)
+            else:
+                positional = False
+                bound_kwargs[name] = value
+
+        return tuple(bound_args), bound_kwargs
+
+
+_plans: PlanCache[DependencyPlan] = PlanCache(DependencyPlan)
+
+
+def inject_dependency_middleware(context: Context, next: Next):
+    # Grab the injector object if any (from container_builder_middleware)
+    injector_obj = context.kwargs.get("injector", None)
+
+    args, kwargs = _plans.get(context.func).bind(context.args, context.kwargs, injector_obj)
 
     # Update context with the newly bound arguments
-    context.args = bound_args.args
-    # The right-side dict takes precedence, so existing context kwargs take precedence
-    context.kwargs = bound_args.kwargs | context.kwargs
+    context.args = args
+    # Existing context kwargs take precedence; only the missing values go into the overlay
+    for name, value in kwargs.items():
+        if name not in context.kwargs:
+            context.kwargs[name] = value
 
     return next()
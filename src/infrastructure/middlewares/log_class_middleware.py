@@ -1,3 +1,6 @@
+import inspect
+from typing import Any, Awaitable
+
 from injector import inject
 
 from ..decorators.pipeline_decorator import Context, Next
@@ -12,5 +15,12 @@ class LogMiddleware:
     def __call__(self, context: Context, next: Next):
         self.logger.info(f"[LOGGER] About to call {context.func.__name__} with args={context.args}, kwargs={context.kwargs}")
         result = next()
+        if inspect.isawaitable(result):
+            return self._log_async(result, context)
+        self.logger.info(f"[LOGGER] Finished {context.func.__name__}, result={result}")
+        return result
+
+    async def _log_async(self, result: Awaitable[Any], context: Context):
+        result = await result
         self.logger.info(f"[LOGGER] Finished {context.func.__name__}, result={result}")
         return result
@@ -1,3 +1,6 @@
+import inspect
+from typing import Any, Awaitable
+
 from ..decorators.pipeline_decorator import Context, Next
 from ..logger.logger_strategies.logger_strategy import LoggerStrategy
 
@@ -5,5 +8,13 @@ from ..logger.logger_strategies.logger_strategy import LoggerStrategy
 def logger_middleware(context: Context, next: Next, logger: LoggerStrategy):
     logger.info(f"[LOGGER] About to call {context.func.__name__} with args={context.args}, kwargs={context.kwargs}")
     result = next()
+    if inspect.isawaitable(result):
+        return _log_async(result, context, logger)
+    logger.info(f"[LOGGER] Finished {context.func.__name__}, result={result}")
+    return result
+
+
+async def _log_async(result: Awaitable[Any], context: Context, logger: LoggerStrategy):
+    result = await result
     logger.info(f"[LOGGER] Finished {context.func.__name__}, result={result}")
     return result
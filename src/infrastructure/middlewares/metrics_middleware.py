@@ -0,0 +1,87 @@
+"""Metrics middleware recording per-route request metrics in the metrics registry."""
+
+import inspect
+import time
+from typing import Any, Awaitable, Optional
+
+from ..decorators.pipeline_decorator import Context, Next
+from ..metrics import GaugeChild, is_synthetic_traffic, metrics_registry
+
+REQUESTS = metrics_registry.counter("http_requests_total", "Requests handled, by route and status code", ("route", "status"))
+ERRORS = metrics_registry.counter(
+    "http_request_errors_total", "Requests that raised, ended with a 5xx status or reported one in an error result", ("route",)
+)
+IN_FLIGHT = metrics_registry.gauge("http_requests_in_flight", "Requests being handled", ("route",))
+DURATION = metrics_registry.histogram("http_request_duration_seconds", "Time spent in the pipeline", ("route",))
+APPLICATION_ERRORS = metrics_registry.counter(
+    "http_application_errors_total",
+    "Error results sent with HTTP 200, by route and the status they report",
+    ("route", "app_status"),
+)
+
+
+def metrics_middleware(context: Context, next: Next):
+    """Middleware to count requests by status and record their latency; the route is the target's qualified name."""
+    if is_synthetic_traffic():
+        return next()
+
+    route = context.func.__qualname__
+    in_flight = IN_FLIGHT.labels(route)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        result = next()
+    except Exception:
+        in_flight.dec()
+        _record(route, time.perf_counter() - start, 500)
+        raise
+
+    if inspect.isawaitable(result):
+        return _record_async(result, route, start, in_flight)
+
+    in_flight.dec()
+    _record(route, time.perf_counter() - start, response_status(result), application_status(result))
+    return result
+
+
+async def _record_async(result: Awaitable[Any], route: str, start: float, in_flight: GaugeChild):
+    try:
+        result = await result
+    except Exception:
+        _record(route, time.perf_counter() - start, 500)
+        raise
+    finally:
+        in_flight.dec()
+    _record(route, time.perf_counter() - start, response_status(result), application_status(result))
+    return result
+
+
+def _record(route: str, elapsed: float, status: int, app_status: Optional[int] = None) -> None:
+    DURATION.labels(route).observe(elapsed)
+    REQUESTS.labels(route, status).inc()
+    # error_handling_middleware runs inside this one and turns exceptions into error results reporting a 500
+    if status >= 500 or (app_status is not None and app_status >= 500):
+        ERRORS.labels(route).inc()
+    if app_status is not None:
+        APPLICATION_ERRORS.labels(route, app_status).inc()
+
+
+def response_status(result: Any) -> int:
+    """The HTTP status code the web app sends for a handler result: a response object or a (body, status) tuple."""
+    if isinstance(result, tuple) and len(result) > 1 and isinstance(result[1], int):
+        return result[1]
+    status_code = getattr(result, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    return 200
+
+
+def application_status(result: Any) -> Optional[int]:
+    """The status an error dict reports, if the result is one.
+
+    error_handling_middleware and jwt_authentication_middleware report errors as {"error": ..., "status": ...}, which
+    every web app sends as the body of a 200.
+    """
+    if isinstance(result, dict) and isinstance(result.get("status"), int):
+        return result["status"]
+    return None
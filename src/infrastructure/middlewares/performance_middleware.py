@@ -1,49 +1,64 @@
 """Performance monitoring middleware for detailed performance tracking."""
 
+import inspect
 import time
-
-import psutil
+from typing import Any, Awaitable, Optional
 
 from ..decorators.pipeline_decorator import Context, Next
 from ..logger.logger_strategies.logger_strategy import LoggerStrategy
+from ..models.settings import Settings
 
 
-def performance_middleware(context: Context, next: Next, logger: LoggerStrategy):
-    """Middleware to track detailed performance metrics."""
+def performance_middleware(context: Context, next: Next, logger: LoggerStrategy, settings: Settings):
+    """Middleware to track the wall-clock time, and optionally the CPU time, of every call.
 
-    # Record start time and system metrics
-    start_time = time.time()
-    start_cpu = psutil.cpu_percent(interval=None)
-    start_memory = psutil.virtual_memory().percent
+    Process-wide resource usage (RSS, CPU, threads, GC) is sampled in the background by process_sampler instead.
+    """
 
-    logger.info(f"[PERFORMANCE] Starting {context.func.__name__}")
-    logger.info(f"[PERFORMANCE] Initial CPU: {start_cpu}%, Memory: {start_memory}%")
+    start_time = time.perf_counter()
+    # CPU time of this thread only; it leaves out what other requests use meanwhile
+    start_cpu = time.thread_time() if settings.request_cpu_time else None
 
     try:
         # Process the request
         result = next()
 
-        # Record end time and system metrics
-        end_time = time.time()
-        end_cpu = psutil.cpu_percent(interval=None)
-        end_memory = psutil.virtual_memory().percent
-
-        # Calculate metrics
-        execution_time = end_time - start_time
-        cpu_delta = end_cpu - start_cpu
-        memory_delta = end_memory - start_memory
+        # In an async pipeline the downstream stages only run once the result is awaited
+        if inspect.isawaitable(result):
+            return _track_async(result, context, logger, start_time)
 
-        # Log performance metrics
-        logger.info(f"[PERFORMANCE] Completed {context.func.__name__}")
-        logger.info(f"[PERFORMANCE] Execution time: {execution_time:.4f}s")
-        logger.info(f"[PERFORMANCE] CPU change: {cpu_delta:+.2f}%")
-        logger.info(f"[PERFORMANCE] Memory change: {memory_delta:+.2f}%")
+        _log_completion(context, logger, start_time, start_cpu)
 
         return result
 
     except Exception as e:
-        # Log error with performance context
-        end_time = time.time()
-        execution_time = end_time - start_time
-        logger.error(f"[PERFORMANCE] Error in {context.func.__name__} after {execution_time:.4f}s: {str(e)}")
+        _log_failure(e, context, logger, start_time)
+        raise
+
+
+async def _track_async(result: Awaitable[Any], context: Context, logger: LoggerStrategy, start_time: float):
+    """Await the downstream result and log its wall-clock time; the event loop thread runs other requests meanwhile,
+    so its CPU time says nothing about this one."""
+    try:
+        result = await result
+        _log_completion(context, logger, start_time, None)
+        return result
+    except Exception as e:
+        _log_failure(e, context, logger, start_time)
         raise
+
+
+def _log_completion(context: Context, logger: LoggerStrategy, start_time: float, start_cpu: Optional[float]):
+    """Log performance metrics for a completed call."""
+    execution_time = time.perf_counter() - start_time
+    if start_cpu is None:
+        logger.info(f"[PERFORMANCE] Completed {context.func.__name__} in {execution_time:.4f}s")
+    else:
+        cpu_time = time.thread_time() - start_cpu
+        logger.info(f"[PERFORMANCE] Completed {context.func.__name__} in {execution_time:.4f}s, CPU {cpu_time:.4f}s")
+
+
+def _log_failure(e: Exception, context: Context, logger: LoggerStrategy, start_time: float):
+    """Log error with performance context."""
+    execution_time = time.perf_counter() - start_time
+    logger.error(f"[PERFORMANCE] Error in {context.func.__name__} after {execution_time:.4f}s: {str(e)}")
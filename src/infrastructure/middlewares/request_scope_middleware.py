@@ -0,0 +1,39 @@
+"""Request scope middleware: one DI request scope per pipeline invocation."""
+
+import inspect
+from contextlib import AbstractContextManager
+from typing import Any, Awaitable
+
+from ..decorators.pipeline_decorator import Context, Next
+from ..dependency_injection_configurations.request_scope import open_request_scope
+
+
+def request_scope_middleware(context: Context, next: Next):
+    """Open a request scope around the downstream stages, closing request scoped instances when they finish."""
+    request_scope = open_request_scope()
+    request_scope.__enter__()
+
+    try:
+        result = next()
+    except BaseException as e:
+        request_scope.__exit__(type(e), e, e.__traceback__)
+        raise
+
+    # In an async pipeline the downstream stages only run once the result is awaited
+    if inspect.isawaitable(result):
+        return _close_async(result, request_scope)
+
+    request_scope.__exit__(None, None, None)
+    return result
+
+
+async def _close_async(result: Awaitable[Any], request_scope: AbstractContextManager):
+    """Await the downstream result before closing the request scope."""
+    try:
+        result = await result
+    except BaseException as e:
+        request_scope.__exit__(type(e), e, e.__traceback__)
+        raise
+
+    request_scope.__exit__(None, None, None)
+    return result
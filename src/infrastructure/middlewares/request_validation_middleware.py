@@ -1,5 +1,8 @@
 """Request validation middleware for HTTP requests."""
 
+import inspect
+from typing import Any, Awaitable
+
 from ..decorators.pipeline_decorator import Context, Next
 from ..logger.logger_strategies.logger_strategy import LoggerStrategy
 
@@ -22,8 +25,17 @@ def request_validation_middleware(context: Context, next: Next, logger: LoggerSt
 
     # Process the request
     result = next()
+    if inspect.isawaitable(result):
+        return _complete_async(result, context, logger)
 
     # Log response information
     logger.info(f"[REQUEST_VALIDATION] Completed {context.func.__name__}")
 
     return result
+
+
+async def _complete_async(result: Awaitable[Any], context: Context, logger: LoggerStrategy):
+    """Await the downstream result before logging completion."""
+    result = await result
+    logger.info(f"[REQUEST_VALIDATION] Completed {context.func.__name__}")
+    return result
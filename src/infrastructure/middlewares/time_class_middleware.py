@@ -1,20 +1,29 @@
-from time import time
-
-from injector import inject
+import inspect
+from time import perf_counter
+from typing import Any, Awaitable
 
 from ..decorators.pipeline_decorator import Context, Next
-from ..logger.logger_strategies.logger_strategy import LoggerStrategy
+from ..metrics import is_synthetic_traffic
+from .time_middleware import PIPELINE_LATENCY
 
 
 class TimeMiddleware:
-    @inject
-    def __init__(self, logger: LoggerStrategy):
-        self.logger = logger
-
     def __call__(self, context: Context, next: Next):
-        start = time()
-        self.logger.info("[TIME] Start timing...")
-        result = next()
-        elapsed = time() - start
-        self.logger.info(f"[TIME] {context.func.__name__} took {elapsed:.4f}s")
+        if is_synthetic_traffic():
+            return next()
+        start = perf_counter()
+        try:
+            result = next()
+        except Exception:
+            PIPELINE_LATENCY.labels(context.func.__qualname__).record(perf_counter() - start)
+            raise
+        if inspect.isawaitable(result):
+            return self._time_async(result, start, context)
+        PIPELINE_LATENCY.labels(context.func.__qualname__).record(perf_counter() - start)
         return result
+
+    async def _time_async(self, result: Awaitable[Any], start: float, context: Context):
+        try:
+            return await result
+        finally:
+            PIPELINE_LATENCY.labels(context.func.__qualname__).record(perf_counter() - start)
@@ -1,13 +1,32 @@
+import inspect
 import time
+from typing import Any, Awaitable
 
 from ..decorators import Context, Next
-from ..logger.logger_strategies.logger_strategy import LoggerStrategy
+from ..metrics import is_synthetic_traffic, metrics_registry
 
+PIPELINE_LATENCY = metrics_registry.summary(
+    "pipeline_latency_seconds", "Time spent in the pipeline, as percentiles over the last 5 minutes", ("route",)
+)
 
-def time_middleware(context: Context, next: Next, logger: LoggerStrategy):
-    start = time.time()
-    logger.info("[TIME] Start timing...")
-    result = next()
-    elapsed = time.time() - start
-    logger.info(f"[TIME] {context.func.__name__} took {elapsed:.4f}s")
+
+def time_middleware(context: Context, next: Next):
+    if is_synthetic_traffic():
+        return next()
+    start = time.perf_counter()
+    try:
+        result = next()
+    except Exception:
+        PIPELINE_LATENCY.labels(context.func.__qualname__).record(time.perf_counter() - start)
+        raise
+    if inspect.isawaitable(result):
+        return _time_async(result, start, context)
+    PIPELINE_LATENCY.labels(context.func.__qualname__).record(time.perf_counter() - start)
     return result
+
+
+async def _time_async(result: Awaitable[Any], start: float, context: Context):
+    try:
+        return await result
+    finally:
+        PIPELINE_LATENCY.labels(context.func.__qualname__).record(time.perf_counter() - start)
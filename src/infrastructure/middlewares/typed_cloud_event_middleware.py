@@ -1,13 +1,14 @@
 import inspect
 
-from cloudevents.http import CloudEvent, from_http
-from flask import Request, Response, make_response
-
 from ..decorators.pipeline_decorator import Context, Next
 
 
 def typed_cloud_event_middleware(context: Context, next: Next):
     """Middleware that handles both CloudEvent and typed model input."""
+    # Only Cloud Functions style handlers use this middleware, so their dependencies are imported on use
+    from cloudevents.http import CloudEvent, from_http
+    from flask import Request, Response, make_response
+
     func = context.func
     args = context.args
 
@@ -1,13 +1,38 @@
 import inspect
-from typing import Any, Dict
+import json
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from fastapi import Request as FastAPIRequest
-from flask import Request as FlaskRequest
+from ..decorators.pipeline_decorator import Context, Next, PlanCache
+from ..web_apps.asgi_request import AsgiRequest
 
-from ..decorators.pipeline_decorator import Context, Next
+if TYPE_CHECKING:
+    from fastapi import Request as FastAPIRequest
+    from flask import Request as FlaskRequest
 
 
-def _extract_flask_request_data(request: FlaskRequest) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+def _loaded_request_type(module_name: str) -> Optional[type]:
+    """Request class of a web framework, if that framework has been imported; a request can't come from one that wasn't"""
+    module = sys.modules.get(module_name)
+    return getattr(module, "Request", None) if module is not None else None
+
+
+def _is_flask_request(request: Any) -> bool:
+    request_type = _loaded_request_type("flask")
+    return request_type is not None and isinstance(request, request_type)
+
+
+def _is_fastapi_request(request: Any) -> bool:
+    # fastapi.Request is Starlette's request class
+    request_type = _loaded_request_type("starlette.requests")
+    return request_type is not None and isinstance(request, request_type)
+
+
+def _is_asgi_request(request: Any) -> bool:
+    return isinstance(request, AsgiRequest)
+
+
+def _extract_flask_request_data(request: "FlaskRequest") -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
     """Extract JSON, query, and header data from Flask request"""
     json_data = request.get_json(silent=True) or {}
     query_data = dict(request.args)
@@ -15,7 +40,15 @@ def _extract_flask_request_data(request: FlaskRequest) -> tuple[Dict[str, Any],
     return json_data, query_data, header_data
 
 
-def _extract_fastapi_request_data(request: FastAPIRequest) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+def _extract_asgi_request_data(request: AsgiRequest) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Extract JSON and query data from the raw ASGI request"""
+    json_data = request.get_json(silent=True) or {}
+    query_data = dict(request.args)
+    header_data: Dict[str, Any] = {}
+    return json_data, query_data, header_data
+
+
+def _extract_fastapi_request_data(request: "FastAPIRequest") -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
     """Extract JSON, query, and header data from FastAPI request"""
     json_data: Dict[str, Any] = {}
     query_data: Dict[str, Any] = {}
@@ -39,8 +72,16 @@ def _extract_fastapi_request_data(request: FastAPIRequest) -> tuple[Dict[str, An
     return json_data, query_data, header_data
 
 
-def _extract_json_from_fastapi_request(request: FastAPIRequest) -> Dict[str, Any]:
+def _extract_json_from_fastapi_request(request: "FastAPIRequest") -> Dict[str, Any]:
     """Extract JSON data from FastAPI request body"""
+    # FastAPIWebApp reads the body on the event loop before dispatching, so prefer the cached bytes
+    cached_body = getattr(request, "_body", None)
+    if isinstance(cached_body, bytes):
+        try:
+            return json.loads(cached_body) if cached_body else {}
+        except ValueError:
+            return {}
+
     # Try to get JSON from request body
     if hasattr(request, "body") and callable(getattr(request, "body")):
         try:
@@ -55,8 +96,6 @@ def _extract_json_from_fastapi_request(request: FastAPIRequest) -> Dict[str, Any
 
             # Parse body data if it exists
             if parsed_body_data:
-                import json
-
                 if isinstance(parsed_body_data, bytes):
                     return json.loads(parsed_body_data.decode("utf-8"))
                 elif isinstance(parsed_body_data, str):
@@ -87,11 +126,25 @@ def _extract_json_from_fastapi_request(request: FastAPIRequest) -> Dict[str, Any
     return {}
 
 
+def _extract_raw_json_body(request) -> Optional[bytes]:
+    """The raw request body when it alone makes up the typed request, or None when there are query parameters to merge"""
+    if _is_asgi_request(request):
+        return None if request.scope.get("query_string") else request.body
+    elif _is_flask_request(request):
+        return None if request.args else request.get_data(cache=True)
+    elif _is_fastapi_request(request):
+        cached_body = getattr(request, "_body", None)
+        return None if request.query_params or not isinstance(cached_body, bytes) else cached_body
+    return None
+
+
 def _extract_request_data(request) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
     """Extract request data based on request type"""
-    if isinstance(request, FlaskRequest):
+    if _is_asgi_request(request):
+        return _extract_asgi_request_data(request)
+    elif _is_flask_request(request):
         return _extract_flask_request_data(request)
-    elif isinstance(request, FastAPIRequest):
+    elif _is_fastapi_request(request):
         return _extract_fastapi_request_data(request)
     else:
         raise TypeError(f"Unsupported request type: {type(request)}")
@@ -155,10 +208,10 @@ def _validate_and_extract_request(maybe_request, annotated_type):
         return None  # Signal to pass through
 
     # If it's not a Request type, raise error immediately
-    if not isinstance(maybe_request, (FlaskRequest, FastAPIRequest)):
+    if not (_is_asgi_request(maybe_request) or _is_flask_request(maybe_request) or _is_fastapi_request(maybe_request)):
         raise TypeError(
             f"Expected first argument to be either {annotated_type.__name__} "
-            f"or Flask/FastAPI Request, but got {type(maybe_request)}"
+            f"or Flask/FastAPI/ASGI Request, but got {type(maybe_request)}"
         )
 
     # Extract request data using the encapsulated methods
@@ -179,49 +232,69 @@ def _validate_and_extract_request(maybe_request, annotated_type):
     return json_data, query_data, header_data
 
 
-def typed_request_middleware(context: Context, next: Next):
-    """Middleware that handles both Flask Request and typed model input."""
-    func = context.func
-    args = context.args
+class TypedRequestPlan:
+    """Where the request argument of a target is and what it converts to, resolved once per function."""
+
+    __slots__ = ("is_class_method", "annotated_type", "parses_json")
+
+    def __init__(self, func):
+        # 1. Get function signature info
+        parameters = list(inspect.signature(func).parameters.values())
+        if not parameters:
+            raise TypeError(f"Function {func.__name__} has no parameters. Cannot infer typed request parameter.")
+
+        # 2. Detect if this is a class method and determine the first non-self parameter
+        self.is_class_method, first_typed_param = _detect_class_method_and_first_param(func, parameters)
 
-    # 1. Get function signature info
-    sig = inspect.signature(func)
-    parameters = list(sig.parameters.values())
-    if not parameters:
-        raise TypeError(f"Function {func.__name__} has no parameters. Cannot infer typed request parameter.")
+        # Ensure we found a valid parameter
+        if first_typed_param is None:
+            raise TypeError(f"Function {func.__name__} has no valid parameters to process.")
 
-    # 2. Detect if this is a class method and determine the first non-self parameter
-    is_class_method, first_typed_param = _detect_class_method_and_first_param(func, parameters)
+        # 3. Type annotation of the first typed parameter; without one the target needs no typed request conversion
+        annotation = first_typed_param.annotation
+        self.annotated_type = None if annotation is inspect.Parameter.empty else annotation
+        self.parses_json = hasattr(annotation, "from_json")
 
-    # Ensure we found a valid parameter
-    if first_typed_param is None:
-        raise TypeError(f"Function {func.__name__} has no valid parameters to process.")
 
-    # 3. Check type annotation of the first typed parameter
-    annotated_type = first_typed_param.annotation
-    if annotated_type is inspect._empty:
-        # If no type annotation, skip processing - this method doesn't need typed request conversion
+_plans: PlanCache[TypedRequestPlan] = PlanCache(TypedRequestPlan)
+
+
+def typed_request_middleware(context: Context, next: Next):
+    """Middleware that handles both Flask Request and typed model input."""
+    args = context.args
+
+    # Steps 1 to 3 only depend on the function, see TypedRequestPlan
+    plan = _plans.get(context.func)
+    annotated_type = plan.annotated_type
+    if annotated_type is None:
         return next()
+    is_class_method = plan.is_class_method
 
     # 4. Get request argument at runtime
     maybe_request = _get_request_argument(args, is_class_method)
 
-    # 5. Validate and extract request data
-    result = _validate_and_extract_request(maybe_request, annotated_type)
+    # 5. Types with a `from_json` parse the raw body themselves (e.g. pydantic's model_validate_json), without the
+    #    intermediate dict; the dict path is kept for types without it and for requests with query parameters
+    raw_body = _extract_raw_json_body(maybe_request) if plan.parses_json else None
+    if raw_body is not None:
+        typed_obj = annotated_type.from_json(raw_body or b"{}")
+    else:
+        # 6. Validate and extract request data
+        result = _validate_and_extract_request(maybe_request, annotated_type)
 
-    # If result is None, it means we should pass through (already correct type)
-    if result is None:
-        return next()
+        # If result is None, it means we should pass through (already correct type)
+        if result is None:
+            return next()
 
-    # Otherwise, we have extracted data to work with
-    json_data, query_data, header_data = result
+        # Otherwise, we have extracted data to work with
+        json_data, query_data, header_data = result
 
-    merged_data = {**json_data, **query_data, **header_data}
+        merged_data = {**json_data, **query_data, **header_data}
 
-    # Convert to typed object
-    if not hasattr(annotated_type, "from_dict"):
-        raise AttributeError(f"Type '{annotated_type.__name__}' does not have a 'from_dict' method.")
-    typed_obj = annotated_type.from_dict(merged_data)
+        # Convert to typed object
+        if not hasattr(annotated_type, "from_dict"):
+            raise AttributeError(f"Type '{annotated_type.__name__}' does not have a 'from_dict' method.")
+        typed_obj = annotated_type.from_dict(merged_data)
 
     # Replace the request argument (preserve 'self' for class methods)
     if is_class_method:
@@ -1,13 +1,15 @@
 from datetime import datetime
-from typing import Generic
+from typing import TYPE_CHECKING, Generic
 
-from cloudevents.http import CloudEvent
 from pydantic import BaseModel
 
 from .gcp_pub_sub_event_data import GcpPubSubEventData
 from .gcp_pub_sub_event_type import GcpPubSubEventType
 from .gcp_pub_sub_message import GcpPubSubMessage, TGcpPubSubMessageData
 
+if TYPE_CHECKING:
+    from cloudevents.http import CloudEvent
+
 
 class GcpPubSubCloudEvent(BaseModel, Generic[TGcpPubSubMessageData]):
     specversion: str | None = None
@@ -20,7 +22,7 @@ class GcpPubSubCloudEvent(BaseModel, Generic[TGcpPubSubMessageData]):
     subject: str | None = None
 
     @classmethod
-    def from_cloud_event(cls, cloud_event: CloudEvent):
+    def from_cloud_event(cls, cloud_event: "CloudEvent"):
         message_data = cloud_event.data.get("message", {})
 
         message = GcpPubSubMessage.model_validate(message_data)
@@ -1,9 +1,13 @@
-from cloudevents.http import CloudEvent
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
 
 from .gcs_event_data import GCSEventData
 from .gcs_event_type import GCSEventType
 
+if TYPE_CHECKING:
+    from cloudevents.http import CloudEvent
+
 
 class GCSCloudEvent(BaseModel):
     id: str
@@ -11,5 +15,5 @@ class GCSCloudEvent(BaseModel):
     data: GCSEventData
 
     @classmethod
-    def from_cloud_event(cls, cloud_event: CloudEvent):
+    def from_cloud_event(cls, cloud_event: "CloudEvent"):
         return cls(id=cloud_event["id"], type=cloud_event["type"], data=GCSEventData.model_validate(cloud_event.data))
@@ -1,6 +1,19 @@
 from .basic_settings import BasicSettings
+from .compression_settings import CompressionSettings
 from .environment import Environment
+from .pipeline_settings import PipelineSettings, RoutePipelineSettings
+from .server_settings import ServerSettings
 from .settings import Settings
 from .settings_loader import load_settings_from_development_yml, load_settings_with_fallback
 
-__all__ = ["Settings", "Environment", "BasicSettings", "load_settings_from_development_yml", "load_settings_with_fallback"]
+__all__ = [
+    "Settings",
+    "Environment",
+    "BasicSettings",
+    "CompressionSettings",
+    "PipelineSettings",
+    "RoutePipelineSettings",
+    "ServerSettings",
+    "load_settings_from_development_yml",
+    "load_settings_with_fallback",
+]
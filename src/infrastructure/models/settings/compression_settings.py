@@ -0,0 +1,41 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CompressionSettings(BaseModel):
+    """Negotiated gzip/deflate compression of response bodies.
+
+    Bodies smaller than `minimum_size` are sent as they are. Bodies up to `streaming_threshold` are compressed in one
+    piece and keep a Content-Length; larger or streamed bodies are compressed chunk by chunk without one.
+    """
+
+    enabled: bool = False
+    # Server preference when the client accepts several encodings with the same quality
+    encodings: tuple[Literal["gzip", "deflate"], ...] = ("gzip", "deflate")
+    level: int = Field(default=6, ge=1, le=9)
+    minimum_size: int = Field(default=500, ge=0)
+    streaming_threshold: int = Field(default=256 * 1024, ge=0)
+    # Media types (or prefixes ending in "/") that are already compressed and would only grow
+    excluded_content_types: tuple[str, ...] = (
+        "image/png",
+        "image/jpeg",
+        "image/gif",
+        "image/webp",
+        "image/avif",
+        "video/",
+        "audio/",
+        "font/woff",
+        "font/woff2",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/x-bzip2",
+        "application/x-xz",
+        "application/x-7z-compressed",
+        "application/zstd",
+        "application/pdf",
+        "application/octet-stream",
+    )
+
+    model_config = ConfigDict(frozen=True)
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class RoutePipelineSettings(BaseModel):
+    """Middleware selection for a pipeline; `middlewares` replaces the default list, `disabled_middlewares` removes from it."""
+
+    middlewares: Optional[list[str]] = None
+    disabled_middlewares: list[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PipelineSettings(RoutePipelineSettings):
+    """Middleware selection for a named pipeline, with overrides per route (the handler's qualified name)."""
+
+    routes: dict[str, RoutePipelineSettings] = Field(default_factory=dict)
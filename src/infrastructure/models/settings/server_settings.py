@@ -0,0 +1,41 @@
+import random
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ServerSettings(BaseModel):
+    """How the web server runs.
+
+    `development` runs the framework's own server in a single process. `production` (or more than one worker)
+    runs a pre-fork master with forked workers, each serving with a thread pool (Flask) or an event loop (FastAPI).
+    """
+
+    mode: Literal["development", "production"] = "development"
+    workers: int = Field(default=1, ge=1)
+    # Request threads per worker; for FastAPI, the executor that runs synchronous handlers
+    threads: int = Field(default=8, ge=1)
+    # Requests waiting for a handler thread beyond which new ones get a 503 with Retry-After (FastAPI)
+    max_queue: int = Field(default=64, ge=0)
+    retry_after: int = Field(default=1, ge=0)
+    backlog: int = Field(default=2048, ge=1)
+    # Seconds an idle keep-alive connection is held open (uvicorn; Werkzeug closes every connection after its response)
+    keep_alive: int = Field(default=5, ge=0)
+    # Recycle a worker after this many requests (0 never recycles); the jitter keeps workers from restarting together
+    max_requests: int = Field(default=0, ge=0)
+    max_requests_jitter: int = Field(default=0, ge=0)
+    # uvicorn event loop and HTTP parser; "auto" uses uvloop and httptools when they are installed
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def prefork(self) -> bool:
+        return self.mode == "production" or self.workers > 1
+
+    def worker_max_requests(self) -> int:
+        """The request limit for one worker, with jitter applied; 0 means no limit."""
+        if not self.max_requests:
+            return 0
+        return self.max_requests + random.randint(0, self.max_requests_jitter)
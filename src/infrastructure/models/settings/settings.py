@@ -1,8 +1,13 @@
-from pydantic import BaseModel, ConfigDict
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from domain import GreetingLanguage, GreetingType
 
 from . import Environment
+from .compression_settings import CompressionSettings
+from .pipeline_settings import PipelineSettings
+from .server_settings import ServerSettings
 
 
 class Settings(BaseModel):
@@ -11,6 +16,8 @@ class Settings(BaseModel):
     greeting_type: GreetingType
     greeting_language: GreetingLanguage
     web_framework: str
+    # JSON library for request bodies and responses; "auto" uses orjson when it is installed
+    json_codec: Literal["auto", "json", "orjson"] = "auto"
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
@@ -27,8 +34,23 @@ class Settings(BaseModel):
     jwt_secret: str = "your-super-secret-jwt-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiry_hours: int = 24
+    pipeline_profiling: bool = False
+    # Seconds between two samples of the process RSS, CPU time, threads and GC stats (0 disables the sampler)
+    process_metrics_interval: float = Field(default=5.0, ge=0)
+    # Also measure the CPU time of every synchronous request, with time.thread_time
+    request_cpu_time: bool = False
+    startup_warmup: bool = True
+    # GET routes the warm-up requests once at startup; list only routes without side effects or authentication
+    warmup_paths: list[str] = ["/health"]
+    # Seconds between two version checks of a remote configuration source (0 disables them); files are not polled
+    config_refresh_interval: float = Field(default=30.0, ge=0)
+    # Seconds between two background runs of the readiness checks (Redis, database, configuration)
+    health_check_interval: float = Field(default=10.0, gt=0)
+    server: ServerSettings = ServerSettings()
+    compression: CompressionSettings = CompressionSettings()
+    pipelines: dict[str, PipelineSettings] = {}
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     def to_dict(self) -> dict:
         # The typed decorator will call this to serialize the response
@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 
+from injector import inject
 from sqlalchemy.orm import Session
 
 from ..models.database.organization_model import Organization
@@ -11,6 +12,7 @@ from .base_repository import BaseRepository
 class OrganizationRepository(BaseRepository[Organization]):
     """Repository for Organization model operations."""
 
+    @inject
     def __init__(self, db_session: Session):
         super().__init__(Organization, db_session)
 
@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 
+from injector import inject
 from sqlalchemy.orm import Session
 
 from ..models.database.user_model import User
@@ -11,6 +12,7 @@ from .base_repository import BaseRepository
 class UserRepository(BaseRepository[User]):
     """Repository for User model operations."""
 
+    @inject
     def __init__(self, db_session: Session):
         super().__init__(User, db_session)
 
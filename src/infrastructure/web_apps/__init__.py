@@ -1,5 +1,27 @@
+from .asgi_request import AsgiHeaders, AsgiRequest
+from .asgi_web_app import AsgiResponse, AsgiWebApp
+from .bounded_executor import BoundedExecutor
+from .etag import BodySizes, etag_matches, make_etag
 from .fastapi_web_app import FastAPIWebApp
 from .flask_web_app import FlaskWebApp
+from .json_codec import JsonCodec, OrjsonCodec, create_json_codec
+from .prefork_server import PreforkServer
 from .web_app_interface import WebAppInterface
 
-__all__ = ["FastAPIWebApp", "FlaskWebApp", "WebAppInterface"]
+__all__ = [
+    "AsgiHeaders",
+    "AsgiRequest",
+    "AsgiResponse",
+    "AsgiWebApp",
+    "BoundedExecutor",
+    "FastAPIWebApp",
+    "FlaskWebApp",
+    "JsonCodec",
+    "OrjsonCodec",
+    "PreforkServer",
+    "WebAppInterface",
+    "create_json_codec",
+    "BodySizes",
+    "etag_matches",
+    "make_etag",
+]
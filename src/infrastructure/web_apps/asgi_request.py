@@ -0,0 +1,80 @@
+from typing import Any, Iterator, Mapping, Optional
+from urllib.parse import parse_qsl
+
+from .json_codec import JsonCodec
+
+
+class AsgiHeaders(Mapping[str, str]):
+    """Request headers with case-insensitive lookup; repeated headers are joined with a comma."""
+
+    __slots__ = ("_headers",)
+
+    def __init__(self, raw_headers: list[tuple[bytes, bytes]]):
+        headers: dict[str, str] = {}
+        for raw_name, raw_value in raw_headers:
+            # ASGI servers send header names lower-cased
+            name, value = raw_name.decode("latin-1"), raw_value.decode("latin-1")
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        self._headers = headers
+
+    def __getitem__(self, name: str) -> str:
+        return self._headers[name.lower()]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._headers.get(name.lower(), default)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._headers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+
+class AsgiRequest:
+    """The parts of an HTTP request the pipeline uses, read straight from the ASGI scope and the raw body bytes."""
+
+    __slots__ = ("scope", "method", "path", "headers", "body", "json_codec", "_args")
+
+    def __init__(self, scope: dict[str, Any], body: bytes, json_codec: JsonCodec = JsonCodec()):
+        self.scope = scope
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.headers = AsgiHeaders(scope["headers"])
+        self.body = body
+        self.json_codec = json_codec
+        self._args: Optional[dict[str, str]] = None
+
+    @property
+    def args(self) -> dict[str, str]:
+        """Query parameters, first value wins (like Flask's request.args.get)."""
+        if self._args is None:
+            args: dict[str, str] = {}
+            for name, value in parse_qsl(self.scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True):
+                args.setdefault(name, value)
+            self._args = args
+        return self._args
+
+    @property
+    def url(self) -> str:
+        scheme = self.scope.get("scheme", "http")
+        host = self.headers.get("host")
+        if host is None and self.scope.get("server"):
+            host = "{}:{}".format(*self.scope["server"])
+        query_string = self.scope.get("query_string", b"")
+        return f"{scheme}://{host or ''}{self.path}" + (f"?{query_string.decode('latin-1')}" if query_string else "")
+
+    def get_data(self) -> bytes:
+        return self.body
+
+    def get_json(self, silent: bool = False) -> Any:
+        if not self.body:
+            return None
+        try:
+            return self.json_codec.loads(self.body)
+        except ValueError:
+            if silent:
+                return None
+            raise
@@ -0,0 +1,275 @@
+import asyncio
+import inspect
+import logging
+import queue
+import socket
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..models.settings import CompressionSettings, ServerSettings
+from .asgi_request import AsgiRequest
+from .bounded_executor import BoundedExecutor
+from .compression import compress, compressed_headers, negotiate_encoding, should_compress
+from .etag import BodySizes
+from .json_codec import JsonCodec
+from .uvicorn_server import serve_with_uvicorn
+from .web_app_interface import WebAppInterface
+
+logger = logging.getLogger(__name__)
+
+Endpoint = Callable[[AsgiRequest], Awaitable["AsgiResponse"]]
+
+# Responses that must not carry a Content-Length (RFC 9110 8.6); a 304 could only repeat the one of the full response
+BODILESS_STATUSES = frozenset({204, 304})
+
+
+class AsgiResponse:
+    """A complete HTTP response: status, body bytes and extra headers."""
+
+    __slots__ = ("body", "status_code", "content_type", "headers")
+
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        content_type: bytes = b"application/json",
+        headers: Optional[list[tuple[bytes, bytes]]] = None,
+    ):
+        self.body = body
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = headers or []
+
+    @classmethod
+    def from_result(cls, result: Any, json_codec: JsonCodec) -> "AsgiResponse":
+        """Turn whatever a handler returned into a response, like Flask and FastAPI do for their handlers."""
+        if isinstance(result, AsgiResponse):
+            return result
+        if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], int):
+            response = cls.from_result(result[0], json_codec)
+            response.status_code = result[1]
+            return response
+        if result is None:
+            return cls(b"", 204)
+        if isinstance(result, BaseModel):
+            return cls(json_codec.encode(result))
+        if hasattr(result, "to_dict") and callable(result.to_dict):
+            return cls(json_codec.encode(result.to_dict()))
+        if isinstance(result, (bytes, bytearray)):
+            return cls(bytes(result), content_type=b"application/octet-stream")
+        if isinstance(result, str):
+            return cls(result.encode("utf-8"), content_type=b"text/plain; charset=utf-8")
+        return cls(json_codec.encode(result))
+
+
+class AsgiWebApp(WebAppInterface):
+    """Minimal ASGI implementation of the WebAppInterface.
+
+    Requests are dispatched through a (method, path) table built by add_route, and handlers receive an AsgiRequest
+    holding the raw headers and body bytes; there is no framework routing, dependency or validation layer in between,
+    typed parsing is left to typed_request_middleware. Paths are matched exactly, without path parameters.
+    """
+
+    def __init__(
+        self,
+        server_settings: ServerSettings = ServerSettings(),
+        json_codec: JsonCodec = JsonCodec(),
+        compression: CompressionSettings = CompressionSettings(),
+    ):
+        self.json_codec = json_codec
+        self.compression = compression
+        self.body_sizes = BodySizes()
+        self.routes: dict[tuple[str, str], Endpoint] = {}
+        self.allowed_methods: dict[str, list[str]] = {}
+        # Synchronous handlers run on a pool with a bounded queue; when it is full, requests get a 503 right away
+        self.executor = BoundedExecutor(server_settings.threads, server_settings.max_queue, thread_name_prefix="sync-handler")
+        self.retry_after = server_settings.retry_after
+
+    def add_route(self, path: str, methods: list[str], handler: Callable) -> None:
+        """Add a route to the dispatch table"""
+        if inspect.iscoroutinefunction(handler):
+
+            async def endpoint(request: AsgiRequest) -> AsgiResponse:
+                return AsgiResponse.from_result(await handler(request), self.json_codec)
+
+        else:
+
+            async def endpoint(request: AsgiRequest) -> AsgiResponse:
+                try:
+                    future = self.executor.submit(handler, request)
+                except queue.Full:
+                    return self.create_busy_response()
+                return AsgiResponse.from_result(await asyncio.wrap_future(future), self.json_codec)
+
+        for method in methods:
+            self.routes[(method.upper(), path)] = endpoint
+            self.allowed_methods.setdefault(path, []).append(method.upper())
+
+    def add_inline_route(self, path: str, methods: list[str], handler: Callable) -> None:
+        """Add a route whose handler runs on the event loop, bypassing the executor and its queue"""
+
+        async def endpoint(request: AsgiRequest) -> AsgiResponse:
+            return handler(request)
+
+        for method in methods:
+            self.routes[(method.upper(), path)] = endpoint
+            self.allowed_methods.setdefault(path, []).append(method.upper())
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "http":
+            await self.handle_http(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self.handle_lifespan(receive, send)
+
+    async def handle_http(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        endpoint = self.routes.get((scope["method"], scope["path"]))
+        if endpoint is None:
+            response = self.create_unrouted_response(scope["path"])
+        else:
+            try:
+                response = await endpoint(AsgiRequest(scope, await self.read_body(receive), self.json_codec))
+            except Exception:
+                logger.exception(f"Unhandled error in {scope['method']} {scope['path']}")
+                response = self.create_response({"error": "Internal server error"}, 500)
+
+        if self.compression.enabled and len(response.body) >= self.compression.minimum_size and scope["method"] != "HEAD":
+            response = self.compress_response(scope, response)
+
+        headers = [(b"content-type", response.content_type)] if response.content_type else []
+        if response.status_code not in BODILESS_STATUSES:
+            headers.append((b"content-length", str(len(response.body)).encode()))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": headers + response.headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+    def compress_response(self, scope: dict[str, Any], response: AsgiResponse) -> AsgiResponse:
+        """Compress the complete body with the encoding negotiated from the Accept-Encoding header, if any"""
+        accept_encoding = next((value for name, value in scope["headers"] if name == b"accept-encoding"), b"")
+        encoding = negotiate_encoding(accept_encoding.decode("latin-1"), self.compression.encodings)
+        if encoding is None:
+            return response
+
+        headers = [("content-type", response.content_type.decode("latin-1"))]
+        headers += [(name.decode("latin-1"), value.decode("latin-1")) for name, value in response.headers]
+        if not should_compress(response.status_code, headers, self.compression):
+            return response
+
+        # Content-Type and Content-Length are added by handle_http
+        extra_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in compressed_headers(headers[1:], encoding, None)
+        ]
+        return AsgiResponse(
+            compress(response.body, encoding, self.compression.level), response.status_code, response.content_type, extra_headers
+        )
+
+    async def read_body(self, receive: Callable) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def handle_lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def run(self, host: str, port: int, debug: bool) -> None:
+        """Run the ASGI application with uvicorn"""
+        import uvicorn
+
+        try:
+            uvicorn.run(self, host=host, port=port, reload=False)
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def serve(self, listen_socket: socket.socket, server_settings: ServerSettings) -> None:
+        """Serve the ASGI application with uvicorn on the given socket"""
+        try:
+            serve_with_uvicorn(self, listen_socket, server_settings)
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def create_response(self, data: Any, status_code: int = 200) -> AsgiResponse:
+        """Create a JSON response"""
+        return AsgiResponse(self.json_codec.encode(data), status_code)
+
+    def create_raw_response(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> AsgiResponse:
+        """Create a response from an already serialized body"""
+        raw_headers = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in (headers or {}).items()]
+        return AsgiResponse(body, status_code, content_type.encode("latin-1") if content_type else b"", raw_headers)
+
+    def create_busy_response(self) -> AsgiResponse:
+        """Create the 503 returned when every handler thread is busy and the queue is full"""
+        response = self.create_response(
+            {"error": "Service unavailable", "message": "The server is busy, retry later", "status": 503}, 503
+        )
+        response.headers.append((b"retry-after", str(self.retry_after).encode()))
+        return response
+
+    def create_unrouted_response(self, path: str) -> AsgiResponse:
+        """Create the 404 for an unknown path, or the 405 for a known path with another method"""
+        allowed_methods = self.allowed_methods.get(path)
+        if allowed_methods is None:
+            return self.create_response({"error": "Not found"}, 404)
+
+        response = self.create_response({"error": "Method not allowed"}, 405)
+        response.headers.append((b"allow", ", ".join(allowed_methods).encode()))
+        return response
+
+    def get_request_data(self) -> Dict[str, Any]:
+        """Get data from the current request"""
+        # Requests are passed to the handlers explicitly; there is no request context to read from
+        return {}
+
+    def get_json_data(self, request: AsgiRequest) -> Dict[str, Any]:
+        """Get JSON data from the raw request body"""
+        return request.get_json(silent=True) or {}
+
+    def get_routes(self) -> List[Tuple[str, List[str]]]:
+        """Get the routes registered through add_route"""
+        return [(path, sorted(methods)) for path, methods in self.allowed_methods.items()]
+
+    def dispatch_test_request(self, method: str, path: str) -> int:
+        """Call the ASGI application directly with a bodiless request"""
+        status_code = 500
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"localhost")],
+            "client": ("127.0.0.1", 0),
+            "server": ("localhost", 80),
+        }
+        asyncio.run(self(scope, receive, send))
+        return status_code
@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..metrics import Histogram, HistogramMetric, MetricsRegistry
+
+
+class BoundedExecutor:
+    """Thread pool whose queue is bounded: once every thread is busy and `max_queue` calls are waiting,
+    submit() raises queue.Full instead of letting work pile up.
+
+    Tracks the queue depth, the number of busy threads, rejections and how long calls wait for a thread.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, thread_name_prefix: str = "handler"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._rejected = 0
+        self.wait_time = Histogram()
+        self._wait_time_metric: Optional[HistogramMetric] = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    @property
+    def active_threads(self) -> int:
+        return self._active
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise queue.Full(f"All {self.max_workers} threads are busy and {self.max_queue} calls are waiting")
+
+        with self._lock:
+            self._queued += 1
+        try:
+            return self._executor.submit(self._run, time.perf_counter(), fn, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+
+    def _run(self, submitted_at: float, fn: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Any:
+        wait_time = time.perf_counter() - submitted_at
+        self.wait_time.observe(wait_time)
+        if self._wait_time_metric is not None:
+            self._wait_time_metric.observe(wait_time)
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def register_metrics(self, registry: MetricsRegistry) -> None:
+        """Expose the queue depth, busy threads and rejections as metrics read at scrape time, and the wait times."""
+        queue_depth = registry.gauge("executor_queue_depth", "Calls waiting for a handler thread")
+        queue_depth.set_function(lambda: self._queued)
+        active_threads = registry.gauge("executor_active_threads", "Handler threads running a call")
+        active_threads.set_function(lambda: self._active)
+        rejected = registry.counter("executor_rejected_total", "Calls rejected because the queue was full")
+        rejected.set_function(lambda: self._rejected)
+        # Observed from now on; waits before the registration only show in to_dict()
+        self._wait_time_metric = registry.histogram(
+            "executor_wait_seconds", "Time calls waited for a handler thread", buckets=self.wait_time.buckets
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self._queued,
+            "active_threads": self._active,
+            "rejected": self._rejected,
+            "wait_time": self.wait_time.to_dict(),
+        }
@@ -0,0 +1,294 @@
+import itertools
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ..models.settings import CompressionSettings
+
+# zlib window bits of each content coding; HTTP "deflate" is the zlib format, not a raw deflate stream
+WINDOW_BITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+# No content, partial content and not modified responses keep their bodies (if any) as they are
+UNCOMPRESSED_STATUSES = frozenset({204, 206, 304})
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding: str, encodings: tuple[str, ...] = ("gzip", "deflate")) -> Optional[str]:
+    """The encoding out of `encodings` the client prefers according to its Accept-Encoding header, if it accepts any.
+
+    Clients send only a handful of distinct headers, so the parsed result is cached.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    preferred, preferred_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > preferred_quality:
+            preferred, preferred_quality = encoding, quality
+    return preferred
+
+
+def request_encoding(method: str, accept_encoding: str, settings: CompressionSettings) -> Optional[str]:
+    """The encoding to compress the response to a request with, or None when the response is left alone"""
+    if method == "HEAD":
+        return None
+    return negotiate_encoding(accept_encoding, settings.encodings)
+
+
+def is_compressible(content_type: Optional[str], settings: CompressionSettings) -> bool:
+    """Whether a body of this content type is worth compressing; bodies without a content type are left alone"""
+    if not content_type:
+        return False
+    media_type = content_type.partition(";")[0].strip().lower()
+    for excluded in settings.excluded_content_types:
+        if media_type == excluded or (excluded.endswith("/") and media_type.startswith(excluded)):
+            return False
+    return True
+
+
+def should_compress(status_code: int, headers: list[tuple[str, str]], settings: CompressionSettings) -> bool:
+    """Whether a response with this status and these headers gets compressed, regardless of its size"""
+    if status_code < 200 or status_code in UNCOMPRESSED_STATUSES:
+        return False
+    content_type = None
+    for name, value in headers:
+        name = name.lower()
+        if name == "content-encoding":
+            return False
+        if name == "cache-control" and "no-transform" in value.lower():
+            return False
+        if name == "content-type":
+            content_type = value
+    return is_compressible(content_type, settings)
+
+
+def compressed_headers(headers: list[tuple[str, str]], encoding: str, content_length: Optional[int]) -> list[tuple[str, str]]:
+    """The headers of a response once its body is compressed; without a content length the body is streamed"""
+    result = []
+    vary = "Accept-Encoding"
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == "content-length":
+            continue
+        if lowered == "vary":
+            if value.strip() == "*" or "accept-encoding" in value.lower():
+                vary = value
+            else:
+                vary = f"{value}, Accept-Encoding"
+            continue
+        if lowered == "etag" and not value.startswith("W/"):
+            # The compressed bytes differ from the uncompressed ones, so a strong validator no longer matches them
+            value = f"W/{value}"
+        result.append((name, value))
+    result.append(("Content-Encoding", encoding))
+    result.append(("Vary", vary))
+    if content_length is not None:
+        result.append(("Content-Length", str(content_length)))
+    return result
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, WINDOW_BITS[encoding])
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_body(
+    body: bytes, headers: list[tuple[str, str]], encoding: str, settings: CompressionSettings
+) -> tuple[bytes, list[tuple[str, str]]]:
+    """A complete body and its headers, compressed unless the body is smaller than `minimum_size`"""
+    if len(body) < settings.minimum_size:
+        return body, headers
+    compressed = compress(body, encoding, settings.level)
+    return compressed, compressed_headers(headers, encoding, len(compressed))
+
+
+class StreamCompressor:
+    """Compresses a body chunk by chunk. Every chunk is flushed, so the client can decode it without waiting for the next."""
+
+    __slots__ = ("_compressor",)
+
+    def __init__(self, encoding: str, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, WINDOW_BITS[encoding])
+
+    def compress(self, chunk: bytes, last: bool = False) -> bytes:
+        data = self._compressor.compress(chunk) if chunk else b""
+        return data + self._compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def _close(app_iter: Any) -> None:
+    if hasattr(app_iter, "close"):
+        app_iter.close()
+
+
+def _close_after(chunks: Iterable[bytes], app_iter: Any) -> Iterator[bytes]:
+    """Yield the chunks, then close the application's iterable as the WSGI server would have"""
+    try:
+        yield from chunks
+    finally:
+        _close(app_iter)
+
+
+def _compress_chunks(chunks: Iterable[bytes], encoding: str, level: int) -> Iterator[bytes]:
+    compressor = StreamCompressor(encoding, level)
+    for chunk in chunks:
+        if chunk:
+            yield compressor.compress(chunk)
+    yield compressor.compress(b"", last=True)
+
+
+def _read_until_started(started: list[Any], body: list[bytes], chunks: Iterator[bytes]) -> tuple[str, list[tuple[str, str]], Any]:
+    """Consume the application's iterable until it has called start_response, keeping the chunks read in `body`"""
+    # Applications may call start_response only once their iterable is consumed
+    while not started:
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise RuntimeError("The WSGI application returned without calling start_response")
+        body.append(chunk)
+    status, headers, exc_info = started
+    return status, headers, exc_info
+
+
+def _read_up_to(body: list[bytes], chunks: Iterator[bytes], limit: int) -> bool:
+    """Buffer chunks in `body` until it holds more than `limit` bytes; returns whether the body ended first"""
+    size = sum(len(chunk) for chunk in body)
+    while size <= limit:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return True
+        body.append(chunk)
+        size += len(chunk)
+    return False
+
+
+class WsgiCompressionMiddleware:
+    """WSGI middleware that compresses responses with the encoding negotiated from the Accept-Encoding header.
+
+    The body is buffered up to `streaming_threshold`: a body that ends before is compressed in one piece (or sent
+    as it is when smaller than `minimum_size`), a longer one is compressed while it streams.
+    """
+
+    def __init__(self, app: Callable, settings: CompressionSettings):
+        self.app = app
+        self.settings = settings
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        encoding = request_encoding(environ.get("REQUEST_METHOD", ""), environ.get("HTTP_ACCEPT_ENCODING", ""), self.settings)
+        if encoding is None:
+            return self.app(environ, start_response)
+
+        started: list[Any] = []
+        body: list[bytes] = []
+
+        def capture_start_response(status: str, headers: list[tuple[str, str]], exc_info: Any = None) -> Callable:
+            started[:] = [status, headers, exc_info]
+            # Data passed to the legacy write() callable comes before the returned iterable
+            return body.append
+
+        app_iter = self.app(environ, capture_start_response)
+        chunks = iter(app_iter)
+        try:
+            status, headers, exc_info = _read_until_started(started, body, chunks)
+            if not should_compress(int(status[:3]), headers, self.settings):
+                start_response(status, headers, exc_info)
+                # Nothing consumed yet is the common case, and then the application's iterable is returned untouched
+                return app_iter if not body else _close_after(itertools.chain(body, chunks), app_iter)
+            exhausted = _read_up_to(body, chunks, self.settings.streaming_threshold)
+        except BaseException:
+            _close(app_iter)
+            raise
+
+        if exhausted:
+            _close(app_iter)
+            data, headers = compress_body(b"".join(body), headers, encoding, self.settings)
+            start_response(status, headers, exc_info)
+            return [data]
+
+        start_response(status, compressed_headers(headers, encoding, None), exc_info)
+        return _close_after(_compress_chunks(itertools.chain(body, chunks), encoding, self.settings.level), app_iter)
+
+
+class _AsgiCompressingSend:
+    """The `send` callable handed to the application: holds the response start back and compresses the body"""
+
+    __slots__ = ("send", "encoding", "settings", "start_message", "compressor", "passthrough")
+
+    def __init__(self, send: Callable, encoding: str, settings: CompressionSettings):
+        self.send = send
+        self.encoding = encoding
+        self.settings = settings
+        self.start_message: Optional[dict[str, Any]] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        if self.passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            # Held back until the first body message shows whether the response is streamed
+            self.start_message = message
+        elif self.compressor is not None:
+            body, more_body = message.get("body", b""), message.get("more_body", False)
+            await self.send(
+                {"type": "http.response.body", "body": self.compressor.compress(body, last=not more_body), "more_body": more_body}
+            )
+        else:
+            await self._send_first_body(message)
+
+    async def _send_first_body(self, message: dict[str, Any]) -> None:
+        start_message = self.start_message
+        assert start_message is not None
+        headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in start_message["headers"]]
+        if not should_compress(start_message["status"], headers, self.settings):
+            self.passthrough = True
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if more_body:
+            self.compressor = StreamCompressor(self.encoding, self.settings.level)
+            body, headers = self.compressor.compress(body), compressed_headers(headers, self.encoding, None)
+        else:
+            body, headers = compress_body(body, headers, self.encoding, self.settings)
+        start_message["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+
+class AsgiCompressionMiddleware:
+    """ASGI middleware that compresses responses with the encoding negotiated from the Accept-Encoding header.
+
+    A body sent in one message is compressed in one piece (or sent as it is when smaller than `minimum_size`);
+    a body sent in several messages is compressed message by message as it streams.
+    """
+
+    def __init__(self, app: Callable, settings: CompressionSettings):
+        self.app = app
+        self.settings = settings
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        encoding = None
+        if scope["type"] == "http":
+            accept_encoding = next(
+                (value.decode("latin-1") for name, value in scope["headers"] if name == b"accept-encoding"), ""
+            )
+            encoding = request_encoding(scope["method"], accept_encoding, self.settings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _AsgiCompressingSend(send, encoding, self.settings))
@@ -0,0 +1,43 @@
+import hashlib
+import threading
+from typing import Optional
+
+
+def make_etag(key: str | bytes) -> str:
+    """A quoted, opaque entity tag derived from a version key or from the serialized body"""
+    data = key.encode("utf-8") if isinstance(key, str) else key
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches the entity tag, with the weak comparison RFC 9110 asks for.
+
+    Weak comparison also matches the W/ tags compression turns our strong tags into.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+
+class BodySizes:
+    """Serialized sizes of the bodies sent for versioned entity tags, keeping the most recent `capacity` of them.
+
+    A 304 answered from a version alone never builds its body, yet whether the 200 it stands for was compressed
+    depends on that body's size.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[int]:
+        return self._sizes.get(etag)
+
+    def set(self, etag: str, size: int) -> None:
+        with self._lock:
+            self._sizes.pop(etag, None)
+            if len(self._sizes) >= self.capacity:
+                del self._sizes[next(iter(self._sizes))]
+            self._sizes[etag] = size
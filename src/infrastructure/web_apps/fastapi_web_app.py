@@ -1,46 +1,129 @@
-from typing import Any, Callable, Dict
+import asyncio
+import inspect
+import queue
+import socket
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
+from ..models.settings import CompressionSettings, ServerSettings
+from .bounded_executor import BoundedExecutor
+from .etag import BodySizes
+from .json_codec import JsonCodec
+from .uvicorn_server import serve_with_uvicorn
 from .web_app_interface import WebAppInterface
 
+if TYPE_CHECKING:
+    from fastapi.responses import Response
+
 
 class FastAPIWebApp(WebAppInterface):
     """FastAPI implementation of the WebAppInterface"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        server_settings: ServerSettings = ServerSettings(),
+        json_codec: JsonCodec = JsonCodec(),
+        compression: CompressionSettings = CompressionSettings(),
+    ):
+        # FastAPI is only imported when it is the selected web framework
+        from fastapi import FastAPI
+
         self.app = FastAPI(title="Azure App Service API", version="1.0.0")
+        self.json_codec = json_codec
+        self.compression = compression
+        self.body_sizes = BodySizes()
+        if compression.enabled:
+            from .compression import AsgiCompressionMiddleware
+
+            self.app.add_middleware(AsgiCompressionMiddleware, settings=compression)
+        # Synchronous handlers run on a pool with a bounded queue; when it is full, requests get a 503 right away
+        self.executor = BoundedExecutor(server_settings.threads, server_settings.max_queue, thread_name_prefix="sync-handler")
+        self.retry_after = server_settings.retry_after
 
     def add_route(self, path: str, methods: list[str], handler: Callable) -> None:
         """Add a route to the FastAPI application"""
+        from fastapi import Request
+
         # FastAPI uses add_api_route for dynamic route registration
         # Convert methods to uppercase as FastAPI expects
         methods_upper = [method.upper() for method in methods]
 
         # Wrap the handler to pass the request object and handle sync/async
         async def wrapped_handler(request: Request):
-            import asyncio
+            # Read the body on the event loop; Starlette caches it so the pipeline never has to block on it
+            await request.body()
 
-            # If handler is async, await it; if sync, run in executor
-            if asyncio.iscoroutinefunction(handler):
-                return await handler(request)
+            # If handler is async (e.g. an async pipeline), run it on the event loop; if sync, run in executor
+            if inspect.iscoroutinefunction(handler):
+                return self.to_response(await handler(request))
             else:
                 # Run synchronous handler in executor
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, handler, request)
+                try:
+                    future = self.executor.submit(handler, request)
+                except queue.Full:
+                    return self.create_busy_response()
+                return self.to_response(await asyncio.wrap_future(future))
 
         self.app.add_api_route(path, wrapped_handler, methods=methods_upper)
 
+    def add_inline_route(self, path: str, methods: list[str], handler: Callable) -> None:
+        """Add a route whose handler runs on the event loop, bypassing the executor and its queue"""
+        from fastapi import Request
+
+        async def inline_handler(request: Request):
+            return handler(request)
+
+        self.app.add_api_route(path, inline_handler, methods=[method.upper() for method in methods])
+
     def run(self, host: str, port: int, debug: bool) -> None:
         """Run the FastAPI application"""
         import uvicorn
 
-        uvicorn.run(self.app, host=host, port=port, reload=False)
+        try:
+            uvicorn.run(self.app, host=host, port=port, reload=False)
+        finally:
+            self.executor.shutdown(wait=True)
 
-    def create_response(self, data: Dict[str, Any], status_code: int = 200) -> JSONResponse:
+    def serve(self, listen_socket: socket.socket, server_settings: ServerSettings) -> None:
+        """Serve the FastAPI application with uvicorn on the given socket"""
+        try:
+            serve_with_uvicorn(self.app, listen_socket, server_settings)
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def create_response(self, data: Any, status_code: int = 200) -> "Response":
         """Create a FastAPI response"""
-        return JSONResponse(content=data, status_code=status_code)
+        from fastapi.responses import Response
+
+        # The codec's bytes go out as they are; JSONResponse would serialize the content again with json.dumps
+        return Response(content=self.json_codec.encode(data), status_code=status_code, media_type="application/json")
+
+    def create_raw_response(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> "Response":
+        """Create a FastAPI response from an already serialized body"""
+        from fastapi.responses import Response
+
+        return Response(content=body, status_code=status_code, headers=headers, media_type=content_type)
+
+    def to_response(self, result: Any) -> Any:
+        """Serialize pydantic models returned by a handler with the codec instead of FastAPI's jsonable_encoder"""
+        if isinstance(result, BaseModel):
+            return self.create_response(result)
+        return result
+
+    def create_busy_response(self) -> "Response":
+        """Create the 503 returned when every handler thread is busy and the queue is full"""
+        response = self.create_response(
+            {"error": "Service unavailable", "message": "The server is busy, retry later", "status": 503}, 503
+        )
+        response.headers["Retry-After"] = str(self.retry_after)
+        return response
 
     def get_request_data(self) -> Dict[str, Any]:
         """Get data from the FastAPI request"""
@@ -50,6 +133,11 @@ class FastAPIWebApp(WebAppInterface):
     def get_json_data(self, request) -> Dict[str, Any]:
         """Get JSON data from FastAPI request"""
         try:
+            # The body is read on the event loop before dispatching, so parse the cached bytes when available
+            cached_body = getattr(request, "_body", None)
+            if isinstance(cached_body, bytes):
+                return self.json_codec.loads(cached_body) if cached_body else {}
+
             # For FastAPI, we need to get the JSON data from the request body
             if hasattr(request, "json") and callable(getattr(request, "json")):
                 # Handle both sync and async json methods
@@ -64,3 +152,38 @@ class FastAPIWebApp(WebAppInterface):
             return {}
         except Exception:
             return {}
+
+    def get_routes(self) -> List[Tuple[str, List[str]]]:
+        """Get the routes registered through add_route"""
+        from fastapi.routing import APIRoute
+
+        return [(route.path, sorted(route.methods)) for route in self.app.routes if isinstance(route, APIRoute)]
+
+    def dispatch_test_request(self, method: str, path: str) -> int:
+        """Call the ASGI application directly with a bodiless request"""
+        status_code = 500
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"localhost")],
+            "client": ("127.0.0.1", 0),
+            "server": ("localhost", 80),
+        }
+        asyncio.run(self.app(scope, receive, send))
+        return status_code
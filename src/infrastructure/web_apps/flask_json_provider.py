@@ -0,0 +1,26 @@
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import JSONProvider
+
+from .json_codec import JsonCodec
+
+
+class CodecJSONProvider(JSONProvider):
+    """Flask JSON provider backed by a JsonCodec, so jsonify, request.get_json and dict return values all use it."""
+
+    def __init__(self, app: Flask, json_codec: JsonCodec):
+        super().__init__(app)
+        self.json_codec = json_codec
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.json_codec.dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return self.json_codec.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand the codec's bytes to the response as they are, without a round trip through str
+        return self._app.response_class(
+            self.json_codec.encode(self._prepare_response_obj(args, kwargs)), mimetype="application/json"
+        )
@@ -1,45 +1,129 @@
-from typing import Callable
+import inspect
+import socket
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from flask import Flask, jsonify, request
+from pydantic import BaseModel
 
+from ..models.settings import CompressionSettings, ServerSettings
+from .etag import BodySizes
+from .json_codec import JsonCodec
 from .web_app_interface import WebAppInterface
 
+if TYPE_CHECKING:
+    from flask import Flask, Response
+
 
 class FlaskWebApp(WebAppInterface):
     """Flask implementation of the WebAppInterface"""
 
-    def __init__(self):
+    def __init__(self, json_codec: JsonCodec = JsonCodec(), compression: CompressionSettings = CompressionSettings()):
+        # Flask is only imported when it is the selected web framework
+        from flask import Flask
+
+        from .flask_json_provider import CodecJSONProvider
+
         self.app = Flask(__name__)
+        self.json_codec = json_codec
+        self.app.json = CodecJSONProvider(self.app, json_codec)
+        self.compression = compression
+        self.body_sizes = BodySizes()
+        if compression.enabled:
+            from .compression import WsgiCompressionMiddleware
+
+            self.app.wsgi_app = WsgiCompressionMiddleware(self.app.wsgi_app, compression)
 
     def add_route(self, path: str, methods: list[str], handler: Callable) -> None:
         """Add a route to the Flask application"""
+        from flask import request
+
         # Wrap the handler to pass the request object for consistency with FastAPI
         # Use a unique endpoint name based on the path to avoid conflicts
         endpoint_name = f"endpoint_{path.replace('/', '_').replace('-', '_')}"
 
-        def wrapped_handler():
-            return handler(request)
+        if inspect.iscoroutinefunction(handler):
+            # Flask runs async views on its own event loop (requires the flask[async] extra)
+            async def wrapped_handler():
+                return self.to_response(await handler(request))
+
+        else:
+
+            def wrapped_handler():
+                return self.to_response(handler(request))
 
         self.app.route(path, methods=methods, endpoint=endpoint_name)(wrapped_handler)
 
+    def add_inline_route(self, path: str, methods: list[str], handler: Callable) -> None:
+        """Add a route whose handler returns a ready-made response"""
+        from flask import request
+
+        endpoint_name = f"endpoint_{path.replace('/', '_').replace('-', '_')}"
+        self.app.route(path, methods=methods, endpoint=endpoint_name)(lambda: handler(request))
+
     def run(self, host: str, port: int, debug: bool) -> None:
         """Run the Flask application"""
         self.app.run(host=host, port=port, debug=debug)
 
-    def create_response(self, data: dict, status_code: int = 200) -> tuple:
+    def serve(self, listen_socket: socket.socket, server_settings: ServerSettings) -> None:
+        """Serve the Flask application with a thread pool Werkzeug server on the given socket"""
+        from .pooled_wsgi_server import PooledWSGIServer
+
+        PooledWSGIServer(
+            self.app,
+            listen_socket,
+            threads=server_settings.threads,
+            max_requests=server_settings.worker_max_requests(),
+        ).serve_forever()
+
+    def create_response(self, data: Any, status_code: int = 200) -> tuple:
         """Create a Flask response"""
-        return jsonify(data), status_code
+        return self.json_response(data), status_code
+
+    def create_raw_response(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> "Response":
+        """Create a Flask response from an already serialized body"""
+        return self.app.response_class(body, status=status_code, headers=headers, content_type=content_type)
+
+    def json_response(self, data: Any) -> "Response":
+        """Serialize a dict or a pydantic model straight into a JSON response body"""
+        return self.app.response_class(self.json_codec.encode(data), mimetype="application/json")
+
+    def to_response(self, result: Any) -> Any:
+        """Serialize pydantic models returned by a handler with the codec; Flask handles every other return value"""
+        if isinstance(result, BaseModel):
+            return self.json_response(result)
+        if isinstance(result, tuple) and result and isinstance(result[0], BaseModel):
+            return (self.json_response(result[0]),) + result[1:]
+        return result
 
     def get_request_data(self) -> dict:
         """Get data from the Flask request"""
+        from flask import request
+
         return request.get_json() or {}
 
     def get_json_data(self, request) -> dict:
         """Get JSON data from Flask request"""
         return request.get_json() or {}
 
+    def get_routes(self) -> list[tuple[str, list[str]]]:
+        """Get the routes registered through add_route"""
+        return [
+            (rule.rule, sorted((rule.methods or set()) - {"HEAD", "OPTIONS"}))
+            for rule in self.app.url_map.iter_rules()
+            if rule.endpoint != "static"
+        ]
+
+    def dispatch_test_request(self, method: str, path: str) -> int:
+        """Send a request through the Flask test client"""
+        return self.app.test_client().open(path, method=method).status_code
+
 
-def create_flask_app() -> Flask:
+def create_flask_app() -> "Flask":
     """Create and configure the Flask application"""
     web_app = FlaskWebApp()
     return web_app.app
@@ -0,0 +1,73 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JsonCodec:
+    """Turns response data into JSON bytes and request bodies back into Python objects, with the standard library.
+
+    Pydantic models are serialized by pydantic itself (model_dump_json), so they never go through a dict first.
+    """
+
+    name = "json"
+
+    def encode(self, data: Any) -> bytes:
+        """Serialize a response body"""
+        if isinstance(data, BaseModel):
+            return data.model_dump_json().encode("utf-8")
+        return self.dumps(data)
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=self.default).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    @staticmethod
+    def default(value: Any) -> Any:
+        """Fallback for the values the JSON library can't serialize on its own; anything else is a TypeError"""
+        if isinstance(value, BaseModel):
+            return value.model_dump(mode="json")
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, (decimal.Decimal, uuid.UUID)):
+            return str(value)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return dataclasses.asdict(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonCodec(JsonCodec):
+    """JsonCodec backed by orjson; raises ImportError when orjson is not installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._orjson.dumps(data, default=self.default)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+def create_json_codec(name: str = "auto") -> JsonCodec:
+    """Create the codec selected in the settings; "auto" uses orjson when it is installed and the standard library otherwise"""
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    if name != "auto":
+        raise ValueError(f"Unsupported JSON codec: {name}. Supported: auto, json, orjson")
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
@@ -0,0 +1,59 @@
+import itertools
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+
+class PooledRequestHandler(WSGIRequestHandler):
+    # Allows chunked responses; set on a subclass so the shared WSGIRequestHandler is left untouched
+    protocol_version = "HTTP/1.1"
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug WSGI server that handles connections on a fixed thread pool instead of one new thread per connection.
+
+    It serves on an already listening socket and stops accepting after `max_requests` requests (0 for no limit), so
+    a pre-fork master can replace the worker. Werkzeug closes every connection after its response, so there is no
+    keep-alive to tune here.
+    """
+
+    multithread = True
+
+    def __init__(self, app, listen_socket: socket.socket, threads: int, max_requests: int = 0):
+        if max_requests:
+            app = self.limit_requests(app, max_requests)
+
+        host, port = listen_socket.getsockname()[:2]
+        super().__init__(host, port, app, handler=PooledRequestHandler, fd=listen_socket.fileno())
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="wsgi-worker")
+
+    def limit_requests(self, app, max_requests: int):
+        counter = itertools.count(1)
+
+        def limited_app(environ, start_response):
+            if next(counter) == max_requests:
+                # shutdown() waits for serve_forever() to return, so it must not block a request thread
+                threading.Thread(target=self.shutdown, daemon=True).start()
+            return app(environ, start_response)
+
+        return limited_app
+
+    def process_request(self, request, client_address) -> None:
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        try:
+            super().serve_forever(poll_interval=poll_interval)
+        finally:
+            # The listening socket is closed by now; let the requests already accepted finish
+            self.executor.shutdown(wait=True)
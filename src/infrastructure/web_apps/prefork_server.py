@@ -0,0 +1,112 @@
+import gc
+import os
+import signal
+import socket
+import time
+from typing import Callable
+
+from ..logger import LoggerStrategy
+
+# A worker that exits sooner than this after starting is most likely failing at startup; wait before replacing it
+MIN_WORKER_LIFETIME = 1.0
+
+
+class PreforkServer:
+    """Pre-fork master: binds the listening socket once, forks workers that share it and replaces workers that exit.
+
+    Everything the master loaded before forking (modules, compiled pipelines, settings) is shared copy-on-write
+    with the workers. The master calls gc.freeze() right before forking, so garbage collection in the workers does
+    not write to those pages and un-share them. The master must not open connections; each worker builds its own
+    DI container after the fork.
+    """
+
+    def __init__(self, host: str, port: int, workers: int, logger: LoggerStrategy, backlog: int = 2048):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Pre-fork workers are only supported on platforms with os.fork()")
+
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.logger = logger
+        self.backlog = backlog
+        self.worker_started_at: dict[int, float] = {}
+        self.stopping = False
+
+    def create_socket(self) -> socket.socket:
+        listen_socket = socket.create_server((self.host, self.port), backlog=self.backlog)
+        listen_socket.set_inheritable(True)
+        return listen_socket
+
+    def run(self, serve_worker: Callable[[socket.socket], None]) -> None:
+        """Fork the workers, each running serve_worker(listen_socket), and supervise them until stopped."""
+        listen_socket = self.create_socket()
+        self.logger.info(f"🧬 Pre-fork master {os.getpid()} listening on {self.host}:{self.port} with {self.workers} workers")
+
+        # Move everything loaded so far out of the collector's reach, so workers keep those pages shared
+        gc.disable()
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self.handle_stop)
+        signal.signal(signal.SIGINT, self.handle_stop)
+
+        try:
+            for _ in range(self.workers):
+                self.spawn_worker(listen_socket, serve_worker)
+            self.supervise(listen_socket, serve_worker)
+        finally:
+            listen_socket.close()
+            self.logger.info(f"🛑 Pre-fork master {os.getpid()} stopped")
+
+    def spawn_worker(self, listen_socket: socket.socket, serve_worker: Callable[[socket.socket], None]) -> None:
+        pid = os.fork()
+        if pid:
+            self.worker_started_at[pid] = time.monotonic()
+            return
+
+        # In the worker: default signal handling and a normal collector for objects created from here on
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        gc.enable()
+
+        exit_code = 0
+        try:
+            serve_worker(listen_socket)
+        except KeyboardInterrupt:
+            pass
+        except BaseException as e:
+            self.logger.error(f"❌ Worker {os.getpid()} failed: {str(e)}")
+            exit_code = 1
+        finally:
+            # Never return into the master's code path
+            os._exit(exit_code)
+
+    def supervise(self, listen_socket: socket.socket, serve_worker: Callable[[socket.socket], None]) -> None:
+        while self.worker_started_at:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+
+            started_at = self.worker_started_at.pop(pid, None)
+            if started_at is None or self.stopping:
+                continue
+
+            self.logger.warning(f"⚠️ Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}, starting a new one")
+            if time.monotonic() - started_at < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+            if not self.stopping:
+                self.spawn_worker(listen_socket, serve_worker)
+
+    def handle_stop(self, signum: int, frame) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        self.logger.info(f"🛑 Pre-fork master stopping {len(self.worker_started_at)} workers")
+        for pid in list(self.worker_started_at):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
@@ -0,0 +1,19 @@
+import socket
+from typing import Any
+
+from ..models.settings import ServerSettings
+
+
+def serve_with_uvicorn(app: Any, listen_socket: socket.socket, server_settings: ServerSettings) -> None:
+    """Serve an ASGI application with uvicorn on an already listening socket, configured from the server settings"""
+    import uvicorn
+
+    config = uvicorn.Config(
+        app,
+        loop=server_settings.loop,
+        http=server_settings.http,
+        backlog=server_settings.backlog,
+        timeout_keep_alive=server_settings.keep_alive,
+        limit_max_requests=server_settings.worker_max_requests() or None,
+    )
+    uvicorn.Server(config).run(sockets=[listen_socket])
@@ -1,25 +1,108 @@
+import socket
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.settings import CompressionSettings, ServerSettings
+from .compression import is_compressible, request_encoding
+from .etag import BodySizes, etag_matches, make_etag
+from .json_codec import JsonCodec
 
 
 class WebAppInterface(ABC):
     """Abstract interface for web applications"""
 
+    json_codec: JsonCodec
+    compression: CompressionSettings
+    body_sizes: BodySizes
+
     @abstractmethod
     def add_route(self, path: str, methods: list[str], handler: Callable) -> None:
         """Add a route to the web application"""
         pass
 
+    @abstractmethod
+    def add_inline_route(self, path: str, methods: list[str], handler: Callable) -> None:
+        """Add a route whose synchronous handler runs directly on the server thread or event loop, outside the pipeline
+        and the handler pool. Meant for handlers that never block, such as health probes answering from memory; the
+        handler returns a response from create_raw_response."""
+        pass
+
     @abstractmethod
     def run(self, host: str = "0.0.0.0", port: int = 8000, debug: bool = False) -> None:
         """Run the web application"""
         pass
 
     @abstractmethod
-    def create_response(self, data: Dict[str, Any], status_code: int = 200) -> Tuple[Any, int]:
-        """Create a response object"""
+    def serve(self, listen_socket: socket.socket, server_settings: ServerSettings) -> None:
+        """Serve the web application with its production server on an already listening socket, e.g. one inherited from a pre-fork master"""
+        pass
+
+    @abstractmethod
+    def create_response(self, data: Any, status_code: int = 200) -> Tuple[Any, int]:
+        """Create a JSON response object from a dict or a pydantic model, serialized with the app's JsonCodec"""
+        pass
+
+    @abstractmethod
+    def create_raw_response(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: Optional[str] = "application/json",
+    ) -> Any:
+        """Create a response object from an already serialized body"""
         pass
 
+    def create_conditional_response(
+        self, request: Any, data: Any, version: Optional[str] = None, status_code: int = 200, private: bool = False
+    ) -> Any:
+        """Create a JSON response with an ETag, or a bodiless 304 Not Modified when the request's If-None-Match matches it.
+
+        `version` is a cheap key that changes whenever the body would, such as a session id or version. With one, a
+        matching request is answered before the body is serialized, and `data` may be a callable that builds it only
+        when it is needed. Without one the ETag is a hash of the serialized body, which saves bandwidth only.
+
+        A `private` body belongs to the user the request authenticates as: both the 200 and the 304 are sent with
+        `Cache-Control: private` and `Vary: Authorization`, so a shared cache never hands it to someone else.
+        """
+        headers = {"Cache-Control": "private", "Vary": "Authorization"} if private else {}
+        if_none_match = request.headers.get("If-None-Match")
+        etag = make_etag(version) if version is not None else None
+        if etag is not None and if_none_match and etag_matches(if_none_match, etag):
+            # Whether the 200 was compressed depends on its size, which is only known once a body was built
+            body_size = self.body_sizes.get(etag)
+            if body_size is not None or self.negotiated_encoding(request) is None:
+                return self.create_not_modified_response(request, etag, body_size or 0, headers)
+
+        body = self.json_codec.encode(data() if callable(data) else data)
+        if etag is None:
+            etag = make_etag(body)
+        else:
+            self.body_sizes.set(etag, len(body))
+        if if_none_match and etag_matches(if_none_match, etag):
+            return self.create_not_modified_response(request, etag, len(body), headers)
+        return self.create_raw_response(body, status_code, {"ETag": etag, **headers})
+
+    def create_not_modified_response(
+        self, request: Any, etag: str, body_size: int, headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """Create a bodiless 304 with the validators of the 200 it stands for, whose JSON body is `body_size` bytes long.
+
+        The compression middleware leaves 304s alone, so when it would have compressed that 200 the 304 gets the weak
+        ETag and the Vary header the compressed 200 was sent with.
+        """
+        headers = {**(headers or {}), "ETag": etag}
+        if self.negotiated_encoding(request) is not None and body_size >= self.compression.minimum_size:
+            headers["ETag"] = etag if etag.startswith("W/") else f"W/{etag}"
+            headers["Vary"] = f"{headers['Vary']}, Accept-Encoding" if "Vary" in headers else "Accept-Encoding"
+        return self.create_raw_response(b"", 304, headers, content_type=None)
+
+    def negotiated_encoding(self, request: Any) -> Optional[str]:
+        """The encoding the compression middleware compresses a JSON response to this request with, if any"""
+        if not self.compression.enabled or not is_compressible("application/json", self.compression):
+            return None
+        return request_encoding(request.method, request.headers.get("Accept-Encoding", ""), self.compression)
+
     @abstractmethod
     def get_request_data(self) -> Dict[str, Any]:
         """Get data from the current request"""
@@ -29,3 +112,13 @@ class WebAppInterface(ABC):
     def get_json_data(self, request) -> Dict[str, Any]:
         """Get JSON data from the request object (unified interface)"""
         pass
+
+    @abstractmethod
+    def get_routes(self) -> List[Tuple[str, List[str]]]:
+        """Get the registered routes as (path, methods) pairs"""
+        pass
+
+    @abstractmethod
+    def dispatch_test_request(self, method: str, path: str) -> int:
+        """Send a request through the application in-process, without a server, and return the status code"""
+        pass
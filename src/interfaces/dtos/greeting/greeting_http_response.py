@@ -1,4 +1,3 @@
-from flask import jsonify
 from pydantic import BaseModel, ConfigDict
 
 
@@ -18,4 +17,6 @@ class GreetingHttpResponse(BaseModel):
 
     def __call__(self, environ, start_response):
         """Make the class WSGI callable"""
-        return jsonify(self.to_dict())(environ, start_response)
+        from flask import Response
+
+        return Response(self.model_dump_json(), mimetype="application/json")(environ, start_response)
@@ -1,9 +1,13 @@
 from .auth_controller import AuthController
 from .authenticated_controller import AuthenticatedController
 from .greeting_controller import GreetingController
+from .health_controller import HealthController
+from .metrics_controller import MetricsController
 
 __all__ = [
     "GreetingController",
     "AuthenticatedController",
     "AuthController",
+    "HealthController",
+    "MetricsController",
 ]
@@ -188,7 +188,8 @@ class AuthController:
             if not session_valid or not user_context:
                 return self.web_app.create_response({"error": "Session expired"}, 401)
 
-            return self.web_app.create_response({"user": user_context}, 200)
+            # The user context is stored once per session, so the session id versions it; polling clients get a 304
+            return self.web_app.create_conditional_response(request, {"user": user_context}, version=session_id, private=True)
 
         except Exception as e:
             self.logger.error(f"Get current user error: {str(e)}")
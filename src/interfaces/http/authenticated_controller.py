@@ -69,7 +69,10 @@ class AuthenticatedController:
             "roles": session_info.get("roles", []),
         }
 
-        return profile_data
+        # Session contexts don't change once created, so the session id versions the profile for polling clients
+        return self.web_app.create_conditional_response(
+            request, profile_data, version=session_info.get("session_id"), private=True
+        )
 
     @authenticated_pipeline
     def _handle_get_org_info(self, request):
@@ -83,14 +86,18 @@ class AuthenticatedController:
         if "org:read" not in session_info.get("permissions", []):
             return {"error": "Insufficient permissions to view organization info", "status": 403}
 
-        org_info = {
-            "org_id": session_info.get("org_id"),
-            "org_name": session_info.get("org_name"),
-            "user_role": session_info.get("roles", []),
-            "accessible_features": self._get_accessible_features(session_info.get("permissions", [])),
-        }
-
-        return org_info
+        def build_org_info():
+            return {
+                "org_id": session_info.get("org_id"),
+                "org_name": session_info.get("org_name"),
+                "user_role": session_info.get("roles", []),
+                "accessible_features": self._get_accessible_features(session_info.get("permissions", [])),
+            }
+
+        # Built only when the client's cached copy, versioned by the session id, is missing or stale
+        return self.web_app.create_conditional_response(
+            request, build_org_info, version=session_info.get("session_id"), private=True
+        )
 
     def _get_session_info_from_context(self):
         """Helper method to extract session info from the middleware context."""
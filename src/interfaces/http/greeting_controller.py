@@ -17,7 +17,6 @@ class GreetingController:
 
     def _setup_routes(self):
         self.web_app.add_route("/say_hello", ["POST"], self._handle_say_hello)
-        self.web_app.add_route("/health", ["GET"], self._handle_health_check)
 
     @pipeline(shared_pipeline)
     def _handle_say_hello(self, request: GreetingHttpRequest):
@@ -30,7 +29,3 @@ class GreetingController:
         return GreetingHttpResponse.model_validate(greeting_message.to_dict())
 
         # return self.web_app.create_response(greeting_message.model_dump(), 200)
-
-    @pipeline(shared_pipeline)
-    def _handle_health_check(self, request):
-        return self.web_app.create_response({"status": "healthy"}, 200)
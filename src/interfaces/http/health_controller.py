@@ -0,0 +1,31 @@
+"""Health controller for the liveness and readiness probes."""
+
+from injector import inject, singleton
+
+from infrastructure import HealthMonitor, WebAppInterface
+
+
+@singleton
+class HealthController:
+    """Controller for the probe endpoints; they skip the pipeline and answer with bytes serialized ahead of time."""
+
+    @inject
+    def __init__(self, web_app: WebAppInterface, health_monitor: HealthMonitor):
+        self.web_app = web_app
+        self.health_monitor = health_monitor
+        self.liveness_body = web_app.json_codec.encode({"status": "healthy"})
+        self._setup_routes()
+
+    def _setup_routes(self):
+        """Setup probe routes."""
+        self.web_app.add_inline_route("/health", ["GET"], self._handle_liveness)
+        self.web_app.add_inline_route("/health/ready", ["GET"], self._handle_readiness)
+
+    def _handle_liveness(self, request):
+        """The process is up and serving requests."""
+        return self.web_app.create_raw_response(self.liveness_body)
+
+    def _handle_readiness(self, request):
+        """Result of the last background run of the dependency checks."""
+        status_code, body = self.health_monitor.readiness
+        return self.web_app.create_raw_response(body, status_code, {"Cache-Control": "no-store"})
@@ -0,0 +1,29 @@
+"""Metrics controller for the Prometheus scrape endpoint."""
+
+from injector import inject, singleton
+
+from infrastructure import PROMETHEUS_CONTENT_TYPE, BoundedExecutor, WebAppInterface, metrics_registry, process_sampler
+
+
+@singleton
+class MetricsController:
+    """Controller for /metrics; like the probes it skips the pipeline, so scrapes do not show up in the request metrics."""
+
+    @inject
+    def __init__(self, web_app: WebAppInterface):
+        self.web_app = web_app
+        self.registry = metrics_registry
+        process_sampler.register_metrics(self.registry)
+        executor = getattr(web_app, "executor", None)
+        if isinstance(executor, BoundedExecutor):
+            executor.register_metrics(self.registry)
+        self._setup_routes()
+
+    def _setup_routes(self):
+        """Setup metrics routes."""
+        self.web_app.add_inline_route("/metrics", ["GET"], self._handle_metrics)
+
+    def _handle_metrics(self, request):
+        """Every metric of this process in the Prometheus text format."""
+        body = self.registry.expose().encode("utf-8")
+        return self.web_app.create_raw_response(body, headers={"Cache-Control": "no-store"}, content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,3 +1,4 @@
 from .application_bootstrap import ApplicationBootstrap
+from .application_warmup import ApplicationWarmup
 
-__all__ = ["ApplicationBootstrap"]
+__all__ = ["ApplicationBootstrap", "ApplicationWarmup"]
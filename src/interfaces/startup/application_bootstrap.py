@@ -1,8 +1,9 @@
 from injector import inject, singleton
 
-from infrastructure import LoggerStrategy
+from infrastructure import LoggerStrategy, Settings
 
-from ..http import AuthController, AuthenticatedController, GreetingController
+from ..http import AuthController, AuthenticatedController, GreetingController, HealthController, MetricsController
+from .application_warmup import ApplicationWarmup
 
 
 @singleton
@@ -15,22 +16,32 @@ class ApplicationBootstrap:
         greeting_controller: GreetingController,
         authenticated_controller: AuthenticatedController,
         auth_controller: AuthController,
+        health_controller: HealthController,
+        metrics_controller: MetricsController,
+        warmup: ApplicationWarmup,
+        settings: Settings,
         logger: LoggerStrategy,
     ):
-        self.controllers = [greeting_controller, authenticated_controller, auth_controller]
+        self.controllers = [greeting_controller, authenticated_controller, auth_controller, health_controller, metrics_controller]
+        self.warmup = warmup
+        self.settings = settings
         self.logger = logger
+        self.warmup_timings: dict[str, float] = {}
 
     def build(self):
         """Build and initialize the application.
 
         This method is called from main to ensure controllers are properly initialized
-        and their routes are registered before the web server starts.
+        and their routes are registered before the web server starts. Unless disabled in
+        settings, it then warms the application up, so the server only starts listening
+        once the first requests no longer pay for connections and compilation.
         """
         # Controllers are instantiated just by being injected in __init__
         # Their __init__ methods will register routes automatically
-        self.logger.info(
-            f"✅ Controllers initialized: {type(self.controllers[0]).__name__}, {type(self.controllers[1]).__name__}, {type(self.controllers[2]).__name__}"
-        )
+        self.logger.info(f"✅ Controllers initialized: {', '.join(type(controller).__name__ for controller in self.controllers)}")
+
+        if self.settings.startup_warmup:
+            self.warmup_timings = self.warmup.run()
 
         self.logger.info("🚀 Application bootstrap completed successfully")
 
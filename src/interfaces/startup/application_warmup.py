@@ -0,0 +1,97 @@
+import time
+from typing import Any, Callable, Sequence
+
+from injector import Injector, inject, singleton
+from pydantic import BaseModel
+
+from infrastructure import (
+    WARMUP_SINGLETONS,
+    LoggerStrategy,
+    Settings,
+    WebAppInterface,
+    compile_pipelines,
+    synthetic_traffic,
+)
+
+# Only application models are warmed; library models are left alone
+APPLICATION_PACKAGES = ("domain", "application", "infrastructure", "interfaces")
+
+
+@singleton
+class ApplicationWarmup:
+    """Does the work that would otherwise land on the first requests: connections, pipelines, validators, routes."""
+
+    singletons: Sequence[Any] = WARMUP_SINGLETONS
+
+    @inject
+    def __init__(self, injector: Injector, web_app: WebAppInterface, settings: Settings, logger: LoggerStrategy):
+        self.injector = injector
+        self.web_app = web_app
+        self.settings = settings
+        self.logger = logger
+
+    def run(self) -> dict[str, float]:
+        """Run every warm-up step and return how long each one took, in seconds."""
+        steps: list[tuple[str, Callable[[], str]]] = [
+            ("singletons", self.instantiate_singletons),
+            ("pipelines", self.compile_pipelines),
+            ("pydantic_models", self.build_pydantic_models),
+            ("routes", self.send_synthetic_requests),
+        ]
+
+        timings = {}
+        for name, step in steps:
+            start = time.perf_counter()
+            summary = step()
+            timings[name] = time.perf_counter() - start
+            self.logger.info(f"🔥 Warm-up {name}: {summary} in {timings[name] * 1000:.1f}ms")
+
+        self.logger.info(f"🔥 Warm-up completed in {sum(timings.values()) * 1000:.1f}ms")
+        return timings
+
+    def instantiate_singletons(self) -> str:
+        """Create the listed singletons now, so connection setup and pings happen before traffic arrives."""
+        failed = 0
+        for interface in self.singletons:
+            try:
+                self.injector.get(interface)
+            except Exception as e:
+                failed += 1
+                self.logger.warning(f"⚠️ Warm-up could not create {getattr(interface, '__name__', interface)}: {str(e)}")
+
+        return f"{len(self.singletons) - failed}/{len(self.singletons)} created"
+
+    def compile_pipelines(self) -> str:
+        """Compile the configurable pipelines that configure_pipelines() has not compiled yet."""
+        return f"{compile_pipelines()} compiled"
+
+    def build_pydantic_models(self) -> str:
+        """Finish building the validators of application models whose schema was deferred."""
+        models = []
+        pending = list(BaseModel.__subclasses__())
+        while pending:
+            model = pending.pop()
+            pending.extend(model.__subclasses__())
+            if model.__module__.split(".")[0] in APPLICATION_PACKAGES:
+                models.append(model)
+
+        rebuilt = sum(1 for model in models if not model.__pydantic_complete__ and model.model_rebuild())
+        return f"{len(models)} models, {rebuilt} rebuilt"
+
+    def send_synthetic_requests(self) -> str:
+        """Send a GET to every route of the warm-up allow-list, exercising the full request path once."""
+        routes = dict(self.web_app.get_routes())
+        statuses = []
+        for path in self.settings.warmup_paths:
+            if "GET" not in routes.get(path, ()):
+                self.logger.warning(f"⚠️ Warm-up path {path} is not a GET route")
+                continue
+            try:
+                # The synthetic requests are not traffic: keep them out of the request counters and latency percentiles
+                with synthetic_traffic():
+                    statuses.append(f"{path}={self.web_app.dispatch_test_request('GET', path)}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Warm-up request to {path} failed: {str(e)}")
+                statuses.append(f"{path}=failed")
+
+        return ", ".join(statuses) or "no GET routes"
@@ -1,24 +1,88 @@
-from infrastructure import LoggerStrategy, Settings, WebAppInterface, pipeline, shared_pipeline
+import os
+import socket
+from typing import Optional
+
+from infrastructure import (
+    CachedSettingsLoader,
+    HealthMonitor,
+    LoggerStrategy,
+    PreforkServer,
+    Settings,
+    WebAppInterface,
+    compile_pipelines,
+    configure_pipelines,
+    pipeline,
+    pipeline_profiler,
+    process_sampler,
+    startup_pipeline,
+)
 from interfaces import ApplicationBootstrap
 
 
-@pipeline(shared_pipeline)
-def main(web_app: WebAppInterface, logger: LoggerStrategy, settings: Settings, bootstrap: ApplicationBootstrap):
-    """Main application entry point with DI injection via pipeline."""
+@pipeline(startup_pipeline)
+def serve(
+    web_app: WebAppInterface,
+    logger: LoggerStrategy,
+    settings: Settings,
+    bootstrap: ApplicationBootstrap,
+    health_monitor: HealthMonitor,
+    listen_socket: Optional[socket.socket] = None,
+):
+    """Build the application and serve it, on its own or on a socket inherited from the pre-fork master."""
 
     # Build and initialize the application
     bootstrap.build()
 
+    # Sample RSS, CPU time, threads and GC stats of this process in the background (read them via process_sampler.to_dict())
+    if settings.process_metrics_interval:
+        process_sampler.start(settings.process_metrics_interval)
+
+    # Run the readiness checks in the background from now on; /health/ready answers 503 until the first run completes
+    health_monitor.start()
+
+    if listen_socket is not None:
+        logger.info(f"🌐 Worker {os.getpid()} serving on {settings.host}:{settings.port} with {settings.server.threads} threads")
+        web_app.serve(listen_socket, settings.server)
+        return
+
     # Get configuration from settings (injected via DI)
     host = settings.host
     port = settings.port
     debug = settings.debug
 
     logger.info(f"🌐 Starting web server on {host}:{port} (debug={debug})")
+    web_app.run(host=host, port=port, debug=debug)
+
+
+def serve_worker(listen_socket: socket.socket):
+    """Entry point of a forked worker; the DI container, connections and routes are all created here, after the fork."""
+    serve(listen_socket=listen_socket)
+
+
+@pipeline(startup_pipeline)
+def main(web_app: WebAppInterface, logger: LoggerStrategy, settings: Settings, settings_loader: CachedSettingsLoader):
+    """Main application entry point with DI injection via pipeline."""
+
+    # Record per-stage pipeline timings when enabled (read them via pipeline_profiler.snapshot())
+    if settings.pipeline_profiling:
+        pipeline_profiler.enable()
+
+    # Select the middlewares of every pipeline from settings; routes compile on first call or during warm-up
+    configure_pipelines(settings.pipelines)
 
     try:
-        # Run the web application
-        web_app.run(host=host, port=port, debug=debug)
+        if settings.server.prefork:
+            # The master preloads code and settings (the injected web_app imports the framework) and compiles every
+            # pipeline, so the chains land in the frozen heap the workers share copy-on-write. It must not open
+            # connections, so the bootstrap and its warm-up run in every worker after the fork. Its DI container is
+            # dropped in the workers, which build their own along with their own settings loader and refresher, so
+            # the master stops its refresher rather than polling the configuration source next to them
+            compile_pipelines()
+            settings_loader.stop()
+            server = settings.server
+            PreforkServer(settings.host, settings.port, server.workers, logger, backlog=server.backlog).run(serve_worker)
+        else:
+            serve()
     except KeyboardInterrupt:
         logger.info("🛑 Application stopped by user")
     except Exception as e:
@@ -25,6 +25,9 @@ if [ ! -f ".venv/bin/python" ]; then
     uv sync
 fi
 
-# Start the Flask application
-echo "Starting Flask application on port $PORT..."
+# Use the production configuration: pre-fork workers serving with the production server
+export CONFIG_FILE="${CONFIG_FILE:-config.production.json}"
+
+# Start the application
+echo "Starting application on port $PORT with $CONFIG_FILE..."
 python -m src.main
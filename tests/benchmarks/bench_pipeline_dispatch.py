@@ -0,0 +1,58 @@
+"""Microbenchmark for the per-stage dispatch overhead of function pipelines.
+
+Run with: PYTHONPATH=src python tests/benchmarks/bench_pipeline_dispatch.py
+"""
+
+import inspect
+import timeit
+
+from infrastructure.decorators.pipeline_decorator import Context, Next, create_function_pipeline
+
+STAGE_COUNTS = (0, 1, 5, 11)
+NUMBER = 20_000
+REPEAT = 7
+
+
+def noop_middleware(context: Context, next: Next):
+    return next()
+
+
+def target(value):
+    return value
+
+
+def build(stage_count: int):
+    return create_function_pipeline([noop_middleware] * stage_count)(target)
+
+
+def measure_call_time(func) -> float:
+    """Best-of-REPEAT microseconds per call."""
+    timings = timeit.repeat(lambda: func(1), number=NUMBER, repeat=REPEAT)
+    return min(timings) / NUMBER * 1e6
+
+
+def measure_stack_depth(stage_count: int) -> int:
+    """Frames between the pipeline wrapper and the target, i.e. what a traceback shows."""
+    depths = []
+
+    def depth_target(value):
+        depths.append(len(inspect.stack(0)))
+        return value
+
+    create_function_pipeline([noop_middleware] * stage_count)(depth_target)(1)
+    create_function_pipeline([])(depth_target)(1)
+    return depths[0] - depths[1]
+
+
+def main() -> None:
+    results = {count: measure_call_time(build(count)) for count in STAGE_COUNTS}
+    per_stage = (results[STAGE_COUNTS[-1]] - results[0]) / STAGE_COUNTS[-1]
+
+    for count, micros in results.items():
+        print(f"{count:>2} stages: {micros:7.3f} us/call")
+    print(f"per-stage overhead: {per_stage:.3f} us")
+    print(f"stack frames added by {STAGE_COUNTS[-1]} stages: {measure_stack_depth(STAGE_COUNTS[-1])}")
+
+
+if __name__ == "__main__":
+    main()
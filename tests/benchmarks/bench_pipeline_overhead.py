@@ -0,0 +1,241 @@
+"""Per-call overhead of pipeline() across middleware counts, target kinds and the application's real pipelines.
+
+Run from the repository root:
+
+    PYTHONPATH=src python tests/benchmarks/bench_pipeline_overhead.py
+    PYTHONPATH=src python tests/benchmarks/bench_pipeline_overhead.py --save
+    PYTHONPATH=src python tests/benchmarks/bench_pipeline_overhead.py --compare
+
+--save writes the results as the JSON baseline, --compare checks the current run against it and exits
+with status 1 when a scenario got slower than the threshold allows. Baselines are only comparable on
+the machine (and Python version) that produced them, so regenerate the baseline before comparing elsewhere.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from fakes import FakeInfrastructureModule, FakeRedis
+from flask import Flask
+from injector import Injector
+
+from infrastructure.decorators.pipeline_decorator import Context, Next, pipeline
+from infrastructure.dependency_injection_configurations import authenticated_pipeline, build_di_container, shared_pipeline
+from infrastructure.repositories import AuthRepository
+from interfaces import GreetingHttpRequest
+
+STAGE_COUNTS = (0, 1, 5, 11)
+REPEAT = 7
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "pipeline_overhead.json"
+DEFAULT_THRESHOLD = 0.25
+
+
+def noop_middleware(context: Context, next: Next):
+    return next()
+
+
+def make_middlewares(count: int) -> list[Callable[..., Any]]:
+    """Distinct no-op middlewares, since pipeline() drops repeated items."""
+    middlewares = []
+    for index in range(count):
+
+        def middleware(context: Context, next: Next):
+            return next()
+
+        middleware.__name__ = f"noop_middleware_{index}"
+        middlewares.append(middleware)
+    return middlewares
+
+
+def function_scenario(count: int) -> Callable[[], Any]:
+    @pipeline(*make_middlewares(count))
+    def target(value):
+        return value
+
+    injector = Injector()
+    return lambda: target(1, injector=injector)
+
+
+def class_scenario(count: int) -> Callable[[], Any]:
+    @pipeline(*make_middlewares(count))
+    class Target:
+        def handle(self, value):
+            return value
+
+    instance = Target()
+    injector = Injector()
+    return lambda: instance.handle(1, injector=injector)
+
+
+def nested_scenario(count: int) -> Callable[[], Any]:
+    """The same stages as function_scenario, split across nested pipelines of at most three items."""
+    middlewares = make_middlewares(count)
+    inner_pipelines = [pipeline(*middlewares[index : index + 3]) for index in range(0, count, 3)]
+
+    @pipeline(*inner_pipelines)
+    def target(value):
+        return value
+
+    injector = Injector()
+    return lambda: target(1, injector=injector)
+
+
+class ApplicationFixture:
+    """The real DI container with in-memory Redis and database, plus a Flask request for the handlers."""
+
+    def __init__(self):
+        self.redis_client = FakeRedis()
+        self.injector = build_di_container([FakeInfrastructureModule(self.redis_client)])
+
+        user_context = {
+            "user_id": "user-456",
+            "username": "demo_user",
+            "email": "demo@example.com",
+            "permissions": ["org:read"],
+            "roles": ["user"],
+        }
+        org_context = {"org_id": "org-789", "org_name": "Demo Organization"}
+        _, _, self.token = self.injector.get(AuthRepository).create_session(user_context, org_context)
+
+        self.app = Flask(__name__)
+
+    def request_context(self, method: str, json_body: Any = None, token: bool = False):
+        headers = {"Authorization": f"Bearer {self.token}"} if token else {}
+        return self.app.test_request_context("/bench", method=method, json=json_body, headers=headers)
+
+
+def shared_pipeline_scenario(fixture: ApplicationFixture) -> Callable[[], Any]:
+    @pipeline(shared_pipeline)
+    class Controller:
+        def handle(self, request: GreetingHttpRequest):
+            return {"name": request.first_name}
+
+    controller = Controller()
+    request_context = fixture.request_context("POST", {"first_name": "Ada", "last_name": "Lovelace"})
+    request_context.push()
+    request = request_context.request
+    injector = fixture.injector
+    return lambda: controller.handle(request, injector=injector)
+
+
+def authenticated_pipeline_scenario(fixture: ApplicationFixture) -> Callable[[], Any]:
+    @authenticated_pipeline
+    class Controller:
+        def handle(self, request):
+            return {"ok": True}
+
+    controller = Controller()
+    request_context = fixture.request_context("GET", token=True)
+    request_context.push()
+    request = request_context.request
+    injector, redis_client = fixture.injector, fixture.redis_client
+    # redis_cache_middleware opens its own client unless one is in the context kwargs
+    return lambda: controller.handle(request, injector=injector, redis_client=redis_client)
+
+
+def build_scenarios() -> dict[str, Callable[[], Any]]:
+    scenarios: dict[str, Callable[[], Any]] = {}
+    for count in STAGE_COUNTS:
+        scenarios[f"function/{count}"] = function_scenario(count)
+    for count in STAGE_COUNTS:
+        scenarios[f"class/{count}"] = class_scenario(count)
+    for count in STAGE_COUNTS[2:]:
+        scenarios[f"nested/{count}"] = nested_scenario(count)
+
+    fixture = ApplicationFixture()
+    scenarios["app/shared_pipeline"] = shared_pipeline_scenario(fixture)
+    scenarios["app/authenticated_pipeline"] = authenticated_pipeline_scenario(fixture)
+    return scenarios
+
+
+def check_scenario(name: str, scenario: Callable[[], Any]) -> None:
+    """Refuse to time a scenario that short-circuits, e.g. on a failed authentication."""
+    result = scenario()
+    if isinstance(result, dict) and "error" in result:
+        raise RuntimeError(f"Scenario {name} did not reach its handler: {result}")
+
+
+def measure(scenario: Callable[[], Any]) -> float:
+    """Best-of-REPEAT microseconds per call."""
+    timer = timeit.Timer(scenario)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1e6
+
+
+def run(selected: list[str]) -> dict[str, float]:
+    results = {}
+    for name, scenario in build_scenarios().items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        check_scenario(name, scenario)
+        results[name] = measure(scenario)
+        print(f"{name:<28} {results[name]:9.3f} us/call")
+    return results
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "unit": "us/call",
+        "results": {name: round(micros, 4) for name, micros in results.items()},
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+    print(f"baseline written to {path}")
+
+
+def compare(baseline: dict[str, float], results: dict[str, float], threshold: float) -> list[str]:
+    """Names of the scenarios that are slower than baseline * (1 + threshold)."""
+    regressions = []
+    print(f"\n{'scenario':<28} {'baseline':>9} {'current':>9} {'change':>8}")
+    for name, micros in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<28} {'-':>9} {micros:9.3f} {'new':>8}")
+            continue
+
+        change = micros / reference - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<28} {reference:9.3f} {micros:9.3f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare the results with the baseline")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("scenarios", nargs="*", help="only run scenarios starting with these prefixes")
+    args = parser.parse_args()
+
+    # Handlers log on every call; measure the pipeline, not the console
+    logging.disable(logging.CRITICAL)
+
+    results = run(args.scenarios)
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} scenario(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    if args.save:
+        save_baseline(args.baseline, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Per-request cost of the Flask, FastAPI and raw ASGI backends, in-process and without sockets.
+
+Run from the repository root:
+
+    PYTHONPATH=src python tests/benchmarks/bench_web_backends.py
+    PYTHONPATH=src python tests/benchmarks/bench_web_backends.py --save
+    PYTHONPATH=src python tests/benchmarks/bench_web_backends.py --compare
+
+Every backend serves the same two routes through shared_pipeline: GET /health, and POST /say_hello with a JSON body
+parsed by typed_request_middleware. WSGI requests call the Flask app directly; ASGI requests call the application
+from one running event loop, so sync handlers still pay the hop to the handler thread pool. --save and --compare
+work like in bench_pipeline_overhead.py.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from bench_pipeline_overhead import DEFAULT_THRESHOLD, REPEAT, compare, save_baseline
+
+from infrastructure import AsgiWebApp, FastAPIWebApp, FlaskWebApp, WebAppInterface, pipeline, shared_pipeline
+from interfaces import GreetingHttpRequest
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "web_backends.json"
+BATCH = 500
+SAY_HELLO_BODY = json.dumps({"first_name": "Ada", "last_name": "Lovelace"}).encode()
+
+# (method, path, body) of every benchmarked request
+REQUESTS = {
+    "health": ("GET", "/health", b""),
+    "say_hello": ("POST", "/say_hello", SAY_HELLO_BODY),
+}
+
+
+def register_routes(web_app: WebAppInterface) -> None:
+    @pipeline(shared_pipeline)
+    def health(request):
+        return web_app.create_response({"status": "healthy"}, 200)
+
+    @pipeline(shared_pipeline)
+    def say_hello(request: GreetingHttpRequest):
+        return web_app.create_response({"message": f"Hello {request.first_name} {request.last_name}!"}, 200)
+
+    web_app.add_route("/health", ["GET"], health)
+    web_app.add_route("/say_hello", ["POST"], say_hello)
+
+
+def wsgi_runner(web_app: FlaskWebApp, method: str, path: str, body: bytes) -> Callable[[int], int]:
+    """Call the WSGI application `count` times; returns the last status code."""
+    base_environ = {
+        "REQUEST_METHOD": method,
+        "SCRIPT_NAME": "",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    status = ""
+
+    def start_response(response_status, headers, exc_info=None):
+        nonlocal status
+        status = response_status
+
+    def run(count: int) -> int:
+        for _ in range(count):
+            environ = dict(base_environ)
+            environ["wsgi.input"] = io.BytesIO(body)
+            for _chunk in web_app.app(environ, start_response):
+                pass
+        return int(status.split(" ", 1)[0])
+
+    return run
+
+
+def asgi_runner(asgi_app: Any, method: str, path: str, body: bytes) -> Callable[[int], int]:
+    """Call the ASGI application `count` times from one event loop; returns the last status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    async def run_many(count: int) -> None:
+        for _ in range(count):
+            await asgi_app(dict(scope), receive, send)
+
+    loop = asyncio.new_event_loop()
+
+    def run(count: int) -> int:
+        loop.run_until_complete(run_many(count))
+        return status
+
+    return run
+
+
+def build_scenarios() -> dict[str, Callable[[int], int]]:
+    flask_app, fastapi_app, asgi_app = FlaskWebApp(), FastAPIWebApp(), AsgiWebApp()
+    for web_app in (flask_app, fastapi_app, asgi_app):
+        register_routes(web_app)
+
+    scenarios = {}
+    for name, (method, path, body) in REQUESTS.items():
+        scenarios[f"flask/{name}"] = wsgi_runner(flask_app, method, path, body)
+        scenarios[f"fastapi/{name}"] = asgi_runner(fastapi_app.app, method, path, body)
+        scenarios[f"asgi/{name}"] = asgi_runner(asgi_app, method, path, body)
+    return scenarios
+
+
+def measure(run: Callable[[int], int]) -> float:
+    """Best-of-REPEAT microseconds per request."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        run(BATCH)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / BATCH * 1e6
+
+
+def run(selected: list[str]) -> dict[str, float]:
+    results = {}
+    for name, scenario in build_scenarios().items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        status = scenario(1)
+        if status != 200:
+            raise RuntimeError(f"Scenario {name} answered {status} instead of 200")
+        results[name] = measure(scenario)
+        print(f"{name:<28} {results[name]:9.3f} us/request")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare the results with the baseline")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("scenarios", nargs="*", help="only run scenarios starting with these prefixes")
+    args = parser.parse_args()
+
+    # Handlers log on every call; measure the backends, not the console
+    logging.disable(logging.CRITICAL)
+
+    results = run(args.scenarios)
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} scenario(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+
+    if args.save:
+        save_baseline(args.baseline, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""In-memory stand-ins for Redis and the database, so benchmarks measure the framework and not the network."""
+
+import time
+from typing import Any, Optional
+
+import redis
+from injector import Module, provider, singleton
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.pool import StaticPool
+
+
+class FakeRedis:
+    """The subset of redis.Redis used by AuthRepository and redis_cache_middleware, backed by a dict."""
+
+    def __init__(self):
+        self._store: dict[str, tuple[Any, Optional[float]]] = {}
+
+    def _alive(self, key: str) -> bool:
+        entry = self._store.get(key)
+        if entry is None:
+            return False
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            return False
+        return True
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key: str) -> Any:
+        return self._store[key][0] if self._alive(key) else None
+
+    def set(self, key: str, value: Any) -> bool:
+        self._store[key] = (value, None)
+        return True
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        self._store[key] = (value, time.monotonic() + ttl)
+        return True
+
+    def expire(self, key: str, ttl: int) -> bool:
+        if not self._alive(key):
+            return False
+        self._store[key] = (self._store[key][0], time.monotonic() + ttl)
+        return True
+
+    def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._store.pop(key, None) is not None)
+
+
+class FakeInfrastructureModule(Module):
+    """Overrides the Redis client and database engine bindings with in-memory implementations."""
+
+    def __init__(self, redis_client: Optional[FakeRedis] = None):
+        self.redis_client = redis_client or FakeRedis()
+
+    def configure(self, binder):
+        binder.bind(redis.Redis, to=self.redis_client, scope=singleton)
+
+    @singleton
+    @provider
+    def provide_database_engine(self) -> Engine:
+        return create_engine("sqlite:///:memory:", poolclass=StaticPool, connect_args={"check_same_thread": False})
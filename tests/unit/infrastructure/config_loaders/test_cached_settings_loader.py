@@ -0,0 +1,155 @@
+import json
+import os
+import time
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from injector import Injector
+from pydantic import ValidationError
+
+from infrastructure import JsonConfigLoader, JsonConfigLoaderArgs, Settings, SettingsModule
+from infrastructure.config_loaders import CachedSettingsLoader
+
+BASE_CONFIG = {
+    "project_env": "local",
+    "default_name": "World",
+    "greeting_type": "time_based",
+    "greeting_language": "en",
+    "web_framework": "flask",
+}
+
+
+class TestCachedSettingsLoader:
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(BASE_CONFIG))
+        return config_file
+
+    @pytest.fixture
+    def settings_loader(self, config_file) -> CachedSettingsLoader[Settings]:
+        return CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings, refresh_interval=0
+        )
+
+    def test_unchanged_source_is_loaded_once(self, settings_loader):
+        with patch.object(JsonConfigLoader, "load", autospec=True, side_effect=JsonConfigLoader.load) as load:
+            first = settings_loader.get()
+            second = settings_loader.get()
+
+        assert first is second
+        assert load.call_count == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_forked_worker_starts_its_own_refresher(self, config_file):
+        settings_loader = CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings, refresh_interval=60
+        )
+        settings = settings_loader.get()
+        parent_refresher = settings_loader._refresher
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            # The parent's refresher thread does not exist in the child; the first get() replaces it
+            inherited_alive = parent_refresher.is_alive()
+            same_snapshot = settings_loader.get() is settings
+            refresher = settings_loader._refresher
+            restarted = refresher is not parent_refresher and refresher.is_alive()
+            os.write(write_fd, f"{inherited_alive:d}{same_snapshot:d}{restarted:d}".encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        report = os.read(read_fd, 3)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert report == b"011"
+        assert settings_loader._refresher is parent_refresher and parent_refresher.is_alive()
+        settings_loader.stop()
+
+    def test_changed_source_is_reloaded(self, settings_loader, config_file):
+        assert settings_loader.get().default_name == "World"
+
+        config_file.write_text(json.dumps({**BASE_CONFIG, "default_name": "Everyone"}))
+
+        assert settings_loader.refresh()
+        assert settings_loader.get().default_name == "Everyone"
+
+    def test_invalid_change_keeps_previous_snapshot(self, settings_loader, config_file):
+        settings = settings_loader.get()
+
+        config_file.write_text(json.dumps({**BASE_CONFIG, "port": "not-a-port"}))
+
+        assert not settings_loader.refresh()
+        assert settings_loader.get() is settings
+        assert isinstance(settings_loader.last_refresh_error, ValidationError)
+
+    def test_get_does_not_check_the_source_once_loaded(self, config_file):
+        settings_loader = CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings, refresh_interval=60
+        )
+        settings_loader.get()
+
+        with patch.object(JsonConfigLoader, "get_version") as get_version:
+            for _ in range(10):
+                settings_loader.get()
+
+        get_version.assert_not_called()
+        settings_loader.stop()
+
+    def test_changes_are_picked_up_in_the_background(self, config_file):
+        settings_loader = CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings, refresh_interval=0.01
+        )
+        settings_loader.get()
+
+        config_file.write_text(json.dumps({**BASE_CONFIG, "default_name": "Everyone"}))
+
+        deadline = time.monotonic() + 5
+        while settings_loader.get().default_name != "Everyone" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert settings_loader.get().default_name == "Everyone"
+        settings_loader.stop()
+
+    def test_snapshot_is_immutable(self, settings_loader):
+        with pytest.raises(ValidationError):
+            settings_loader.get().port = 9000
+
+    def test_settings_module_shares_the_snapshot(self, config_file):
+        injector = Injector([SettingsModule(JsonConfigLoaderArgs(file_path=str(config_file)))])
+
+        assert injector.get(Settings) is injector.get(Settings)
+
+    def test_unreachable_source_is_reported(self, settings_loader, config_file):
+        settings = settings_loader.get()
+
+        config_file.unlink()
+
+        assert not settings_loader.refresh()
+        assert settings_loader.get() is settings
+        assert settings_loader.last_refresh_error is not None
+
+    def test_local_files_are_not_polled_by_default(self, config_file):
+        settings_loader = CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings
+        )
+
+        settings_loader.get()
+
+        assert settings_loader.refresh_interval == 0
+        assert settings_loader._refresher is None
+
+    def test_remote_sources_are_polled_at_the_configured_interval(self, config_file):
+        config_file.write_text(json.dumps(BASE_CONFIG | {"config_refresh_interval": 45}))
+        settings_loader = CachedSettingsLoader(
+            config_loader_args=JsonConfigLoaderArgs(file_path=str(config_file)), SettingsClass=Settings
+        )
+
+        with patch.object(JsonConfigLoader, "is_remote", new_callable=PropertyMock, return_value=True):
+            settings_loader.get()
+
+        assert settings_loader.refresh_interval == 45
+        assert settings_loader._refresher is not None and settings_loader._refresher.is_alive()
+        settings_loader.stop()
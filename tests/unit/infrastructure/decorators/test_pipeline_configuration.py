@@ -0,0 +1,94 @@
+import pytest
+from injector import Injector
+
+from infrastructure.decorators import Context, Next, compile_pipelines, configurable_pipeline, configure_pipelines, pipeline
+from infrastructure.decorators.pipeline_decorator import LazyPipelineMethod
+from infrastructure.models.settings import PipelineSettings, RoutePipelineSettings
+
+calls: list[str] = []
+
+
+def first_middleware(context: Context, next: Next):
+    calls.append("first")
+    return next()
+
+
+def second_middleware(context: Context, next: Next):
+    calls.append("second")
+    return next()
+
+
+registry = {item.__name__: item for item in (first_middleware, second_middleware)}
+configurable = configurable_pipeline("configurable", first_middleware, second_middleware, registry=registry)
+
+
+@configurable
+def configured_target():
+    return "done"
+
+
+@pipeline(configurable)
+def nested_configured_target():
+    return "done"
+
+
+class TestPipelineConfiguration:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        calls.clear()
+        yield
+        configure_pipelines({})
+
+    def test_defaults_are_used_without_configuration(self):
+        configure_pipelines({})
+
+        assert configured_target(injector=Injector()) == "done"
+        assert calls == ["first", "second"]
+
+    def test_disabled_middlewares_are_left_out_of_the_chain(self):
+        configure_pipelines({"configurable": PipelineSettings(disabled_middlewares=["first_middleware"])})
+
+        configured_target(injector=Injector())
+        nested_configured_target(injector=Injector())
+
+        assert calls == ["second", "second"]
+
+    def test_route_configuration_overrides_the_pipeline(self):
+        configure_pipelines(
+            {
+                "configurable": PipelineSettings(
+                    middlewares=["second_middleware", "first_middleware"],
+                    routes={"configured_target": RoutePipelineSettings(disabled_middlewares=["second_middleware"])},
+                )
+            }
+        )
+
+        configured_target(injector=Injector())
+        nested_configured_target(injector=Injector())
+
+        assert calls == ["first", "second", "first"]
+
+    def test_unknown_middleware_names_fail_at_configuration_time(self):
+        with pytest.raises(ValueError, match="Unknown middleware 'missing_middleware'"):
+            configure_pipelines({"configurable": PipelineSettings(disabled_middlewares=["missing_middleware"])})
+
+    def test_class_methods_compile_on_first_use_with_the_current_configuration(self):
+        @configurable
+        class Greeter:
+            def greet(self):
+                return "hello"
+
+            def unused(self):
+                return None
+
+        assert isinstance(Greeter.__dict__["greet"], LazyPipelineMethod)
+        configure_pipelines({"configurable": PipelineSettings(disabled_middlewares=["second_middleware"])})
+        assert isinstance(Greeter.__dict__["greet"], LazyPipelineMethod)
+
+        assert Greeter().greet(injector=Injector()) == "hello"
+        assert calls == ["first"]
+        assert not isinstance(Greeter.__dict__["greet"], LazyPipelineMethod)
+        assert isinstance(Greeter.__dict__["unused"], LazyPipelineMethod)
+
+        compile_pipelines()
+        assert not isinstance(Greeter.__dict__["unused"], LazyPipelineMethod)
@@ -0,0 +1,222 @@
+import asyncio
+import inspect
+from unittest.mock import MagicMock, patch
+
+import pytest
+from injector import Injector, singleton
+
+from infrastructure.decorators.pipeline_decorator import (
+    CallPlan,
+    Context,
+    LayeredKwargs,
+    Next,
+    clean_kwargs_for_target,
+    create_function_pipeline,
+    pipeline,
+)
+from infrastructure.logger import LoggerStrategy
+from infrastructure.middlewares import error_handling_middleware
+
+
+def tag_middleware(context: Context, next: Next):
+    context.kwargs["tag"] = "tagged"
+    return next()
+
+
+class TestCallPlan:
+    def test_clean_kwargs_matches_legacy_filter(self):
+        def target(a, b, tag=None):
+            return a, b, tag
+
+        kwargs = {"b": 2, "tag": "x", "injector": object()}
+
+        assert CallPlan.from_callable(target).clean_kwargs((1,), kwargs) == {"b": 2, "tag": "x"}
+        assert clean_kwargs_for_target(target, (1, 2), kwargs) == {"tag": "x"}
+
+    def test_clean_kwargs_keeps_extra_keys_for_var_keyword(self):
+        def target(a, **kwargs):
+            return a, kwargs
+
+        assert CallPlan.from_callable(target).clean_kwargs((1,), {"a": 0, "extra": 1}) == {"extra": 1}
+
+
+class TestPipelineCompilation:
+    def test_signatures_are_resolved_at_decoration_time(self):
+        @pipeline(tag_middleware)
+        def target(value, tag=None):
+            return value, tag
+
+        injector = Injector()
+
+        with patch.object(CallPlan, "from_callable") as from_callable:
+            assert target(1, injector=injector) == (1, "tagged")
+            assert target(2, injector=injector) == (2, "tagged")
+
+        from_callable.assert_not_called()
+
+    def test_class_methods_receive_self_and_context_kwargs(self):
+        @pipeline(tag_middleware)
+        class Greeter:
+            def greet(self, name, tag=None):
+                return f"{name}:{tag}"
+
+        assert Greeter().greet("bob", injector=Injector()) == "bob:tagged"
+
+    def test_class_methods_compile_lazily_and_once(self):
+        with patch.object(CallPlan, "from_callable", wraps=CallPlan.from_callable) as from_callable:
+
+            @pipeline(tag_middleware)
+            class Greeter:
+                def greet(self, name, tag=None):
+                    return f"{name}:{tag}"
+
+                def unused(self):
+                    return None
+
+            # Only the shared middleware plan is resolved up front, no method is compiled yet
+            assert from_callable.call_count == 1
+
+            greeter = Greeter()
+            greeter.greet("bob", injector=Injector())
+            greeter.greet("alice", injector=Injector())
+
+        assert from_callable.call_count == 2
+        assert "unused" in Greeter.__dict__ and not getattr(Greeter.__dict__["unused"], "__is_pipeline__", False)
+        assert Greeter.__dict__["greet"].__is_pipeline__
+
+
+class TestAsyncPipeline:
+    def test_async_target_and_middlewares_run_on_the_event_loop(self):
+        calls = []
+
+        async def async_middleware(context: Context, next: Next):
+            calls.append("before")
+            result = await next()
+            calls.append("after")
+            return result
+
+        @pipeline(async_middleware, tag_middleware)
+        async def target(value, tag=None):
+            await asyncio.sleep(0)
+            return value, tag
+
+        assert inspect.iscoroutinefunction(target)
+        assert asyncio.run(target(1, injector=Injector())) == (1, "tagged")
+        assert calls == ["before", "after"]
+
+    def test_sync_middleware_sees_async_downstream_errors(self):
+        @pipeline(error_handling_middleware)
+        async def target():
+            raise ValueError("boom")
+
+        injector = Injector()
+        injector.binder.bind(LoggerStrategy, MagicMock(spec=LoggerStrategy))
+
+        assert asyncio.run(target(injector=injector))["status"] == 400
+
+
+class TestNestedPipelines:
+    def test_nested_pipelines_are_inlined_without_duplicates(self):
+        calls = []
+
+        def first_middleware(context: Context, next: Next):
+            calls.append("first")
+            return next()
+
+        def second_middleware(context: Context, next: Next):
+            calls.append("second")
+            return next()
+
+        inner = pipeline(first_middleware, tag_middleware)
+        outer = pipeline(inner, first_middleware, second_middleware)
+
+        assert outer.__pipeline_items__ == (first_middleware, tag_middleware, second_middleware)
+
+        @outer
+        def target(tag=None):
+            return tag
+
+        assert target(injector=Injector()) == "tagged"
+        assert calls == ["first", "second"]
+
+
+class TestDispatch:
+    def test_middleware_can_call_next_more_than_once(self):
+        attempts = []
+
+        def retry_middleware(context: Context, next: Next):
+            try:
+                return next()
+            except RuntimeError:
+                return next()
+
+        def flaky_target():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("first attempt fails")
+            return len(attempts)
+
+        assert create_function_pipeline([retry_middleware, retry_middleware])(flaky_target)() == 2
+
+    def test_short_circuit_skips_remaining_stages(self):
+        def stop_middleware(context: Context, next: Next):
+            return "stopped"
+
+        def unreachable_middleware(context: Context, next: Next):
+            raise AssertionError("should not run")
+
+        assert create_function_pipeline([stop_middleware, unreachable_middleware])(lambda: "target")() == "stopped"
+
+
+class TestLayeredKwargs:
+    def test_writes_go_to_the_overlay_without_touching_the_base(self):
+        base = {"injector": "container", "name": "base"}
+        kwargs = LayeredKwargs(base)
+
+        kwargs["name"] = "overlay"
+        kwargs["session_id"] = "abc"
+
+        assert base == {"injector": "container", "name": "base"}
+        assert dict(kwargs) == {"name": "overlay", "session_id": "abc", "injector": "container"}
+        assert kwargs.get("injector") == "container"
+        assert "missing" not in kwargs and len(kwargs) == 3
+
+    def test_context_is_slotted(self):
+        context = Context(len, (), LayeredKwargs())
+
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.unknown = 1  # type: ignore[attr-defined]
+
+
+class SingletonDependency:
+    pass
+
+
+class TransientDependency:
+    pass
+
+
+class TestInjectionPlan:
+    def test_singletons_are_cached_and_other_scopes_re_resolved(self):
+        injector = Injector()
+        injector.binder.bind(SingletonDependency, to=SingletonDependency, scope=singleton)
+        seen = []
+
+        def dependency_middleware(context: Context, next: Next, shared: SingletonDependency, fresh: TransientDependency):
+            seen.append((shared, fresh))
+            return next()
+
+        @pipeline(dependency_middleware)
+        def target():
+            return "done"
+
+        with patch.object(injector, "get", wraps=injector.get) as get:
+            assert target(injector=injector) == "done"
+            assert target(injector=injector) == "done"
+
+        requested = [call.args[0] for call in get.call_args_list]
+        assert requested.count(SingletonDependency) == 1
+        assert requested.count(TransientDependency) == 2
+        assert seen[0][0] is seen[1][0]
+        assert seen[0][1] is not seen[1][1]
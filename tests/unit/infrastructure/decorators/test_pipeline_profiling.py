@@ -0,0 +1,79 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from infrastructure.decorators.pipeline_decorator import Context, Next, create_function_pipeline
+from infrastructure.decorators.pipeline_profiling import pipeline_profiler
+from infrastructure.metrics import Histogram
+
+
+def sleeping_middleware(context: Context, next: Next):
+    time.sleep(0.01)
+    return next()
+
+
+def passthrough_middleware(context: Context, next: Next):
+    return next()
+
+
+def profiled_target():
+    time.sleep(0.02)
+    return "done"
+
+
+async def async_profiled_target():
+    await asyncio.sleep(0.02)
+    return "done"
+
+
+class TestPipelineProfiling:
+    @pytest.fixture(autouse=True)
+    def profiler(self):
+        pipeline_profiler.reset()
+        pipeline_profiler.enable()
+        yield pipeline_profiler
+        pipeline_profiler.disable()
+        pipeline_profiler.reset()
+
+    def _stages(self, target) -> dict:
+        route = pipeline_profiler.snapshot()[f"{target.__module__}.{target.__qualname__}"]
+        return {stage["stage"]: stage for stage in route["stages"]}
+
+    def test_records_inclusive_and_exclusive_time_per_stage(self):
+        pipelined = create_function_pipeline([sleeping_middleware, passthrough_middleware])(profiled_target)
+
+        assert pipelined() == "done"
+
+        stages = self._stages(profiled_target)
+        assert list(stages) == ["sleeping_middleware", "passthrough_middleware", "profiled_target"]
+        assert stages["sleeping_middleware"]["inclusive"]["sum"] >= 0.03
+        assert 0.01 <= stages["sleeping_middleware"]["exclusive"]["sum"] < 0.02
+        assert stages["passthrough_middleware"]["exclusive"]["sum"] < 0.005
+        assert stages["profiled_target"]["exclusive"]["count"] == 1
+
+    def test_async_pipelines_are_profiled(self):
+        pipelined = create_function_pipeline([passthrough_middleware])(async_profiled_target)
+
+        assert asyncio.run(pipelined()) == "done"
+
+        stages = self._stages(async_profiled_target)
+        assert stages["async_profiled_target"]["inclusive"]["sum"] >= 0.02
+
+    def test_snapshot_is_json_serializable(self):
+        create_function_pipeline([passthrough_middleware])(profiled_target)()
+
+        assert json.loads(pipeline_profiler.to_json())
+
+
+class TestHistogram:
+    def test_percentiles_use_bucket_upper_bounds(self):
+        histogram = Histogram(buckets=(0.001, 0.01, 0.1))
+        for value in (0.0005,) * 98 + (0.05, 0.5):
+            histogram.observe(value)
+
+        assert histogram.percentile(50) == 0.001
+        assert histogram.percentile(99) == 0.1
+        assert histogram.percentile(100) == 0.5
+        assert histogram.to_dict()["buckets"]["+Inf"] == 1
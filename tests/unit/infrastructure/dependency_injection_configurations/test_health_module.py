@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from injector import Injector
+
+from infrastructure import HealthModule, HealthMonitor, JsonConfigLoaderArgs, LoggingModule, SettingsModule, WebFrameworkModule
+from infrastructure.config_loaders import CachedSettingsLoader
+
+CONFIG = {
+    "project_env": "local",
+    "default_name": "World",
+    "greeting_type": "time_based",
+    "greeting_language": "en",
+    "web_framework": "flask",
+}
+
+
+class TestConfigHealthCheck:
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(CONFIG))
+        return config_file
+
+    @pytest.fixture
+    def injector(self, config_file) -> Injector:
+        settings_module = SettingsModule(JsonConfigLoaderArgs(file_path=str(config_file)), refresh_interval=0)
+        return Injector([settings_module, LoggingModule(), WebFrameworkModule(), HealthModule()])
+
+    def test_passes_while_the_source_is_readable(self, injector):
+        injector.get(HealthMonitor).checks["config"]()
+
+    def test_fails_once_a_refresh_fails(self, injector, config_file):
+        check_config = injector.get(HealthMonitor).checks["config"]
+        check_config()
+
+        config_file.unlink()
+        injector.get(CachedSettingsLoader).refresh()
+
+        with pytest.raises(RuntimeError, match="refresh failed"):
+            check_config()
+
+    def test_fails_when_the_source_is_no_longer_checked(self, injector):
+        settings_loader = injector.get(CachedSettingsLoader)
+        check_config = injector.get(HealthMonitor).checks["config"]
+        check_config()
+
+        settings_loader.refresh_interval = 1.0
+        settings_loader.last_refreshed_at -= 60
+
+        with pytest.raises(RuntimeError, match="not checked"):
+            check_config()
+        settings_loader.stop()
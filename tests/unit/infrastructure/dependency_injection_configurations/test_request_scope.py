@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from injector import Injector, Module, provider, singleton
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from infrastructure.decorators import Context, Next, pipeline
+from infrastructure.dependency_injection_configurations import open_request_scope, request_scoped
+from infrastructure.dependency_injection_configurations.repositories_module import RepositoriesModule
+from infrastructure.dependency_injection_configurations.sqlalchemy_module import SQLAlchemyModule
+from infrastructure.middlewares import request_scope_middleware
+from infrastructure.repositories import OrganizationRepository, UserRepository
+
+
+class Resource:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ResourceModule(Module):
+    def configure(self, binder):
+        binder.bind(Resource, to=Resource, scope=request_scoped)
+
+
+class InMemoryEngineModule(Module):
+    @singleton
+    @provider
+    def provide_database_engine(self) -> Engine:
+        return create_engine("sqlite:///:memory:")
+
+
+class FileEngineModule(Module):
+    def __init__(self, path):
+        self.path = path
+
+    @singleton
+    @provider
+    def provide_database_engine(self) -> Engine:
+        return create_engine(f"sqlite:///{self.path}", poolclass=QueuePool, pool_size=2, max_overflow=0)
+
+
+class TestRequestScope:
+    @pytest.fixture
+    def injector(self) -> Injector:
+        return Injector([ResourceModule()])
+
+    def test_one_instance_per_request(self, injector):
+        with open_request_scope():
+            first = injector.get(Resource)
+            assert injector.get(Resource) is first
+
+        with open_request_scope():
+            assert injector.get(Resource) is not first
+
+    def test_instances_are_closed_when_the_request_ends(self, injector):
+        with open_request_scope():
+            resource = injector.get(Resource)
+            assert not resource.closed
+
+        assert resource.closed
+
+    def test_nested_scopes_join_the_enclosing_request(self, injector):
+        with open_request_scope():
+            resource = injector.get(Resource)
+            with open_request_scope():
+                assert injector.get(Resource) is resource
+            assert not resource.closed
+
+    def test_resolving_outside_a_request_fails(self, injector):
+        with pytest.raises(RuntimeError, match="outside of a request"):
+            injector.get(Resource)
+
+    def test_repositories_share_the_request_session(self):
+        injector = Injector([SQLAlchemyModule(), InMemoryEngineModule(), RepositoriesModule()])
+
+        with patch.object(Session, "close", autospec=True) as close:
+            with open_request_scope():
+                user_repository = injector.get(UserRepository)
+                assert injector.get(OrganizationRepository).db_session is user_repository.db_session
+                close.assert_not_called()
+
+        close.assert_called_once_with(user_repository.db_session)
+
+    def test_concurrent_requests_get_their_own_connection_back_in_the_pool(self, tmp_path):
+        injector = Injector([SQLAlchemyModule(), FileEngineModule(tmp_path / "app.db"), RepositoriesModule()])
+        engine = injector.get(Engine)
+        both_checked_out = threading.Barrier(2, timeout=5)
+        checked_out = []
+
+        def handle_request():
+            with open_request_scope():
+                connection = injector.get(Session).connection().connection.dbapi_connection
+                both_checked_out.wait()
+                checked_out.append(engine.pool.checkedout())
+                both_checked_out.wait()
+                return connection
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first, second = executor.map(lambda _: handle_request(), range(2))
+
+        assert first is not second
+        assert checked_out == [2, 2]
+        assert engine.pool.checkedout() == 0
+
+
+class TestSQLAlchemyModule:
+    def test_database_engine_pools_connections(self):
+        settings = MagicMock(db_host="db", db_port=5432, db_name="app", db_user="app", db_password="secret", debug=False)
+
+        with patch.object(Engine, "connect"):
+            engine = SQLAlchemyModule().provide_database_engine(settings, MagicMock())
+
+        assert engine.dialect.name == "postgresql"
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 10
+
+
+class TestRequestScopeMiddleware:
+    def test_pipeline_runs_in_a_request_scope(self):
+        injector = Injector([ResourceModule()])
+
+        def resolve_middleware(context: Context, next: Next):
+            context.kwargs["resource"] = injector.get(Resource)
+            return next()
+
+        @pipeline(request_scope_middleware, resolve_middleware)
+        def handler(resource=None):
+            assert not resource.closed
+            return resource
+
+        resource = handler(injector=injector)
+
+        assert resource.closed
+        assert handler(injector=injector) is not resource
+
+    def test_async_pipeline_closes_after_the_handler_completes(self):
+        injector = Injector([ResourceModule()])
+
+        @pipeline(request_scope_middleware)
+        async def handler():
+            await asyncio.sleep(0)
+            resource = injector.get(Resource)
+            assert not resource.closed
+            return resource
+
+        assert asyncio.run(handler(injector=injector)).closed
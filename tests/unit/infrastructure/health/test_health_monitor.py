@@ -0,0 +1,45 @@
+import json
+import threading
+from unittest.mock import Mock
+
+from infrastructure import HealthMonitor
+
+
+def failing_check():
+    raise ConnectionError("Connection refused")
+
+
+class TestHealthMonitor:
+    def test_is_not_ready_before_the_first_refresh(self):
+        status_code, body = HealthMonitor({"redis": lambda: True}, Mock()).readiness
+
+        assert (status_code, json.loads(body)["status"]) == (503, "starting")
+
+    def test_reports_every_check(self):
+        monitor = HealthMonitor({"redis": lambda: True, "database": failing_check}, Mock())
+
+        status_code, body = monitor.refresh()
+
+        checks = json.loads(body)["checks"]
+        assert (status_code, json.loads(body)["status"]) == (503, "not_ready")
+        assert checks["redis"]["status"] == "up"
+        assert (checks["database"]["status"], checks["database"]["error"]) == ("down", "Connection refused")
+        assert monitor.readiness == (status_code, body)
+
+    def test_refreshes_in_the_background(self):
+        calls = []
+        refreshed_twice = threading.Event()
+
+        def check():
+            calls.append(1)
+            if len(calls) == 2:
+                refreshed_twice.set()
+
+        monitor = HealthMonitor({"config": check}, Mock(), interval=0.01)
+        monitor.start()
+        try:
+            assert refreshed_twice.wait(timeout=5)
+        finally:
+            monitor.stop()
+
+        assert monitor.readiness[0] == 200
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from infrastructure import HdrHistogram, WindowedHistogram
+
+
+class TestHdrHistogram:
+    def test_percentiles_are_within_the_bucket_precision(self):
+        values = [random.uniform(0.0001, 2.0) for _ in range(20_000)]
+        histogram = HdrHistogram()
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for percent in (50, 99, 99.9):
+            exact = values[int(percent / 100 * len(values)) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+        assert histogram.count == len(values) and histogram.max == values[-1]
+
+    def test_values_above_the_highest_trackable_land_in_the_last_bucket(self):
+        histogram = HdrHistogram(highest=1.0)
+        size = len(histogram.counts)
+
+        histogram.record(30.0)
+
+        assert len(histogram.counts) == size and histogram.counts[-1] == 1
+        assert histogram.percentile(50) == 30.0
+
+    def test_merges_histograms_of_other_threads_and_processes(self):
+        first, second = HdrHistogram(), HdrHistogram()
+        for value in (0.001, 0.002):
+            first.record(value)
+        second.record(0.5)
+
+        first.merge(HdrHistogram.from_bytes(second.to_bytes()))
+
+        assert first.count == 3 and first.max == 0.5 and first.percentile(100) == 0.5
+        assert first.percentile(50) == pytest.approx(0.002, rel=0.02)
+        with pytest.raises(ValueError):
+            first.merge(HdrHistogram(sub_bucket_bits=5))
+
+
+class TestWindowedHistogram:
+    def test_only_reports_the_slices_inside_the_window(self):
+        now = [0.0]
+        histogram = WindowedHistogram(slice_seconds=60, slices=2, clock=lambda: now[0])
+
+        histogram.record(1.0)
+        now[0] = 61
+        histogram.record(0.01)
+        assert histogram.snapshot().count == 2
+
+        now[0] = 121
+        histogram.record(0.02)
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 2 and snapshot.max == 0.02
+        assert (histogram.total_count, histogram.total_sum) == (3, pytest.approx(1.03))
+
+    def test_reuses_the_slices_of_the_ring(self):
+        now = [0.0]
+        histogram = WindowedHistogram(slice_seconds=1, slices=3, clock=lambda: now[0])
+
+        for second in range(10):
+            now[0] = second
+            histogram.record(0.001)
+
+        assert histogram.snapshot().count == 3
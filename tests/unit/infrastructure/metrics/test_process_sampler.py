@@ -0,0 +1,44 @@
+import threading
+
+from infrastructure import ProcessMetricsSampler
+
+
+class TestProcessMetricsSampler:
+    def test_sample_reads_the_process_and_gc_state(self):
+        sampler = ProcessMetricsSampler()
+
+        first = sampler.sample()
+        sum(range(200_000))
+        second = sampler.sample()
+
+        assert first.rss_bytes > 0 and first.threads >= 1
+        assert len(first.gc_counts) == len(first.gc_collections) == 3
+        assert second.cpu_user + second.cpu_system >= first.cpu_user + first.cpu_system
+        assert sampler.samples() == [first, second]
+
+    def test_ring_buffer_keeps_the_latest_samples(self):
+        sampler = ProcessMetricsSampler(capacity=2)
+
+        samples = [sampler.sample() for _ in range(3)]
+
+        assert sampler.samples() == samples[1:]
+        assert sampler.to_dict()["samples"] == 2
+
+    def test_samples_in_the_background(self):
+        sampler = ProcessMetricsSampler()
+        sampled_twice = threading.Event()
+        sample = sampler.sample
+
+        def counting_sample():
+            result = sample()
+            if len(sampler.samples()) >= 2:
+                sampled_twice.set()
+            return result
+
+        sampler.sample = counting_sample
+        sampler.start(interval=0.01)
+        try:
+            assert sampled_twice.wait(timeout=5)
+        finally:
+            sampler.stop()
+        assert not sampler.running
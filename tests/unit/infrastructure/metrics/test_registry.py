@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from infrastructure import MetricsRegistry
+from infrastructure.metrics.registry import ThreadCells
+
+
+class TestMetricsRegistry:
+    def test_counts_from_every_thread_add_up(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("route",))
+
+        def record():
+            for _ in range(1000):
+                requests.labels("hello").inc()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert requests.labels("hello").value == 4000
+
+    def test_cells_of_exited_threads_are_folded_into_the_base(self):
+        cells = ThreadCells(2)
+
+        def record():
+            cell = cells.cell()
+            cell[0] += 1
+            cell[1] += 0.5
+
+        for _ in range(10):
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join()
+        cells.cell()[0] += 1
+
+        assert len(cells._cells) == 1
+        assert cells.totals() == [11, 5.0]
+
+    def test_exposes_the_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests handled", ("route", "status")).labels("say_hello", 200).inc(2)
+        in_flight = registry.gauge("in_flight", "Requests being handled")
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+
+        assert registry.expose() == (
+            "# HELP requests_total Requests handled\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="say_hello",status="200"} 2\n'
+            "# HELP in_flight Requests being handled\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 1\n"
+            "# HELP latency_seconds Latency\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{le="0.1"} 1\n'
+            'latency_seconds_bucket{le="1.0"} 2\n'
+            'latency_seconds_bucket{le="+Inf"} 3\n'
+            "latency_seconds_sum 5.55\n"
+            "latency_seconds_count 3\n"
+        )
+
+    def test_escapes_label_values(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("message",)).labels('say "hi"\n').inc()
+
+        assert 'errors_total{message="say \\"hi\\"\\n"} 1' in registry.expose()
+
+    def test_function_gauges_are_read_at_exposition_time_and_survive_a_reset(self):
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("queue_depth", "Queue depth").set_function(lambda: depth[0])
+        registry.gauge("unknown", "Nothing sampled yet").set_function(lambda: None)
+
+        depth[0] = 5
+        registry.reset()
+
+        exposition = registry.expose()
+        assert "\nqueue_depth 5\n" in exposition and "\nunknown " not in exposition
+
+    def test_registering_twice_returns_the_same_metric_unless_it_conflicts(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ("route",))
+
+        assert registry.counter("requests_total", "Requests", ("route",)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests", ("route",))
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
@@ -0,0 +1,76 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from injector import Injector
+
+from infrastructure import container_builder_middleware, pipeline
+
+
+class TestContainerBuilderMiddleware:
+    @pytest.fixture
+    def build_di_container(self):
+        with patch(
+            "infrastructure.middlewares.container_builder_middleware.build_di_container", side_effect=lambda _: Injector()
+        ) as build_di_container:
+            yield build_di_container
+
+    def test_container_is_built_on_first_use(self, build_di_container):
+        @pipeline(container_builder_middleware())
+        def target(injector: Injector):
+            return injector
+
+        assert build_di_container.call_count == 0
+        assert target() is target()
+        assert build_di_container.call_count == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+    def test_forked_worker_builds_its_own_container(self, build_di_container):
+        @pipeline(container_builder_middleware())
+        def target(injector: Injector):
+            return injector
+
+        parent_container = target()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            target()
+            os.write(write_fd, str(build_di_container.call_count).encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        builds_in_child = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert builds_in_child == b"2"
+        assert target() is parent_container
+        assert build_di_container.call_count == 1
+
+    def test_concurrent_first_requests_build_one_container(self, build_di_container):
+        started = threading.Barrier(8)
+
+        def build(_):
+            time.sleep(0.01)
+            return Injector()
+
+        build_di_container.side_effect = build
+
+        @pipeline(container_builder_middleware())
+        def target(injector: Injector):
+            return injector
+
+        def first_request():
+            started.wait()
+            return target()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            containers = list(executor.map(lambda _: first_request(), range(8)))
+
+        assert build_di_container.call_count == 1
+        assert all(container is containers[0] for container in containers)
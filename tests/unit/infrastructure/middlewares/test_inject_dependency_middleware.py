@@ -0,0 +1,47 @@
+import inspect
+from unittest.mock import patch
+
+import pytest
+from injector import Injector
+
+from infrastructure import Context, inject_dependency_middleware
+
+
+class Greeter:
+    pass
+
+
+def greet(name, greeter: Greeter, punctuation="!"):
+    return name, greeter, punctuation
+
+
+def run(func, args, kwargs):
+    context = Context(func, args, kwargs)
+    return inject_dependency_middleware(context, lambda: context.func(*context.args))
+
+
+class TestInjectDependencyMiddleware:
+    def test_injects_typed_parameters_and_applies_defaults(self):
+        name, greeter, punctuation = run(greet, ("Ada",), {"injector": Injector()})
+
+        assert (name, type(greeter), punctuation) == ("Ada", Greeter, "!")
+
+    def test_context_kwargs_fill_parameters_before_injection(self):
+        greeter = Greeter()
+
+        assert run(greet, (), {"name": "Ada", "greeter": greeter}) == ("Ada", greeter, "!")
+
+    def test_signature_is_only_inspected_on_the_first_call(self):
+        injector = Injector()
+        # Bound to an instance, so the injector has no constructor of its own to inspect
+        injector.binder.bind(Greeter, to=Greeter())
+        run(greet, ("Ada",), {"injector": injector})
+
+        with patch.object(inspect, "signature", wraps=inspect.signature) as signature:
+            run(greet, ("Grace",), {"injector": injector})
+
+        signature.assert_not_called()
+
+    def test_missing_injector_is_reported(self):
+        with pytest.raises(RuntimeError, match="no injector is available"):
+            run(greet, ("Ada",), {})
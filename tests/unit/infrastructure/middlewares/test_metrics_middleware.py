@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from injector import Injector
+
+from infrastructure import Context, LoggerStrategy, error_handling_middleware, metrics_middleware, metrics_registry, pipeline
+
+
+def say_hello():
+    return "hello"
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+@pipeline(metrics_middleware, error_handling_middleware)
+def crash(injector: Injector):
+    raise RuntimeError("boom")
+
+
+def denied():
+    return {"error": "Authentication required", "status": 401}
+
+
+async def say_hello_async():
+    return "hello"
+
+
+def sample(name, *labels):
+    return metrics_registry.get(name).labels(*labels)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+class TestMetricsMiddleware:
+    def test_records_latency_and_status_per_route(self):
+        assert metrics_middleware(Context(say_hello, (), {}), say_hello) == "hello"
+        metrics_middleware(Context(denied, (), {}), denied)
+
+        assert sample("http_requests_total", "say_hello", 200).value == 1
+        # Error dicts are sent with HTTP 200; the status they report is counted separately
+        assert sample("http_requests_total", "denied", 200).value == 1
+        assert sample("http_application_errors_total", "denied", 401).value == 1
+        assert sample("http_request_duration_seconds", "say_hello").count == 1
+        assert sample("http_requests_in_flight", "say_hello").value == 0
+
+    def test_counts_exceptions_as_errors(self):
+        with pytest.raises(RuntimeError):
+            metrics_middleware(Context(fail, (), {}), fail)
+
+        assert sample("http_request_errors_total", "fail").value == 1
+        assert sample("http_requests_total", "fail", 500).value == 1
+        assert sample("http_requests_in_flight", "fail").value == 0
+
+    def test_counts_exceptions_turned_into_error_results_as_errors(self):
+        injector = Injector([lambda binder: binder.bind(LoggerStrategy, to=MagicMock(spec=LoggerStrategy))])
+
+        assert crash(injector=injector)["status"] == 500
+
+        assert sample("http_request_errors_total", "crash").value == 1
+        assert sample("http_application_errors_total", "crash", 500).value == 1
+
+    def test_records_async_handlers_once_awaited(self):
+        result = metrics_middleware(Context(say_hello_async, (), {}), say_hello_async)
+        assert sample("http_requests_in_flight", "say_hello_async").value == 1
+
+        assert asyncio.run(result) == "hello"
+        assert sample("http_requests_total", "say_hello_async", 200).value == 1
+        assert sample("http_requests_in_flight", "say_hello_async").value == 0
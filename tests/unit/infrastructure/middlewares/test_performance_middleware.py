@@ -0,0 +1,34 @@
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure import Context, performance_middleware
+
+
+def say_hello():
+    return "hello"
+
+
+class TestPerformanceMiddleware:
+    @pytest.mark.parametrize("request_cpu_time", [False, True])
+    def test_logs_one_line_per_call(self, request_cpu_time):
+        logger = Mock()
+        context = Context(say_hello, (), {})
+
+        result = performance_middleware(context, say_hello, logger, Mock(request_cpu_time=request_cpu_time))
+
+        assert result == "hello"
+        (message,), _ = logger.info.call_args
+        assert logger.info.call_count == 1 and message.startswith("[PERFORMANCE] Completed say_hello in ")
+        assert ("CPU" in message) == request_cpu_time
+
+    def test_logs_failures_with_the_elapsed_time(self):
+        logger = Mock()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            performance_middleware(Context(fail, (), {}), fail, logger, Mock(request_cpu_time=False))
+
+        assert "Error in fail after" in logger.error.call_args.args[0]
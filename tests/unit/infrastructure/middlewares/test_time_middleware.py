@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from injector import Injector
+
+from infrastructure import Context, TimeMiddleware, metrics_registry, pipeline, time_middleware
+
+
+def say_hello():
+    return "hello"
+
+
+async def say_hello_async():
+    return "hello"
+
+
+def latency(route):
+    return metrics_registry.get("pipeline_latency_seconds").labels(route)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+class TestTimeMiddleware:
+    def test_records_the_duration_per_route(self):
+        assert time_middleware(Context(say_hello, (), {}), say_hello) == "hello"
+
+        assert latency("say_hello").total_count == 1
+        assert latency("say_hello").snapshot().percentile(99) is not None
+
+    def test_records_async_handlers_once_awaited(self):
+        result = time_middleware(Context(say_hello_async, (), {}), say_hello_async)
+        assert latency("say_hello_async").total_count == 0
+
+        assert asyncio.run(result) == "hello"
+        assert latency("say_hello_async").total_count == 1
+
+    def test_class_middleware_feeds_the_same_histogram(self):
+        @pipeline(TimeMiddleware)
+        def greet():
+            return "hello"
+
+        assert greet(injector=Injector()) == "hello"
+        assert latency(greet.__qualname__).total_count == 1
+        assert 'pipeline_latency_seconds{route="' in metrics_registry.expose()
@@ -0,0 +1,44 @@
+import inspect
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from infrastructure import AsgiRequest, Context, typed_request_middleware
+
+
+class Greeting(BaseModel):
+    name: str
+
+    @classmethod
+    def from_json(cls, data: bytes):
+        return cls.model_validate_json(data)
+
+
+class GreetingController:
+    def say_hello(self, request: Greeting) -> str:
+        return f"Hello {request.name}"
+
+
+def run(func, args):
+    context = Context(func, args, {})
+    return typed_request_middleware(context, lambda: context.func(*context.args))
+
+
+def request(body: bytes) -> AsgiRequest:
+    return AsgiRequest({"method": "POST", "path": "/say_hello", "query_string": b"", "headers": []}, body)
+
+
+class TestTypedRequestMiddleware:
+    def test_converts_the_request_argument_after_self(self):
+        controller = GreetingController()
+
+        assert run(GreetingController.say_hello, (controller, request(b'{"name": "Ada"}'))) == "Hello Ada"
+
+    def test_signature_is_only_inspected_on_the_first_call(self):
+        controller = GreetingController()
+        run(GreetingController.say_hello, (controller, request(b'{"name": "Ada"}')))
+
+        with patch.object(inspect, "signature", wraps=inspect.signature) as signature:
+            assert run(GreetingController.say_hello, (controller, request(b'{"name": "Grace"}'))) == "Hello Grace"
+
+        signature.assert_not_called()
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = Path(__file__).resolve().parents[3] / "src"
+
+# Packages that only the selected web framework, config source or event handler may pull in
+OPTIONAL_PACKAGES = ("azure", "google", "cloudevents", "fastapi", "starlette", "uvicorn", "flask", "werkzeug", "yaml")
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Run `code` in a fresh interpreter under -X importtime and return the cumulative import time (us) per module."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def imported_packages(times: dict[str, int], packages: tuple[str, ...]) -> list[str]:
+    return sorted({module.split(".")[0] for module in times if module.split(".")[0] in packages})
+
+
+class TestLazyImports:
+    def test_importing_infrastructure_skips_optional_packages(self):
+        times = import_times("import infrastructure")
+
+        assert imported_packages(times, OPTIONAL_PACKAGES) == [], f"import infrastructure took {times['infrastructure']}us"
+
+    @pytest.mark.parametrize(("framework", "unused_framework"), [("flask", "fastapi"), ("fastapi", "flask")])
+    def test_only_the_selected_web_framework_is_imported(self, framework, unused_framework):
+        times = import_times(
+            "from infrastructure import Settings, WebFrameworkModule\n"
+            f"settings = Settings(project_env='local', default_name='World', greeting_type='time_based', "
+            f"greeting_language='en', web_framework='{framework}')\n"
+            "WebFrameworkModule().provide_web_app(settings)"
+        )
+
+        assert framework in times
+        assert unused_framework not in times
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from infrastructure import AsgiRequest, AsgiWebApp
+
+
+class Greeting(BaseModel):
+    message: str
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+
+def call(app: AsgiWebApp, method: str, path: str, body: bytes = b"", query_string: bytes = b"", headers=()):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": [(b"host", b"localhost"), *headers],
+    }
+    messages = []
+    chunks = [body[:3], body[3:]]
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, body_message = messages
+    return start["status"], dict(start["headers"]), body_message["body"]
+
+
+class TestAsgiWebApp:
+    @pytest.fixture
+    def app(self):
+        app = AsgiWebApp()
+        yield app
+        app.executor.shutdown()
+
+    def test_sync_handler_gets_the_raw_request(self, app):
+        seen = {}
+
+        def handler(request: AsgiRequest):
+            seen.update(body=request.body, token=request.args.get("token"), auth=request.headers.get("Authorization"))
+            return app.create_response(app.get_json_data(request), 201)
+
+        app.add_route("/echo", ["POST"], handler)
+
+        status, headers, body = call(
+            app, "POST", "/echo", b'{"name": "Ada"}', query_string=b"token=a&token=b", headers=[(b"authorization", b"Bearer x")]
+        )
+
+        assert (status, json.loads(body)) == (201, {"name": "Ada"})
+        assert headers[b"content-type"] == b"application/json"
+        assert seen == {"body": b'{"name": "Ada"}', "token": "a", "auth": "Bearer x"}
+
+    def test_handler_results_are_converted(self, app):
+        async def model_handler(request):
+            return Greeting(message="hi")
+
+        app.add_route("/model", ["GET"], model_handler)
+        app.add_route("/dict", ["GET"], lambda request: ({"error": "nope"}, 400))
+
+        assert call(app, "GET", "/model")[::2] == (200, b'{"message":"hi"}')
+        assert call(app, "GET", "/dict")[::2] == (400, b'{"error":"nope"}')
+
+    def test_unknown_path_and_method(self, app):
+        app.add_route("/only-post", ["POST"], lambda request: {})
+
+        assert call(app, "GET", "/missing")[0] == 404
+        status, headers, _ = call(app, "GET", "/only-post")
+        assert (status, headers[b"allow"]) == (405, b"POST")
+        assert app.get_routes() == [("/only-post", ["POST"])]
+
+    def test_inline_route_runs_on_the_event_loop(self, app):
+        threads = []
+
+        def handler(request):
+            threads.append(threading.current_thread())
+            return app.create_raw_response(b'{"status":"healthy"}')
+
+        app.add_inline_route("/health", ["GET"], handler)
+
+        assert call(app, "GET", "/health")[::2] == (200, b'{"status":"healthy"}')
+        assert threads == [threading.main_thread()]
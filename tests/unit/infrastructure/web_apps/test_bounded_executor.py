@@ -0,0 +1,60 @@
+import queue
+import threading
+
+import pytest
+
+from infrastructure import BoundedExecutor, MetricsRegistry
+
+
+class TestBoundedExecutor:
+    @pytest.fixture
+    def executor(self):
+        executor = BoundedExecutor(max_workers=1, max_queue=1)
+        yield executor
+        executor.shutdown(wait=True)
+
+    def test_runs_submitted_calls(self, executor):
+        assert executor.submit(pow, 2, 10).result(timeout=5) == 1024
+        assert executor.wait_time.count == 1
+
+    def test_rejects_when_threads_and_queue_are_full(self, executor):
+        release = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(timeout=5)
+
+        running = executor.submit(block)
+        started.wait(timeout=5)
+        queued = executor.submit(block)
+
+        assert executor.active_threads == 1
+        assert executor.queue_depth == 1
+        with pytest.raises(queue.Full):
+            executor.submit(block)
+        assert executor.rejected == 1
+
+        release.set()
+        running.result(timeout=5)
+        queued.result(timeout=5)
+
+        assert executor.to_dict() | {"wait_time": None} == {
+            "max_workers": 1,
+            "max_queue": 1,
+            "queue_depth": 0,
+            "active_threads": 0,
+            "rejected": 1,
+            "wait_time": None,
+        }
+        assert executor.submit(pow, 2, 2).result(timeout=5) == 4
+
+    def test_registered_metrics_include_the_wait_times(self, executor):
+        registry = MetricsRegistry()
+        executor.register_metrics(registry)
+
+        executor.submit(pow, 2, 10).result(timeout=5)
+
+        exposition = registry.expose()
+        assert "executor_queue_depth 0\n" in exposition
+        assert "executor_wait_seconds_count 1\n" in exposition
@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from infrastructure import AsgiWebApp, CompressionSettings
+from infrastructure.web_apps.compression import AsgiCompressionMiddleware, WsgiCompressionMiddleware, negotiate_encoding
+
+SETTINGS = CompressionSettings(enabled=True, minimum_size=100, streaming_threshold=1000)
+BODY = b'{"user": "demo_user", "permissions": ["org:read", "user:read"]}' * 10
+
+
+def wsgi_app(chunks, content_type="application/json", headers=()):
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", content_type), *headers])
+        return iter(chunks)
+
+    return app
+
+
+def call_wsgi(app, accept_encoding="gzip"):
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started.update(status=status, headers=dict(headers))
+
+    body = b"".join(app({"REQUEST_METHOD": "GET", "HTTP_ACCEPT_ENCODING": accept_encoding}, start_response))
+    return started["headers"], body
+
+
+def call_asgi(app, accept_encoding=b"gzip"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", accept_encoding)],
+    }
+    asyncio.run(app(scope, receive, send))
+    start, *bodies = messages
+    return dict((name.decode(), value.decode()) for name, value in start["headers"]), bodies
+
+
+class TestNegotiateEncoding:
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("gzip, deflate, br", "gzip"),
+            ("deflate, gzip;q=0.5", "deflate"),
+            ("gzip;q=0, *", "deflate"),
+            ("br", None),
+            ("", None),
+        ],
+    )
+    def test_picks_the_encoding_with_the_highest_quality(self, accept_encoding, expected):
+        assert negotiate_encoding(accept_encoding) == expected
+
+
+class TestWsgiCompressionMiddleware:
+    def test_compresses_a_complete_body_in_one_piece(self):
+        headers, body = call_wsgi(
+            WsgiCompressionMiddleware(wsgi_app([BODY[:300], BODY[300:]], headers=[("ETag", '"v1"')]), SETTINGS)
+        )
+
+        assert gzip.decompress(body) == BODY
+        assert (headers["Content-Encoding"], headers["Vary"], headers["Content-Length"]) == (
+            "gzip",
+            "Accept-Encoding",
+            str(len(body)),
+        )
+        assert headers["ETag"] == 'W/"v1"'
+
+    def test_streams_bodies_above_the_threshold(self):
+        chunks = [BODY] * 5
+        headers, body = call_wsgi(WsgiCompressionMiddleware(wsgi_app(chunks), SETTINGS), accept_encoding="deflate")
+
+        assert zlib.decompress(body) == b"".join(chunks)
+        assert headers["Content-Encoding"] == "deflate" and "Content-Length" not in headers
+
+    @pytest.mark.parametrize("chunks, content_type", [([b"{}"], "application/json"), ([BODY], "image/png")])
+    def test_leaves_small_and_already_compressed_bodies_alone(self, chunks, content_type):
+        headers, body = call_wsgi(WsgiCompressionMiddleware(wsgi_app(chunks, content_type), SETTINGS))
+
+        assert body == b"".join(chunks) and "Content-Encoding" not in headers
+
+
+class TestAsgiCompression:
+    def test_middleware_compresses_streamed_messages_one_by_one(self):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+            await send({"type": "http.response.body", "body": BODY, "more_body": True})
+            await send({"type": "http.response.body", "body": BODY, "more_body": False})
+
+        headers, bodies = call_asgi(AsgiCompressionMiddleware(app, SETTINGS))
+
+        assert headers["content-encoding"] == "gzip" and "content-length" not in headers
+        assert len(bodies) == 2 and gzip.decompress(b"".join(message["body"] for message in bodies)) == BODY * 2
+
+    def test_asgi_web_app_compresses_large_responses_only(self):
+        app = AsgiWebApp(compression=SETTINGS)
+        app.add_route("/", ["GET"], lambda request: app.create_response({"items": [BODY.decode()]}))
+
+        headers, bodies = call_asgi(app)
+        assert headers["content-encoding"] == "gzip"
+        assert gzip.decompress(bodies[0]["body"]) == app.json_codec.encode({"items": [BODY.decode()]})
+
+        headers, _ = call_asgi(app, accept_encoding=b"identity")
+        assert "content-encoding" not in headers
+        app.executor.shutdown()
@@ -0,0 +1,135 @@
+import pytest
+
+from infrastructure import AsgiRequest, AsgiWebApp, CompressionSettings, FlaskWebApp, etag_matches, make_etag
+
+
+def asgi_request(if_none_match: str = "") -> AsgiRequest:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return AsgiRequest({"method": "GET", "path": "/auth/me", "headers": headers}, b"")
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize("if_none_match", ['"a", "b"', 'W/"b"', "*"])
+    def test_uses_weak_comparison(self, if_none_match):
+        assert etag_matches(if_none_match, '"b"')
+
+    def test_other_tags_do_not_match(self):
+        assert not etag_matches('"a"', '"b"')
+
+
+class TestConditionalResponse:
+    @pytest.fixture
+    def app(self):
+        app = AsgiWebApp()
+        yield app
+        app.executor.shutdown()
+
+    def test_matching_version_answers_304_without_building_the_body(self, app):
+        def build():
+            raise AssertionError("the body must not be built for a 304")
+
+        response = app.create_conditional_response(asgi_request(make_etag("session-1")), build, version="session-1")
+
+        assert (response.status_code, response.body, response.headers) == (304, b"", [(b"etag", make_etag("session-1").encode())])
+
+    def test_stale_version_sends_the_body_with_its_etag(self, app):
+        response = app.create_conditional_response(asgi_request(make_etag("session-1")), {"user": "demo"}, version="session-2")
+
+        assert (response.status_code, response.body) == (200, b'{"user":"demo"}')
+        assert response.headers == [(b"etag", make_etag("session-2").encode())]
+
+    def test_without_a_version_the_body_hash_is_the_etag(self):
+        web_app = FlaskWebApp()
+        web_app.add_route("/me", ["GET"], lambda request: web_app.create_conditional_response(request, {"user": "demo"}))
+        client = web_app.app.test_client()
+
+        first = client.get("/me")
+        second = client.get("/me", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.headers["ETag"] == make_etag(b'{"user":"demo"}')
+        assert (second.status_code, second.data, "Content-Type" in second.headers) == (304, b"", False)
+
+    def test_not_modified_carries_the_validators_of_the_compressed_response(self):
+        web_app = FlaskWebApp(compression=CompressionSettings(enabled=True, minimum_size=0))
+        web_app.add_route(
+            "/me", ["GET"], lambda request: web_app.create_conditional_response(request, {"user": "demo"}, version="s1")
+        )
+        client = web_app.app.test_client()
+
+        first = client.get("/me", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/me", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+        identity = client.get("/me", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert (first.headers["Content-Encoding"], first.headers["ETag"], first.headers["Vary"]) == (
+            "gzip",
+            f"W/{make_etag('s1')}",
+            "Accept-Encoding",
+        )
+        assert (second.status_code, second.headers["ETag"], second.headers["Vary"]) == (
+            304,
+            first.headers["ETag"],
+            "Accept-Encoding",
+        )
+        assert (identity.status_code, identity.headers["ETag"], "Vary" in identity.headers) == (304, make_etag("s1"), False)
+
+    def test_not_modified_keeps_the_strong_etag_of_a_body_too_small_to_compress(self):
+        web_app = FlaskWebApp(compression=CompressionSettings(enabled=True, minimum_size=500))
+        builds = []
+        web_app.add_route(
+            "/me",
+            ["GET"],
+            lambda request: web_app.create_conditional_response(
+                request, lambda: builds.append(1) or {"user": "demo"}, version="s1"
+            ),
+        )
+        client = web_app.app.test_client()
+
+        first = client.get("/me", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/me", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+
+        assert ("Content-Encoding" in first.headers, first.headers["ETag"], "Vary" in first.headers) == (
+            False,
+            make_etag("s1"),
+            False,
+        )
+        assert (second.status_code, second.headers["ETag"], "Vary" in second.headers) == (304, make_etag("s1"), False)
+        assert len(builds) == 1
+
+    def test_unknown_body_size_is_measured_before_answering_304(self):
+        web_app = FlaskWebApp(compression=CompressionSettings(enabled=True, minimum_size=10))
+        web_app.add_route(
+            "/me", ["GET"], lambda request: web_app.create_conditional_response(request, {"user": "a" * 20}, version="s1")
+        )
+
+        response = web_app.app.test_client().get("/me", headers={"Accept-Encoding": "gzip", "If-None-Match": make_etag("s1")})
+
+        assert (response.status_code, response.headers["ETag"], response.headers["Vary"]) == (
+            304,
+            f"W/{make_etag('s1')}",
+            "Accept-Encoding",
+        )
+
+    def test_private_responses_are_kept_out_of_shared_caches(self):
+        web_app = FlaskWebApp(compression=CompressionSettings(enabled=True, minimum_size=0))
+        web_app.add_route(
+            "/me",
+            ["GET"],
+            lambda request: web_app.create_conditional_response(request, {"user": "demo"}, version="s1", private=True),
+        )
+        client = web_app.app.test_client()
+
+        first = client.get("/me", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/me", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+        identity = client.get("/me", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert (first.headers["Cache-Control"], first.headers["Vary"]) == ("private", "Authorization, Accept-Encoding")
+        assert (second.status_code, second.headers["Cache-Control"], second.headers["Vary"]) == (
+            304,
+            "private",
+            "Authorization, Accept-Encoding",
+        )
+        assert (identity.status_code, identity.headers["Cache-Control"], identity.headers["Vary"]) == (
+            304,
+            "private",
+            "Authorization",
+        )
@@ -0,0 +1,92 @@
+import dataclasses
+import datetime
+import decimal
+import sys
+import uuid
+
+import pytest
+from pydantic import BaseModel
+
+from infrastructure import AsgiRequest, Context, JsonCodec, create_json_codec, typed_request_middleware
+
+
+class Greeting(BaseModel):
+    first_name: str
+    last_name: str
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        cls.parsed_with = "from_dict"
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_json(cls, data: bytes):
+        cls.parsed_with = "from_json"
+        return cls.model_validate_json(data)
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+def say_hello(request: Greeting) -> Greeting:
+    return request
+
+
+def parse(body: bytes, query_string: bytes = b"") -> Greeting:
+    scope = {"method": "POST", "path": "/say_hello", "query_string": query_string, "headers": []}
+    context = Context(say_hello, (AsgiRequest(scope, body),), {})
+    return typed_request_middleware(context, lambda: context.func(*context.args))
+
+
+class TestJsonCodec:
+    def test_encodes_models_and_dicts_to_compact_bytes(self):
+        codec = JsonCodec()
+
+        assert codec.encode(Greeting(first_name="Ada", last_name="Lovelace")) == b'{"first_name":"Ada","last_name":"Lovelace"}'
+        assert codec.encode({"on": datetime.date(2024, 1, 2), "name": "Zoë"}) == '{"on":"2024-01-02","name":"Zoë"}'.encode()
+        assert codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    @pytest.mark.parametrize("codec", ["json", "orjson"])
+    def test_encodes_common_types_and_rejects_the_rest(self, codec):
+        if codec == "orjson":
+            pytest.importorskip("orjson")
+        codec = create_json_codec(codec)
+        value = {
+            "at": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "price": decimal.Decimal("1.50"),
+            "id": uuid.UUID(int=1),
+            "point": Point(1, 2),
+        }
+
+        assert codec.loads(codec.encode(value)) == {
+            "at": "2024-01-02T03:04:05",
+            "price": "1.50",
+            "id": "00000000-0000-0000-0000-000000000001",
+            "point": {"x": 1, "y": 2},
+        }
+        with pytest.raises(TypeError):
+            codec.encode({"unknown": object()})
+
+    def test_auto_falls_back_to_the_standard_library(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        assert type(create_json_codec("auto")) is JsonCodec
+        with pytest.raises(ImportError):
+            create_json_codec("orjson")
+        with pytest.raises(ValueError):
+            create_json_codec("yaml")
+
+
+class TestTypedRequestJsonParsing:
+    def test_body_is_parsed_straight_into_the_model(self):
+        greeting = parse(b'{"first_name": "Ada", "last_name": "Lovelace"}')
+
+        assert (greeting.first_name, Greeting.parsed_with) == ("Ada", "from_json")
+
+    def test_query_parameters_are_merged_through_the_dict_path(self):
+        greeting = parse(b'{"first_name": "Ada"}', query_string=b"last_name=Byron")
+
+        assert (greeting.last_name, Greeting.parsed_with) == ("Byron", "from_dict")
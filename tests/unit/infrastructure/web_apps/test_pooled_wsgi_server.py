@@ -0,0 +1,47 @@
+import socket
+import threading
+import urllib.request
+
+import pytest
+
+from infrastructure.web_apps.pooled_wsgi_server import PooledWSGIServer
+
+
+def hello_app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain"), ("Content-Length", "5")])
+    return [threading.current_thread().name.encode()[:5].ljust(5)]
+
+
+class TestPooledWSGIServer:
+    @pytest.fixture
+    def listen_socket(self):
+        listen_socket = socket.create_server(("127.0.0.1", 0))
+        yield listen_socket
+        listen_socket.close()
+
+    def get(self, listen_socket: socket.socket) -> tuple[int, bytes]:
+        port = listen_socket.getsockname()[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as response:
+            return response.status, response.read()
+
+    def test_requests_run_on_the_pool(self, listen_socket):
+        server = PooledWSGIServer(hello_app, listen_socket, threads=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            assert self.get(listen_socket) == (200, b"wsgi-")
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+
+    def test_stops_serving_after_max_requests(self, listen_socket):
+        server = PooledWSGIServer(hello_app, listen_socket, threads=2, max_requests=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        assert self.get(listen_socket)[0] == 200
+        assert self.get(listen_socket)[0] == 200
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+import pytest
+from injector import Injector, Module, provider, singleton
+
+from infrastructure import FlaskWebApp, LoggerStrategy, metrics_middleware, metrics_registry, pipeline
+from interfaces import ApplicationWarmup
+
+
+class Connection:
+    instances = 0
+
+    def __init__(self):
+        Connection.instances += 1
+
+
+class ConnectionModule(Module):
+    @singleton
+    @provider
+    def provide_connection(self) -> Connection:
+        return Connection()
+
+
+class TestApplicationWarmup:
+    @pytest.fixture
+    def web_app(self) -> FlaskWebApp:
+        web_app = FlaskWebApp()
+        self.requests: list[str] = []
+        web_app.add_route("/health", ["GET"], lambda request: self.requests.append(request.path) or ("ok", 200))
+        web_app.add_route("/me", ["GET"], lambda request: self.requests.append(request.path) or ("private", 200))
+        web_app.add_route("/items", ["POST"], lambda request: self.requests.append(request.path) or ("created", 201))
+        return web_app
+
+    @pytest.fixture
+    def warmup(self, web_app) -> ApplicationWarmup:
+        Connection.instances = 0
+        settings = MagicMock(warmup_paths=["/health", "/items", "/missing"])
+        warmup = ApplicationWarmup(Injector([ConnectionModule()]), web_app, settings, MagicMock(spec=LoggerStrategy))
+        warmup.singletons = [Connection]
+        return warmup
+
+    def test_singletons_are_created_eagerly(self, warmup):
+        warmup.instantiate_singletons()
+
+        assert Connection.instances == 1
+        assert warmup.injector.get(Connection) is warmup.injector.get(Connection)
+        assert Connection.instances == 1
+
+    def test_synthetic_requests_only_hit_allowed_get_routes(self, warmup):
+        assert warmup.send_synthetic_requests() == "/health=200"
+        assert self.requests == ["/health"]
+
+    def test_synthetic_requests_are_not_counted(self, warmup):
+        @pipeline(metrics_middleware)
+        def counted(injector: Injector):
+            return "ok", 200
+
+        warmup.web_app.add_route("/counted", ["GET"], lambda request: counted(injector=warmup.injector))
+        warmup.settings.warmup_paths = ["/counted"]
+        earlier = metrics_registry.counter("warmup_test_earlier_total", "Recorded before the warm-up")
+        earlier.inc()
+
+        assert warmup.send_synthetic_requests() == "/counted=200"
+
+        exposition = metrics_registry.expose()
+        assert counted.__qualname__ not in exposition
+        assert "warmup_test_earlier_total 1" in exposition
+
+    def test_run_reports_every_step(self, warmup):
+        timings = warmup.run()
+
+        assert list(timings) == ["singletons", "pipelines", "pydantic_models", "routes"]
+        assert all(seconds >= 0 for seconds in timings.values())
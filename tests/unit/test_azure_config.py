@@ -6,8 +6,8 @@ from infrastructure import AzureKeyVaultConfigProvider, AzureStorageConfigProvid
 class TestAzureKeyVaultConfigProvider:
     """Test Azure Key Vault configuration provider"""
 
-    @patch("infrastructure.config_loaders.config_providers.azure_keyvault_config_provider.SecretClient")
-    @patch("infrastructure.config_loaders.config_providers.azure_keyvault_config_provider.DefaultAzureCredential")
+    @patch("azure.keyvault.secrets.SecretClient")
+    @patch("azure.identity.DefaultAzureCredential")
     def test_load_config_success(self, mock_credential, mock_client_class):
         """Test successful configuration loading from Azure Key Vault"""
         # Mock the secret client
@@ -24,8 +24,8 @@ class TestAzureKeyVaultConfigProvider:
         assert result == {"key1": "value1", "key2": "value2"}
         mock_client.get_secret.assert_called_once_with("test-secret")
 
-    @patch("infrastructure.config_loaders.config_providers.azure_keyvault_config_provider.SecretClient")
-    @patch("infrastructure.config_loaders.config_providers.azure_keyvault_config_provider.DefaultAzureCredential")
+    @patch("azure.keyvault.secrets.SecretClient")
+    @patch("azure.identity.DefaultAzureCredential")
     def test_get_secret_success(self, mock_credential, mock_client_class):
         """Test successful secret retrieval from Azure Key Vault"""
         # Mock the secret client
@@ -46,8 +46,8 @@ class TestAzureKeyVaultConfigProvider:
 class TestAzureStorageConfigProvider:
     """Test Azure Storage configuration provider"""
 
-    @patch("infrastructure.config_loaders.config_providers.azure_storage_config_provider.BlobServiceClient")
-    @patch("infrastructure.config_loaders.config_providers.azure_storage_config_provider.DefaultAzureCredential")
+    @patch("azure.storage.blob.BlobServiceClient")
+    @patch("azure.identity.DefaultAzureCredential")
     def test_load_config_json_success(self, mock_credential, mock_client_class):
         """Test successful JSON configuration loading from Azure Storage"""
         # Mock the blob client
@@ -71,8 +71,8 @@ class TestAzureStorageConfigProvider:
         assert result == {"key1": "value1", "key2": "value2"}
         mock_container_client.get_blob_client.assert_called_once_with("config.json")
 
-    @patch("infrastructure.config_loaders.config_providers.azure_storage_config_provider.BlobServiceClient")
-    @patch("infrastructure.config_loaders.config_providers.azure_storage_config_provider.DefaultAzureCredential")
+    @patch("azure.storage.blob.BlobServiceClient")
+    @patch("azure.identity.DefaultAzureCredential")
     def test_get_blob_content_success(self, mock_credential, mock_client_class):
         """Test successful blob content retrieval from Azure Storage"""
         # Mock the blob client